@@ -0,0 +1,65 @@
+"""CPU-bound Asset Pre-processing for Unity MCP Tools
+
+Functions in this module run inside worker processes (see
+UnityManager.run_cpu_bound), so they must stay importable without the MCP
+framework and only take/return picklable values.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+TEXTURE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".tga", ".psd", ".tif", ".tiff", ".bmp")
+MAX_TEXTURE_SIZE = 2048
+
+
+def _is_power_of_two(value: int) -> bool:
+    return value > 0 and value & (value - 1) == 0
+
+
+def scan_texture_candidates(root: str, max_size: int = MAX_TEXTURE_SIZE) -> List[Dict[str, Any]]:
+    """Find textures under root that are oversized or not power-of-two
+
+    Only image headers are decoded. Returns an empty list when Pillow is not
+    installed so the Unity-side optimization still runs unassisted.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return []
+
+    root_path = Path(root)
+    if root_path.is_file():
+        files = [root_path]
+    else:
+        files = [
+            Path(dirpath) / name
+            for dirpath, _, filenames in os.walk(root_path)
+            for name in filenames
+            if name.lower().endswith(TEXTURE_EXTENSIONS)
+        ]
+
+    candidates = []
+    for file_path in files:
+        try:
+            with Image.open(file_path) as image:
+                width, height = image.size
+        except Exception:
+            continue
+
+        issues = []
+        if max(width, height) > max_size:
+            issues.append("oversized")
+        if not (_is_power_of_two(width) and _is_power_of_two(height)):
+            issues.append("non_power_of_two")
+
+        if issues:
+            candidates.append({
+                "path": str(file_path),
+                "width": width,
+                "height": height,
+                "issues": issues
+            })
+
+    return candidates
@@ -0,0 +1,59 @@
+"""On-disk Cache of Baked Animation Clips
+
+Maps the parameters of an animation bake to the clip it produced, so an
+identical bake can reuse that clip instead of running Unity again. The
+cache lives in the project's Library folder, which Unity treats as
+disposable. All functions block and are meant for asyncio.to_thread.
+"""
+
+import hashlib
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+CACHE_RELATIVE_PATH = Path("Library") / "UnityMCP" / "bake_cache.sqlite"
+
+
+def bake_key(parameters: Dict[str, Any]) -> str:
+    """Stable key for a set of bake parameters"""
+    encoded = orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE IF NOT EXISTS bakes (key TEXT PRIMARY KEY, clip_path TEXT NOT NULL)")
+    return connection
+
+
+def lookup_baked_clip(project_path: str, key: str) -> Optional[str]:
+    """Return the clip stored for key, or None if unknown or since deleted"""
+    db_path = Path(project_path) / CACHE_RELATIVE_PATH
+    if not db_path.exists():
+        return None
+
+    with closing(_connect(db_path)) as connection:
+        row = connection.execute("SELECT clip_path FROM bakes WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+
+    clip_path = row[0]
+    if not (Path(project_path) / clip_path).exists():
+        return None
+    return clip_path
+
+
+def store_baked_clip(project_path: str, key: str, clip_path: str) -> None:
+    """Record the clip produced for key"""
+    db_path = Path(project_path) / CACHE_RELATIVE_PATH
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO bakes (key, clip_path) VALUES (?, ?)",
+            (key, clip_path)
+        )
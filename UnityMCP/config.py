@@ -1,13 +1,88 @@
 """Unity MCP Server Configuration"""
 
 import os
-from pathlib import Path
-from typing import List, Optional
+import platform
+import time
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
 
-class MCPConfig(BaseSettings):
+# Project path checks are trusted for this long so a deleted project is still
+# noticed, and at most this many paths are remembered (least recently used
+# are dropped first).
+PROJECT_PATH_CACHE_TTL = 30.0
+PROJECT_PATH_CACHE_SIZE = 64
+
+_project_path_checks: Dict[str, Tuple[float, bool]] = {}
+
+
+@lru_cache(maxsize=None)
+def _platform_default_editor_path() -> str:
+    """Default Unity Editor location for this platform"""
+    system = platform.system()
+    
+    if system == "Darwin":  # macOS
+        return "/Applications/Unity/Hub/Editor/2023.3.0f1/Unity.app/Contents/MacOS/Unity"
+    elif system == "Windows":
+        return "C:\\Program Files\\Unity\\Hub\\Editor\\2023.3.0f1\\Editor\\Unity.exe"
+    elif system == "Linux":
+        return "/opt/Unity/Editor/Unity"
+    else:
+        raise ValueError(f"Unsupported platform: {system}")
+
+
+def _project_path_key(path: str) -> str:
+    # Spellings of the same directory share one entry
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _validate_path(path: str) -> bool:
+    """Check for a Unity project directory, reusing recent results"""
+    now = time.monotonic()
+    key = _project_path_key(path)
+    cached = _project_path_checks.pop(key, None)
+    if cached is not None and now - cached[0] < PROJECT_PATH_CACHE_TTL:
+        _project_path_checks[key] = cached
+        return cached[1]
+    
+    # One directory listing instead of a stat per marker
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+        valid = "Assets" in names and "ProjectSettings" in names
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        valid = False
+    
+    if len(_project_path_checks) >= PROJECT_PATH_CACHE_SIZE:
+        del _project_path_checks[next(iter(_project_path_checks))]
+    _project_path_checks[key] = (now, valid)
+    return valid
+
+
+class _ConfigHelpers:
+    """Methods shared by MCPConfig and its runtime snapshot"""
+    
+    __slots__ = ()
+    
+    def get_unity_editor_path(self) -> str:
+        """Get Unity Editor path with platform-specific defaults"""
+        if self.unity_editor_path:
+            return self.unity_editor_path
+        return _platform_default_editor_path()
+    
+    def validate_unity_project_path(self, path: str) -> bool:
+        """Validate if path is a valid Unity project"""
+        return _validate_path(path)
+    
+    def forget_unity_project_path(self, path: str):
+        """Drop the cached validation for path, e.g. after changing the project"""
+        _project_path_checks.pop(_project_path_key(path), None)
+
+
+class MCPConfig(_ConfigHelpers, BaseSettings):
     """Configuration for Unity MCP Server"""
     
     # Server Information
@@ -23,9 +98,21 @@ class MCPConfig(BaseSettings):
         default=None,
         description="Default Unity project path"
     )
-    unity_log_file: str = Field(
-        default="/tmp/unity_mcp.log",
-        description="Unity log file path"
+    max_unity_sessions: int = Field(
+        default=4,
+        description="Maximum number of Unity sessions kept open at once"
+    )
+    unity_startup_timeout: int = Field(
+        default=300,
+        description="Seconds to wait for a Unity session to load the project"
+    )
+    unity_wire_format: str = Field(
+        default="ndjson",
+        description="Unity session message framing (ndjson|framed)"
+    )
+    validation_cache: bool = Field(
+        default=True,
+        description="Skip startup path validation when the editor and project are unchanged since it last passed"
     )
     
     # MCP Transport Settings
@@ -45,13 +132,26 @@ class MCPConfig(BaseSettings):
         description="Maximum operation timeout in seconds"
     )
     
+    # Command Batching
+    max_batch_size: int = Field(
+        default=25,
+        description="Maximum number of commands coalesced into one Unity batch"
+    )
+    batch_window_ms: int = Field(
+        default=10,
+        description="How long commands are collected before a batch is sent, in milliseconds"
+    )
+    unity_workers: int = Field(
+        default=4,
+        description="Number of batches dispatched to Unity concurrently per project"
+    )
+    
     # Tool Configuration
     enabled_tools: List[str] = Field(
         default_factory=lambda: [
             "project.scan",
             "build.run",
-            "test.playmode",
-            "test.editmode",
+            "test.run",
             "scene.validate",
             "asset.audit",
             "codegen.apply",
@@ -60,6 +160,10 @@ class MCPConfig(BaseSettings):
         ],
         description="Enabled MCP tools"
     )
+    max_inline_result_bytes: int = Field(
+        default=262144,
+        description="Larger project scan, asset audit and profiling results are written to a file instead of returned inline"
+    )
     
     # Resource Configuration
     enabled_resources: List[str] = Field(
@@ -88,39 +192,25 @@ class MCPConfig(BaseSettings):
         default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log format string"
     )
+    quiet: bool = Field(
+        default=False,
+        description="Suppress the startup banner unless stderr is a terminal"
+    )
     
     class Config:
         env_file = ".env"
         env_prefix = "UNITY_MCP_"
-    
-    def get_unity_editor_path(self) -> str:
-        """Get Unity Editor path with platform-specific defaults"""
-        if self.unity_editor_path:
-            return self.unity_editor_path
-            
-        # Platform-specific default paths
-        import platform
-        system = platform.system()
-        
-        if system == "Darwin":  # macOS
-            return "/Applications/Unity/Hub/Editor/2023.3.0f1/Unity.app/Contents/MacOS/Unity"
-        elif system == "Windows":
-            return "C:\\Program Files\\Unity\\Hub\\Editor\\2023.3.0f1\\Editor\\Unity.exe"
-        elif system == "Linux":
-            return "/opt/Unity/Editor/Unity"
-        else:
-            raise ValueError(f"Unsupported platform: {system}")
-    
-    def validate_unity_project_path(self, path: str) -> bool:
-        """Validate if path is a valid Unity project"""
-        project_path = Path(path)
-        return (
-            project_path.exists() and
-            project_path.is_dir() and
-            (project_path / "Assets").exists() and
-            (project_path / "ProjectSettings").exists()
-        )
 
 
+# Settings are parsed once; the rest of the server reads a plain slotted
+# snapshot so attribute access skips pydantic. It stays mutable because the
+# CLI applies its overrides after import.
+RuntimeConfig = make_dataclass(
+    "RuntimeConfig",
+    [(name, field.annotation) for name, field in MCPConfig.model_fields.items()],
+    bases=(_ConfigHelpers,),
+    slots=True,
+)
+
 # Global configuration instance
-config = MCPConfig()
\ No newline at end of file
+config = RuntimeConfig(**MCPConfig().model_dump())
\ No newline at end of file
@@ -10,102 +10,236 @@ Usage:
 The server will run in stdio mode for local MCP client communication.
 """
 
-import asyncio
+import atexit
+import hashlib
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from config import config
-from server import MCPServer
+
+
+logger = logging.getLogger(__name__)
+
+
+# Log calls only enqueue records; this listener's thread writes them out.
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Records are written to stderr in batches: when LOG_BUFFER_CAPACITY records
+# are waiting, when one is an error, when a new record arrives and the oldest
+# has waited LOG_FLUSH_INTERVAL seconds, or when no record has arrived for
+# LOG_FLUSH_INTERVAL seconds. Stopping the listener at exit flushes the rest.
+LOG_BUFFER_CAPACITY = 256
+LOG_FLUSH_INTERVAL = 1.0
+
+
+class BufferedLogHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes records older than LOG_FLUSH_INTERVAL"""
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (
+            super().shouldFlush(record) or
+            record.created - self.buffer[0].created >= LOG_FLUSH_INTERVAL
+        )
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue stays empty
+    for LOG_FLUSH_INTERVAL seconds, so buffered records never wait on the
+    next one to arrive"""
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def _stop_log_listener(listener: logging.handlers.QueueListener):
+    """Write out every queued and buffered record, then stop the listener"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@lru_cache(maxsize=None)
+def _numeric_log_level(name: str) -> int:
+    """Resolve a level name such as "debug", falling back to INFO"""
+    level = logging.getLevelName(name.upper())
+    # An unknown name comes back as the string "Level <name>"
+    return level if isinstance(level, int) else logging.INFO
 
 
 def setup_logging():
     """Configure logging for the MCP server"""
+    # MCP servers must log to stderr
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(logging.Formatter(config.log_format))
+    buffered_handler = BufferedLogHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=stderr_handler
+    )
+    
+    global _log_listener
+    previous_listener = _log_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = FlushingQueueListener(log_queue, buffered_handler)
+    _log_listener.start()
+    # Only the message is rendered here; stderr_handler applies log_format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    
     # Configure root logger
     logging.basicConfig(
-        level=getattr(logging, config.log_level.upper()),
-        format=config.log_format,
-        stream=sys.stderr,  # MCP servers must log to stderr
+        level=_numeric_log_level(config.log_level),
+        handlers=[queue_handler],
         force=True
     )
     
+    if previous_listener is not None:
+        _stop_log_listener(previous_listener)
+    else:
+        atexit.register(lambda: _stop_log_listener(_log_listener))
+    
     # Set specific logger levels
     logging.getLogger("fastmcp").setLevel(logging.INFO)
     logging.getLogger("unity_mcp").setLevel(logging.DEBUG)
     
-    logger = logging.getLogger(__name__)
-    logger.info(f"Unity MCP Server starting with log level: {config.log_level}")
-    logger.info(f"Unity Editor path: {config.unity_editor_path}")
-    logger.info(f"Unity project path: {config.unity_project_path}")
+    logger.info("Unity MCP Server starting with log level: %s", config.log_level)
+    logger.info("Unity Editor path: %s", config.unity_editor_path)
+    logger.info("Unity project path: %s", config.unity_project_path)
     
     return logger
 
 
+@lru_cache(maxsize=32)
+def _path_exists(path: str) -> bool:
+    """Whether path exists, checked once per process"""
+    return os.path.exists(path)
+
+
+def _validation_marker() -> Path:
+    """Cache file recording that the configured editor and project paths
+    passed validation; its mtime is when they last did"""
+    paths = f"{config.unity_editor_path}|{config.unity_project_path}"
+    key = hashlib.sha256(paths.encode()).hexdigest()[:16]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "unity-mcp" / f"validated_{key}"
+
+
+def _validation_is_current(marker: Path) -> bool:
+    """Whether neither configured path has changed since marker was written"""
+    try:
+        validated_at = marker.stat().st_mtime
+        return all(
+            os.stat(path).st_mtime <= validated_at
+            for path in (config.unity_editor_path, config.unity_project_path)
+            if path
+        )
+    except OSError:
+        return False
+
+
 def validate_environment():
     """Validate the environment and configuration"""
-    logger = logging.getLogger(__name__)
+    marker = None
+    if config.validation_cache and (config.unity_editor_path or config.unity_project_path):
+        marker = _validation_marker()
     
-    # Check Unity Editor path
-    if config.unity_editor_path and not Path(config.unity_editor_path).exists():
-        logger.warning(f"Unity Editor not found at: {config.unity_editor_path}")
-        logger.warning("Some Unity operations may fail. Please check your Unity installation.")
-    
-    # Check Unity project path if specified
-    if config.unity_project_path:
-        if not config.validate_unity_project_path(config.unity_project_path):
-            logger.warning(f"Invalid Unity project path: {config.unity_project_path}")
-            logger.warning("Please ensure the path points to a valid Unity project.")
-        else:
-            logger.info(f"Unity project validated: {config.unity_project_path}")
+    if marker is not None and _validation_is_current(marker):
+        logger.info("Unity paths unchanged since they were last validated")
+    else:
+        paths_valid = True
+        
+        # Check Unity Editor path
+        if config.unity_editor_path and not _path_exists(config.unity_editor_path):
+            paths_valid = False
+            logger.warning("Unity Editor not found at: %s", config.unity_editor_path)
+            logger.warning("Some Unity operations may fail. Please check your Unity installation.")
+        
+        # Check Unity project path if specified
+        if config.unity_project_path:
+            if not config.validate_unity_project_path(config.unity_project_path):
+                paths_valid = False
+                logger.warning("Invalid Unity project path: %s", config.unity_project_path)
+                logger.warning("Please ensure the path points to a valid Unity project.")
+            else:
+                logger.info("Unity project validated: %s", config.unity_project_path)
+        
+        if marker is not None and paths_valid:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+            except OSError as e:
+                logger.debug("Could not record validation in %s: %s", marker, e)
     
     # Check security settings
     if config.allowed_paths:
-        logger.info(f"Security: Allowed paths configured: {len(config.allowed_paths)} paths")
+        logger.info("Security: Allowed paths configured: %s paths", len(config.allowed_paths))
     else:
         logger.warning("Security: No allowed paths configured - all paths will be accessible")
     
     if config.blocked_extensions:
-        logger.info(f"Security: Blocked extensions: {config.blocked_extensions}")
+        logger.info("Security: Blocked extensions: %s", config.blocked_extensions)
     
-    logger.info(f"Security: Max operation time: {config.max_operation_time}s")
+    logger.info("Security: Max operation time: %ss", config.max_operation_time)
 
 
 def print_server_info():
-    """Print server information to stderr for debugging"""
-    logger = logging.getLogger(__name__)
-    
-    logger.info("=" * 60)
-    logger.info("Unity MCP Server - Model Context Protocol Integration")
-    logger.info("=" * 60)
-    logger.info(f"Server Name: {config.server_name}")
-    logger.info(f"Server Version: {config.server_version}")
-    logger.info(f"Transport: stdio (JSON-RPC 2.0)")
-    logger.info("")
-    logger.info("Available MCP Tools:")
-    for tool in config.enabled_tools:
-        logger.info(f"  - {tool}")
-    logger.info("")
-    logger.info("Available MCP Resources:")
-    for resource in config.enabled_resources:
-        logger.info(f"  - {resource}")
-    logger.info("")
-    logger.info("Available MCP Prompts:")
-    for prompt in config.enabled_prompts:
-        logger.info(f"  - {prompt}")
-    logger.info("")
-    logger.info("Unity Integration:")
-    logger.info(f"  - Editor Path: {config.unity_editor_path or 'Auto-detect'}")
-    logger.info(f"  - Project Path: {config.unity_project_path or 'Not specified'}")
-    logger.info(f"  - Log File: {config.unity_log_file}")
-    logger.info("=" * 60)
+    """Print server information to stderr for debugging
+    
+    The banner bypasses logging and goes out in one write. It is skipped
+    when INFO logging is off, or when config.quiet is set and stderr is not
+    a terminal.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if config.quiet and not sys.stderr.isatty():
+        return
+    
+    lines = [
+        "=" * 60,
+        "Unity MCP Server - Model Context Protocol Integration",
+        "=" * 60,
+        f"Server Name: {config.server_name}",
+        f"Server Version: {config.server_version}",
+        "Transport: stdio (JSON-RPC 2.0)",
+        "",
+        "Available MCP Tools:",
+        *(f"  - {tool}" for tool in config.enabled_tools),
+        "",
+        "Available MCP Resources:",
+        *(f"  - {resource}" for resource in config.enabled_resources),
+        "",
+        "Available MCP Prompts:",
+        *(f"  - {prompt}" for prompt in config.enabled_prompts),
+        "",
+        "Unity Integration:",
+        f"  - Editor Path: {config.unity_editor_path or 'Auto-detect'}",
+        f"  - Project Path: {config.unity_project_path or 'Not specified'}",
+        "  - Session Logs: <project>/Temp/mcp_logs",
+        "=" * 60,
+        "",
+    ]
+    sys.stderr.buffer.write("\n".join(lines).encode("utf-8"))
+    sys.stderr.buffer.flush()
 
 
 async def main():
-    """Main entry point for the Unity MCP Server"""
+    """Main entry point for the Unity MCP Server
+    
+    Expects logging to be configured already; cli_main calls setup_logging()
+    once after applying command-line overrides.
+    """
     try:
-        # Setup logging first
-        logger = setup_logging()
-        
         # Print server information
         print_server_info()
         
@@ -114,6 +248,7 @@ async def main():
         
         # Create and start the MCP server
         logger.info("Initializing Unity MCP Server...")
+        from server import MCPServer
         server = MCPServer()
         logger.info("Unity MCP Server setup completed")
         
@@ -126,8 +261,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
     except Exception as e:
-        logger.error(f"Fatal error in Unity MCP Server: {e}")
-        logger.exception("Full traceback:")
+        logger.error("Fatal error in Unity MCP Server: %s", e, exc_info=True)
         sys.exit(1)
     finally:
         # Cleanup
@@ -206,7 +340,7 @@ For Claude Desktop integration, add this server to your claude_desktop_config.js
         config.log_level = args.log_level
     
     # Setup logging with potentially updated level
-    logger = setup_logging()
+    setup_logging()
     
     if args.validate_only:
         logger.info("Validating configuration...")
@@ -214,13 +348,15 @@ For Claude Desktop integration, add this server to your claude_desktop_config.js
         logger.info("Configuration validation complete")
         return
     
-    # Run the server
+    # Run the server. The server stack is only imported here, so
+    # --validate-only does not load it.
+    from server import run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server failed to start: {e}")
+        logger.error("Server failed to start: %s", e, exc_info=True)
         sys.exit(1)
 
 
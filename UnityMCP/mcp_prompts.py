@@ -1,7 +1,10 @@
 """MCP Prompts Implementation for Unity Development Templates"""
 
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel
@@ -27,25 +30,34 @@ class UnityPrompt(BaseModel):
     template: str
 
 
-def register_prompts(mcp: FastMCP):
-    """Register all Unity MCP prompts"""
+class PromptTemplate:
+    """Prompt body in str.format syntax, split once into its static text and
+    field names so rendering is a single join"""
     
-    @mcp.prompt("unity.build")
-    async def unity_build_prompt(
-        project_path: str,
-        target_platform: str = "StandaloneWindows64",
-        build_options: str = "None",
-        output_path: str = ""
-    ) -> Dict[str, str]:
-        """Generate Unity build configuration and troubleshooting guidance"""
-        
-        template = f"""# Unity Build Configuration and Guidance
+    __slots__ = ("_texts", "_fields")
+    
+    def __init__(self, template: str):
+        parsed = list(Formatter().parse(template))
+        self._texts = tuple(text for text, _, _, _ in parsed)
+        self._fields = tuple(field for _, field, _, _ in parsed)
+    
+    def render(self, **values: str) -> str:
+        parts = []
+        for text, field in zip(self._texts, self._fields):
+            parts.append(text)
+            if field is not None:
+                parts.append(values[field])
+        return "".join(parts)
+
+
+# Prompt bodies are built once; each call only fills in its arguments.
+_BUILD_TEMPLATE: Final = PromptTemplate("""# Unity Build Configuration and Guidance
 
 ## Project Information
 - **Project Path**: {project_path}
 - **Target Platform**: {target_platform}
 - **Build Options**: {build_options}
-- **Output Path**: {output_path or "Default build location"}
+- **Output Path**: {output_location}
 
 ## Build Process Steps
 
@@ -129,27 +141,14 @@ def register_prompts(mcp: FastMCP):
 - [ ] Sufficient disk space for build output
 - [ ] No file permission issues
 - [ ] Platform-specific requirements met
-"""
-        
-        return {
-            "description": f"Unity build guidance for {target_platform} platform",
-            "content": template
-        }
-    
-    @mcp.prompt("unity.debug")
-    async def unity_debug_prompt(
-        issue_type: str = "general",
-        error_message: str = "",
-        context: str = ""
-    ) -> Dict[str, str]:
-        """Generate Unity debugging strategies and diagnostic guidance"""
-        
-        template = f"""# Unity Debugging and Diagnostic Guide
+""")
+
+_DEBUG_TEMPLATE: Final = PromptTemplate("""# Unity Debugging and Diagnostic Guide
 
 ## Issue Analysis
 - **Issue Type**: {issue_type}
-- **Error Message**: {error_message or "No specific error provided"}
-- **Context**: {context or "General debugging"}
+- **Error Message**: {error_message}
+- **Context**: {context}
 
 ## Debugging Strategy
 
@@ -235,8 +234,7 @@ def register_prompts(mcp: FastMCP):
 
 #### MCP Tools for Debugging
 - `project.scan`: Comprehensive project analysis
-- `test.playmode`: Runtime testing
-- `test.editmode`: Editor-time testing
+- `test.run`: Runtime (playmode) and editor-time (editmode) testing
 - `scene.validate`: Scene integrity checks
 - `asset.audit`: Asset validation
 - `editor.exec`: Custom diagnostic scripts
@@ -281,7 +279,7 @@ def register_prompts(mcp: FastMCP):
 
 ### 5. Specific Issue Type Guidance
 
-{self._get_specific_debug_guidance(issue_type, error_message)}
+{guidance}
 
 ## Debugging Checklist
 - [ ] Console cleared of all errors and warnings
@@ -291,27 +289,14 @@ def register_prompts(mcp: FastMCP):
 - [ ] Platform-specific settings verified
 - [ ] Performance within acceptable limits
 - [ ] Tests pass (if available)
-"""
-        
-        return {
-            "description": f"Unity debugging guidance for {issue_type} issues",
-            "content": template
-        }
-    
-    @mcp.prompt("unity.optimize")
-    async def unity_optimize_prompt(
-        optimization_target: str = "performance",
-        platform: str = "general",
-        current_metrics: str = ""
-    ) -> Dict[str, str]:
-        """Generate Unity optimization strategies and performance improvement guidance"""
-        
-        template = f"""# Unity Optimization and Performance Guide
+""")
+
+_OPTIMIZE_TEMPLATE: Final = PromptTemplate("""# Unity Optimization and Performance Guide
 
 ## Optimization Target
 - **Focus Area**: {optimization_target}
 - **Target Platform**: {platform}
-- **Current Metrics**: {current_metrics or "Baseline measurement needed"}
+- **Current Metrics**: {current_metrics}
 
 ## Performance Optimization Strategy
 
@@ -487,19 +472,12 @@ def register_prompts(mcp: FastMCP):
 # project.scan - Overall project health check
 ```
 
-{self._get_specific_optimization_guidance(optimization_target, platform)}
-"""
-        
-        return {
-            "description": f"Unity optimization guidance for {optimization_target} on {platform}",
-            "content": template
-        }
-    
-    def _get_specific_debug_guidance(self, issue_type: str, error_message: str) -> str:
-        """Get specific debugging guidance based on issue type"""
-        
-        guidance_map = {
-            "compilation": """
+{guidance}
+""")
+
+# Extra guidance appended to the debug prompt, by issue type
+_DEBUG_GUIDANCE: Final[Mapping[str, str]] = MappingProxyType({
+    "compilation": """
 #### Compilation Error Specific Guidance
 - Check for missing semicolons, brackets, or parentheses
 - Verify all using statements are correct
@@ -507,7 +485,7 @@ def register_prompts(mcp: FastMCP):
 - Check for circular dependencies between scripts
 - Validate Unity API usage for current Unity version
 """,
-            "runtime": """
+    "runtime": """
 #### Runtime Error Specific Guidance
 - Use try-catch blocks to handle exceptions gracefully
 - Add null checks before accessing objects
@@ -515,7 +493,7 @@ def register_prompts(mcp: FastMCP):
 - Check GameObject and Component references in Inspector
 - Use Debug.Log to trace execution flow
 """,
-            "performance": """
+    "performance": """
 #### Performance Issue Specific Guidance
 - Use Unity Profiler to identify bottlenecks
 - Check for expensive operations in Update loops
@@ -523,7 +501,7 @@ def register_prompts(mcp: FastMCP):
 - Analyze draw calls and rendering performance
 - Review physics simulation complexity
 """,
-            "ui": """
+    "ui": """
 #### UI Issue Specific Guidance
 - Check Canvas settings and render modes
 - Verify UI element anchoring and positioning
@@ -531,22 +509,19 @@ def register_prompts(mcp: FastMCP):
 - Check for UI raycast blocking issues
 - Validate event system configuration
 """
-        }
-        
-        return guidance_map.get(issue_type, """
+})
+_DEBUG_DEFAULT: Final = """
 #### General Debugging Guidance
 - Start with Unity Console for error messages
 - Use systematic elimination to isolate issues
 - Test in minimal reproduction scenarios
 - Check Unity documentation for API changes
 - Consider recent project modifications
-""")
-    
-    def _get_specific_optimization_guidance(self, target: str, platform: str) -> str:
-        """Get specific optimization guidance based on target and platform"""
-        
-        target_guidance = {
-            "rendering": """
+"""
+
+# Extra guidance appended to the optimization prompt, by optimization target
+_OPTIMIZATION_GUIDANCE: Final[Mapping[str, str]] = MappingProxyType({
+    "rendering": """
 ## Rendering-Specific Optimization
 - Implement occlusion culling for complex scenes
 - Use texture streaming for large textures
@@ -554,7 +529,7 @@ def register_prompts(mcp: FastMCP):
 - Implement dynamic resolution scaling
 - Use GPU-based particle systems
 """,
-            "memory": """
+    "memory": """
 ## Memory-Specific Optimization
 - Implement asset bundles for content streaming
 - Use compressed audio formats
@@ -562,7 +537,7 @@ def register_prompts(mcp: FastMCP):
 - Implement garbage collection optimization
 - Use native collections for large datasets
 """,
-            "loading": """
+    "loading": """
 ## Loading Time Optimization
 - Implement asynchronous scene loading
 - Use asset bundles for modular content
@@ -570,15 +545,93 @@ def register_prompts(mcp: FastMCP):
 - Implement progressive loading systems
 - Use addressable assets system
 """
-        }
-        
-        return target_guidance.get(target, """
+})
+_OPTIMIZATION_DEFAULT: Final = """
 ## General Performance Optimization
 - Profile regularly during development
 - Set performance budgets and monitor them
 - Implement scalable quality settings
 - Use platform-appropriate optimization techniques
 - Test on target hardware frequently
-""")
+"""
+
+
+# Rendered prompts for recently seen arguments; clients tend to repeat them
+PROMPT_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _render_build_content(project_path: str, target_platform: str, build_options: str, output_path: str) -> str:
+    return _BUILD_TEMPLATE.render(
+        project_path=project_path,
+        target_platform=target_platform,
+        build_options=build_options,
+        output_path=output_path,
+        output_location=output_path or "Default build location"
+    )
+
+
+@lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _render_debug_content(issue_type: str, error_message: str, context: str) -> str:
+    return _DEBUG_TEMPLATE.render(
+        issue_type=issue_type,
+        error_message=error_message or "No specific error provided",
+        context=context or "General debugging",
+        guidance=_DEBUG_GUIDANCE.get(issue_type, _DEBUG_DEFAULT)
+    )
+
+
+@lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _render_optimize_content(optimization_target: str, platform: str, current_metrics: str) -> str:
+    return _OPTIMIZE_TEMPLATE.render(
+        optimization_target=optimization_target,
+        platform=platform,
+        current_metrics=current_metrics or "Baseline measurement needed",
+        guidance=_OPTIMIZATION_GUIDANCE.get(optimization_target, _OPTIMIZATION_DEFAULT)
+    )
+
+
+def register_prompts(mcp: FastMCP):
+    """Register all Unity MCP prompts"""
+    
+    @mcp.prompt("unity.build")
+    async def unity_build_prompt(
+        project_path: str,
+        target_platform: str = "StandaloneWindows64",
+        build_options: str = "None",
+        output_path: str = ""
+    ) -> Dict[str, str]:
+        """Generate Unity build configuration and troubleshooting guidance"""
+        
+        return {
+            "description": f"Unity build guidance for {target_platform} platform",
+            "content": _render_build_content(project_path, target_platform, build_options, output_path)
+        }
+    
+    @mcp.prompt("unity.debug")
+    async def unity_debug_prompt(
+        issue_type: str = "general",
+        error_message: str = "",
+        context: str = ""
+    ) -> Dict[str, str]:
+        """Generate Unity debugging strategies and diagnostic guidance"""
+        
+        return {
+            "description": f"Unity debugging guidance for {issue_type} issues",
+            "content": _render_debug_content(issue_type, error_message, context)
+        }
+    
+    @mcp.prompt("unity.optimize")
+    async def unity_optimize_prompt(
+        optimization_target: str = "performance",
+        platform: str = "general",
+        current_metrics: str = ""
+    ) -> Dict[str, str]:
+        """Generate Unity optimization strategies and performance improvement guidance"""
+        
+        return {
+            "description": f"Unity optimization guidance for {optimization_target} on {platform}",
+            "content": _render_optimize_content(optimization_target, platform, current_metrics)
+        }
     
-    logger.info("Unity MCP prompts registered successfully")
\ No newline at end of file
+    logger.info("Unity MCP prompts registered successfully")
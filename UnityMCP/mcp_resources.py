@@ -1,15 +1,15 @@
 """MCP Resources Implementation for Unity Data Access"""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel
 
 from config import config
-from unity_manager import UnityManager
+from unity_manager import SESSION_LOG_DIR, UnityManager
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,11 @@ class UnityResource(BaseModel):
     last_updated: Optional[str] = None
 
 
+def _json_content(data: Any) -> str:
+    """Indented JSON text for a resource body"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
 def register_resources(mcp: FastMCP, unity_manager: UnityManager):
     """Register all Unity MCP resources"""
     
@@ -32,7 +37,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
     async def unity_project_resource(path: str) -> Dict[str, Any]:
         """Provide Unity project metadata and configuration"""
         try:
-            logger.info(f"Accessing Unity project resource: {path}")
+            logger.info("Accessing Unity project resource: %s", path)
             
             # Validate project path
             if not config.validate_unity_project_path(path):
@@ -66,7 +71,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                             if product_line:
                                 project_settings["productName"] = product_line[0].split(':')[-1].strip()
                 except Exception as e:
-                    logger.warning(f"Could not parse ProjectSettings.asset: {e}")
+                    logger.warning("Could not parse ProjectSettings.asset: %s", e)
             
             # Get Unity version from ProjectVersion.txt
             unity_version = "Unknown"
@@ -79,7 +84,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                             unity_version = line.split(':')[-1].strip()
                             break
                 except Exception as e:
-                    logger.warning(f"Could not read Unity version: {e}")
+                    logger.warning("Could not read Unity version: %s", e)
             
             # Scan directory structure
             directories = {
@@ -99,12 +104,12 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
             }
             
             return {
-                "content": json.dumps(resource_data, indent=2),
+                "content": _json_content(resource_data),
                 "mimeType": "application/json"
             }
             
         except Exception as e:
-            logger.error(f"Failed to access Unity project resource: {e}")
+            logger.error("Failed to access Unity project resource: %s", e)
             return {
                 "error": str(e),
                 "content": None
@@ -114,7 +119,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
     async def unity_scenes_resource(path: str) -> Dict[str, Any]:
         """Access Unity scene data and hierarchy information"""
         try:
-            logger.info(f"Accessing Unity scenes resource: {path}")
+            logger.info("Accessing Unity scenes resource: %s", path)
             
             # Validate project path
             if not config.validate_unity_project_path(path):
@@ -151,7 +156,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                         
                         scene_files.append(scene_info)
                     except Exception as e:
-                        logger.warning(f"Could not process scene file {scene_file}: {e}")
+                        logger.warning("Could not process scene file %s: %s", scene_file, e)
             
             # Read build settings to find scenes in build
             build_scenes = []
@@ -168,7 +173,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                                 if scene_path:
                                     build_scenes.append(scene_path)
                 except Exception as e:
-                    logger.warning(f"Could not parse EditorBuildSettings: {e}")
+                    logger.warning("Could not parse EditorBuildSettings: %s", e)
             
             resource_data = {
                 "scene_files": scene_files,
@@ -179,12 +184,12 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
             }
             
             return {
-                "content": json.dumps(resource_data, indent=2),
+                "content": _json_content(resource_data),
                 "mimeType": "application/json"
             }
             
         except Exception as e:
-            logger.error(f"Failed to access Unity scenes resource: {e}")
+            logger.error("Failed to access Unity scenes resource: %s", e)
             return {
                 "error": str(e),
                 "content": None
@@ -194,7 +199,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
     async def unity_assets_resource(path: str) -> Dict[str, Any]:
         """Browse Unity asset database and import settings"""
         try:
-            logger.info(f"Accessing Unity assets resource: {path}")
+            logger.info("Accessing Unity assets resource: %s", path)
             
             # Validate project path
             if not config.validate_unity_project_path(path):
@@ -256,7 +261,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                                 asset_summary["other"].append(file_info)
                                 
                         except Exception as e:
-                            logger.warning(f"Could not process asset file {asset_file}: {e}")
+                            logger.warning("Could not process asset file %s: %s", asset_file, e)
             
             # Generate statistics
             statistics = {
@@ -284,12 +289,12 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
             }
             
             return {
-                "content": json.dumps(resource_data, indent=2),
+                "content": _json_content(resource_data),
                 "mimeType": "application/json"
             }
             
         except Exception as e:
-            logger.error(f"Failed to access Unity assets resource: {e}")
+            logger.error("Failed to access Unity assets resource: %s", e)
             return {
                 "error": str(e),
                 "content": None
@@ -299,7 +304,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
     async def unity_logs_resource(path: str) -> Dict[str, Any]:
         """Access Unity console logs and build output"""
         try:
-            logger.info(f"Accessing Unity logs resource: {path}")
+            logger.info("Accessing Unity logs resource: %s", path)
             
             project_path_obj = Path(path)
             logs_path = project_path_obj / "Logs"
@@ -325,15 +330,14 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                         
                         log_files.append(log_info)
                     except Exception as e:
-                        logger.warning(f"Could not process log file {log_file}: {e}")
+                        logger.warning("Could not process log file %s: %s", log_file, e)
             
-            # Also check for Unity log file specified in config
-            unity_log_path = Path(config.unity_log_file)
-            if unity_log_path.exists():
+            # Also include the logs of Unity sessions started by the server
+            for unity_log_path in (project_path_obj / SESSION_LOG_DIR).glob("*.log"):
                 try:
                     log_info = {
                         "name": unity_log_path.name,
-                        "path": str(unity_log_path),
+                        "path": str(unity_log_path.relative_to(project_path_obj)),
                         "size_bytes": unity_log_path.stat().st_size,
                         "last_modified": unity_log_path.stat().st_mtime,
                         "is_mcp_log": True
@@ -345,7 +349,7 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
                     
                     log_files.append(log_info)
                 except Exception as e:
-                    logger.warning(f"Could not read Unity MCP log: {e}")
+                    logger.warning("Could not read Unity MCP log: %s", e)
             
             resource_data = {
                 "log_files": log_files,
@@ -354,12 +358,12 @@ def register_resources(mcp: FastMCP, unity_manager: UnityManager):
             }
             
             return {
-                "content": json.dumps(resource_data, indent=2),
+                "content": _json_content(resource_data),
                 "mimeType": "application/json"
             }
             
         except Exception as e:
-            logger.error(f"Failed to access Unity logs resource: {e}")
+            logger.error("Failed to access Unity logs resource: %s", e)
             return {
                 "error": str(e),
                 "content": None
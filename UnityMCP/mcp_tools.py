@@ -1,14 +1,24 @@
 """MCP Tools Implementation for Unity Operations"""
 
 import asyncio
-import json
+import base64
 import logging
+import os
+import sys
+import tempfile
+import uuid
+from array import array
+from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Literal, NamedTuple, Optional, Tuple, Type, Union
 
+import orjson
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from typing_extensions import TypedDict
 
+from asset_processing import scan_texture_candidates
+from bake_cache import bake_key, lookup_baked_clip, store_baked_clip
 from config import config
 from unity_manager import UnityManager
 
@@ -16,8 +26,84 @@ from unity_manager import UnityManager
 logger = logging.getLogger(__name__)
 
 
+class PackedStringArray:
+    """Strings packed into one UTF-8 buffer plus an int32 offset table.
+
+    String ``i`` is ``data[offsets[i]:offsets[i + 1]]``, so large path lists
+    travel as two flat buffers instead of one object per element.
+    """
+
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, offsets: array, data: bytes):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_strings(cls, strings: List[str]) -> "PackedStringArray":
+        """Pack a list of strings"""
+        encoded = [item.encode("utf-8") for item in strings]
+        offsets = array("i", [0])
+        end = 0
+        for item in encoded:
+            end += len(item)
+            offsets.append(end)
+        return cls(offsets, b"".join(encoded))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def to_wire(self) -> Dict[str, Any]:
+        """JSON form; Unity re-encodes ``data`` as UTF-8 and slices it by ``offsets``"""
+        return {
+            "count": len(self),
+            "offsets": self.offsets.tolist(),
+            "data": self.data.decode("utf-8")
+        }
+
+
+def pack_numeric(typecode: str, values: Any) -> str:
+    """Pack numbers into a base64 little-endian buffer of the given array typecode
+
+    Unity decodes the buffer and block-copies it into a typed array, instead
+    of parsing one JSON number at a time.
+    """
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+# Shared "data" for responses whose Unity result carries none. Responses are
+# only serialized, never modified, so one instance serves every call; do not
+# mutate it. (A MappingProxyType would not serialize through orjson/FastMCP.)
+_NO_DATA: Dict[str, Any] = {}
+
+
 # Tool Parameter Models
-class ProjectScanParams(BaseModel):
+class WorkflowParams(BaseModel):
+    """Base for the project workflow tool parameters (see WORKFLOW_TOOLS)
+
+    Instances are read-only and unknown fields are rejected rather than
+    silently dropped.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class TimedWorkflowParams(WorkflowParams):
+    """Workflow parameters carrying a command timeout; subclasses declare
+    timeout_minutes with their own default"""
+
+    @computed_field
+    @property
+    def timeout_seconds(self) -> int:
+        return self.timeout_minutes * 60
+
+
+class ProjectScanParams(WorkflowParams):
     """Parameters for project.scan tool"""
     project_path: str = Field(description="Path to Unity project")
     patterns: List[str] = Field(default=["**/*.cs", "**/*.prefab"], description="File patterns to scan")
@@ -25,7 +111,7 @@ class ProjectScanParams(BaseModel):
     max_depth: int = Field(default=10, description="Maximum directory depth")
 
 
-class BuildRunParams(BaseModel):
+class BuildRunParams(TimedWorkflowParams):
     """Parameters for build.run tool"""
     project_path: str = Field(description="Path to Unity project")
     target: str = Field(description="Build target (android/ios/win64/osx/webgl)")
@@ -35,17 +121,17 @@ class BuildRunParams(BaseModel):
     timeout_minutes: int = Field(default=30, description="Build timeout in minutes")
 
 
-class TestRunParams(BaseModel):
-    """Parameters for test execution tools"""
+class TestRunParams(TimedWorkflowParams):
+    """Parameters for test.run tool"""
     project_path: str = Field(description="Path to Unity project")
-    test_mode: str = Field(description="Test mode (playmode/editmode)")
+    test_mode: Literal["playmode", "editmode"] = Field(description="Test mode (playmode/editmode)")
     filters: Optional[Dict[str, Any]] = Field(default=None, description="Test filtering options")
     output_path: str = Field(description="JUnit XML output path")
     timeout_minutes: int = Field(default=15, description="Test timeout in minutes")
     collect_coverage: bool = Field(default=False, description="Collect code coverage data")
 
 
-class SceneValidateParams(BaseModel):
+class SceneValidateParams(WorkflowParams):
     """Parameters for scene.validate tool"""
     project_path: str = Field(description="Path to Unity project")
     scene_paths: Optional[List[str]] = Field(default=None, description="Specific scene paths to validate")
@@ -53,7 +139,7 @@ class SceneValidateParams(BaseModel):
     check_lightmaps: bool = Field(default=True, description="Check lightmap issues")
 
 
-class AssetAuditParams(BaseModel):
+class AssetAuditParams(WorkflowParams):
     """Parameters for asset.audit tool"""
     project_path: str = Field(description="Path to Unity project")
     asset_types: Optional[List[str]] = Field(default=None, description="Asset types to audit")
@@ -61,7 +147,7 @@ class AssetAuditParams(BaseModel):
     check_optimization: bool = Field(default=True, description="Check optimization opportunities")
 
 
-class CodegenApplyParams(BaseModel):
+class CodegenApplyParams(WorkflowParams):
     """Parameters for codegen.apply tool"""
     project_path: str = Field(description="Path to Unity project")
     file_path: str = Field(description="Target C# file path")
@@ -69,15 +155,15 @@ class CodegenApplyParams(BaseModel):
     preview_only: bool = Field(default=False, description="Preview changes without applying")
 
 
-class EditorExecParams(BaseModel):
+class EditorExecParams(TimedWorkflowParams):
     """Parameters for editor.exec tool"""
     project_path: str = Field(description="Path to Unity project")
     method_name: str = Field(description="Unity Editor method to execute")
-    parameters: Optional[Dict[str, Any]] = Field(default=None, description="Method parameters")
+    parameters: Dict[str, Any] = Field(default_factory=dict, description="Method parameters")
     timeout_minutes: int = Field(default=5, description="Execution timeout in minutes")
 
 
-class PerfProfileParams(BaseModel):
+class PerfProfileParams(WorkflowParams):
     """Parameters for perf.profile tool"""
     project_path: str = Field(description="Path to Unity project")
     scene_path: Optional[str] = Field(default=None, description="Scene to profile")
@@ -357,6 +443,17 @@ class AssetBundleBuildParams(BaseModel):
     build_target: str = Field(default="StandaloneWindows64", description="Build target")
     build_options: Optional[List[str]] = Field(default=None, description="Build options")
 
+class AssetBundleBuildPipelineParams(BaseModel):
+    project_path: str = Field(description="Path to Unity project")
+    bundle_name: str = Field(description="Asset bundle name")
+    asset_paths: List[str] = Field(description="List of asset paths")
+    build_target: str = Field(default="StandaloneWindows64", description="Build target")
+    output_path: str = Field(description="Output path for bundles")
+    build_options: Optional[List[str]] = Field(default=None, description="Build options")
+    refresh: bool = Field(default=True, description="Refresh the Asset Database after building")
+    force_refresh: bool = Field(default=False, description="Force complete refresh")
+    import_mode: str = Field(default="synchronous", description="Import mode")
+
 class AssetDependencyParams(BaseModel):
     project_path: str = Field(description="Path to Unity project")
     asset_path: str = Field(description="Asset path to analyze")
@@ -457,10 +554,46 @@ class AnimationBakeParams(BaseModel):
     frame_range: Optional[Dict[str, int]] = Field(default=None, description="Frame range to bake")
     sample_rate: int = Field(default=60, description="Sample rate")
     bake_pose: bool = Field(default=True, description="Bake pose")
-
-
-# Physics & Collision Parameter Models (8 tools)
-class RigidbodyParams(BaseModel):
+    use_cache: bool = Field(default=True, description="Reuse the clip from an identical earlier bake if it still exists")
+
+
+# Unity Command Parameter Base
+class UnityCommandParams(BaseModel):
+    """Parameters forwarded to Unity as a single command
+
+    Subclasses name their Unity action; every field except project_path
+    becomes a command key. Fields left unset (None) or at their default are
+    omitted from the command, and Unity treats a missing key as "leave
+    unchanged".
+    """
+    action: ClassVar[str]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Share one string object per action so set/dict lookups downstream
+        # (batching, result cache) take the identity fast path
+        cls.action = sys.intern(cls.action)
+
+    @field_validator("project_path", check_fields=False)
+    @classmethod
+    def check_project_path(cls, value: str) -> str:
+        # Rejects bad paths before a Unity session is started for them
+        if not config.validate_unity_project_path(value):
+            raise ValueError(f"Invalid Unity project path: {value}")
+        return value
+
+    def to_command(self) -> Dict[str, Any]:
+        """Build the {"action": ..., **fields} command dict"""
+        return {
+            "action": self.action,
+            **self.model_dump(mode="json", exclude={"project_path"}, exclude_none=True, exclude_unset=True)
+        }
+
+
+# Physics & Collision Parameter Models (9 tools)
+class RigidbodyParams(UnityCommandParams):
+    action: ClassVar[str] = "rigidbody_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     mass: float = Field(default=1.0, description="Rigidbody mass")
@@ -470,7 +603,8 @@ class RigidbodyParams(BaseModel):
     is_kinematic: bool = Field(default=False, description="Is kinematic")
     freeze_rotation: Optional[List[str]] = Field(default=None, description="Freeze rotation axes")
 
-class ColliderParams(BaseModel):
+class ColliderParams(UnityCommandParams):
+    action: ClassVar[str] = "collider_manage"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     collider_type: str = Field(description="Collider type (Box, Sphere, Capsule, Mesh)")
@@ -479,7 +613,8 @@ class ColliderParams(BaseModel):
     size: Optional[Dict[str, float]] = Field(default=None, description="Collider size parameters")
     center: Optional[Dict[str, float]] = Field(default=None, description="Collider center offset")
 
-class PhysicsMaterialParams(BaseModel):
+class PhysicsMaterialParams(UnityCommandParams):
+    action: ClassVar[str] = "physics_material_create"
     project_path: str = Field(description="Path to Unity project")
     material_name: str = Field(description="Physics material name")
     output_path: str = Field(description="Output path for material")
@@ -489,7 +624,8 @@ class PhysicsMaterialParams(BaseModel):
     friction_combine: str = Field(default="Average", description="Friction combine mode")
     bounce_combine: str = Field(default="Average", description="Bounce combine mode")
 
-class JointParams(BaseModel):
+class JointParams(UnityCommandParams):
+    action: ClassVar[str] = "joint_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     joint_type: str = Field(description="Joint type (Fixed, Hinge, Spring, Character, Configurable)")
@@ -499,7 +635,8 @@ class JointParams(BaseModel):
     limits: Optional[Dict[str, Any]] = Field(default=None, description="Joint limits")
     spring: Optional[Dict[str, float]] = Field(default=None, description="Spring settings")
 
-class PhysicsSimulationParams(BaseModel):
+class PhysicsSimulationParams(UnityCommandParams):
+    action: ClassVar[str] = "physics_simulation_settings"
     project_path: str = Field(description="Path to Unity project")
     gravity: Optional[Dict[str, float]] = Field(default=None, description="Gravity vector")
     default_material: Optional[str] = Field(default=None, description="Default physics material")
@@ -509,7 +646,8 @@ class PhysicsSimulationParams(BaseModel):
     solver_iterations: int = Field(default=6, description="Solver iterations")
     solver_velocity_iterations: int = Field(default=1, description="Solver velocity iterations")
 
-class RaycastParams(BaseModel):
+class RaycastParams(UnityCommandParams):
+    action: ClassVar[str] = "physics_raycast"
     project_path: str = Field(description="Path to Unity project")
     origin: Dict[str, float] = Field(description="Ray origin position")
     direction: Dict[str, float] = Field(description="Ray direction")
@@ -517,7 +655,51 @@ class RaycastParams(BaseModel):
     layer_mask: Optional[int] = Field(default=None, description="Layer mask for filtering")
     query_trigger_interaction: str = Field(default="UseGlobal", description="Query trigger interaction")
 
-class OverlapParams(BaseModel):
+# UnityEngine.Physics.DefaultRaycastLayers and QueryTriggerInteraction values
+DEFAULT_RAYCAST_LAYERS = -5
+QUERY_TRIGGER_INTERACTIONS = {"UseGlobal": 0, "Ignore": 1, "Collide": 2}
+
+class RaySpec(BaseModel):
+    origin: Dict[str, float] = Field(description="Ray origin position")
+    direction: Dict[str, float] = Field(description="Ray direction")
+    max_distance: float = Field(default=float('inf'), description="Maximum ray distance")
+    layer_mask: Optional[int] = Field(default=None, description="Layer mask for filtering")
+    query_trigger_interaction: Literal["UseGlobal", "Ignore", "Collide"] = Field(default="UseGlobal", description="Query trigger interaction")
+
+class RaycastBatchParams(UnityCommandParams):
+    action: ClassVar[str] = "physics_raycast_many"
+    project_path: str = Field(description="Path to Unity project")
+    rays: List[RaySpec] = Field(description="Rays to cast, scheduled together as one batch in Unity")
+
+    def to_command(self) -> Dict[str, Any]:
+        """Send the rays as flat per-component buffers (structure of arrays)
+
+        origins and directions are float32 x/y/z triples, max_distances float32
+        and layer_masks/query_trigger_interactions int32, one entry per ray.
+        """
+        origins = array("f")
+        directions = array("f")
+        for ray in self.rays:
+            origins.extend(ray.origin.get(axis, 0.0) for axis in "xyz")
+            directions.extend(ray.direction.get(axis, 0.0) for axis in "xyz")
+
+        return {
+            "action": self.action,
+            "count": len(self.rays),
+            "origins": pack_numeric("f", origins),
+            "directions": pack_numeric("f", directions),
+            "max_distances": pack_numeric("f", (ray.max_distance for ray in self.rays)),
+            "layer_masks": pack_numeric("i", (
+                DEFAULT_RAYCAST_LAYERS if ray.layer_mask is None else ray.layer_mask
+                for ray in self.rays
+            )),
+            "query_trigger_interactions": pack_numeric("i", (
+                QUERY_TRIGGER_INTERACTIONS[ray.query_trigger_interaction] for ray in self.rays
+            ))
+        }
+
+class OverlapParams(UnityCommandParams):
+    action: ClassVar[str] = "physics_overlap"
     project_path: str = Field(description="Path to Unity project")
     shape_type: str = Field(description="Shape type (Sphere, Box, Capsule)")
     position: Dict[str, float] = Field(description="Shape position")
@@ -525,7 +707,8 @@ class OverlapParams(BaseModel):
     layer_mask: Optional[int] = Field(default=None, description="Layer mask for filtering")
     query_trigger_interaction: str = Field(default="UseGlobal", description="Query trigger interaction")
 
-class PhysicsDebugParams(BaseModel):
+class PhysicsDebugParams(UnityCommandParams):
+    action: ClassVar[str] = "physics_debug"
     project_path: str = Field(description="Path to Unity project")
     debug_type: str = Field(description="Debug type (Colliders, Contacts, Joints, Raycast)")
     enable: bool = Field(default=True, description="Enable debug visualization")
@@ -534,7 +717,8 @@ class PhysicsDebugParams(BaseModel):
 
 
 # Rendering & Graphics Parameter Models (10 tools)
-class MaterialParams(BaseModel):
+class MaterialParams(UnityCommandParams):
+    action: ClassVar[str] = "material_create"
     project_path: str = Field(description="Path to Unity project")
     material_name: str = Field(description="Material name")
     output_path: str = Field(description="Output path for material")
@@ -543,7 +727,8 @@ class MaterialParams(BaseModel):
     textures: Optional[Dict[str, str]] = Field(default=None, description="Texture assignments")
     keywords: Optional[List[str]] = Field(default=None, description="Shader keywords")
 
-class ShaderParams(BaseModel):
+class ShaderParams(UnityCommandParams):
+    action: ClassVar[str] = "shader_create"
     project_path: str = Field(description="Path to Unity project")
     shader_name: str = Field(description="Shader name")
     output_path: str = Field(description="Output path for shader")
@@ -552,7 +737,8 @@ class ShaderParams(BaseModel):
     passes: Optional[List[Dict[str, Any]]] = Field(default=None, description="Shader passes")
     includes: Optional[List[str]] = Field(default=None, description="Include files")
 
-class CameraParams(BaseModel):
+class CameraParams(UnityCommandParams):
+    action: ClassVar[str] = "camera_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     clear_flags: str = Field(default="Skybox", description="Clear flags")
@@ -564,7 +750,8 @@ class CameraParams(BaseModel):
     far_clip: float = Field(default=1000.0, description="Far clipping plane")
     render_texture: Optional[str] = Field(default=None, description="Render texture path")
 
-class LightingParams(BaseModel):
+class LightingParams(UnityCommandParams):
+    action: ClassVar[str] = "lighting_setup"
     project_path: str = Field(description="Path to Unity project")
     lighting_type: str = Field(description="Lighting type (Directional, Point, Spot, Area)")
     gameobject_path: Optional[str] = Field(default=None, description="GameObject path for light")
@@ -575,7 +762,8 @@ class LightingParams(BaseModel):
     shadows: str = Field(default="Soft", description="Shadow type")
     baking_settings: Optional[Dict[str, Any]] = Field(default=None, description="Light baking settings")
 
-class PostProcessingParams(BaseModel):
+class PostProcessingParams(UnityCommandParams):
+    action: ClassVar[str] = "postprocessing_configure"
     project_path: str = Field(description="Path to Unity project")
     profile_name: str = Field(description="Post-processing profile name")
     output_path: str = Field(description="Output path for profile")
@@ -584,7 +772,8 @@ class PostProcessingParams(BaseModel):
     is_global: bool = Field(default=True, description="Is global volume")
     priority: int = Field(default=0, description="Volume priority")
 
-class RenderPipelineParams(BaseModel):
+class RenderPipelineParams(UnityCommandParams):
+    action: ClassVar[str] = "render_pipeline_setup"
     project_path: str = Field(description="Path to Unity project")
     pipeline_type: str = Field(description="Pipeline type (Built-in, URP, HDRP)")
     asset_name: str = Field(description="Pipeline asset name")
@@ -592,7 +781,8 @@ class RenderPipelineParams(BaseModel):
     settings: Dict[str, Any] = Field(description="Pipeline settings")
     renderer_features: Optional[List[Dict[str, Any]]] = Field(default=None, description="Renderer features")
 
-class TextureParams(BaseModel):
+class TextureParams(UnityCommandParams):
+    action: ClassVar[str] = "texture_configure"
     project_path: str = Field(description="Path to Unity project")
     texture_path: str = Field(description="Texture file path")
     texture_type: str = Field(default="Default", description="Texture type")
@@ -603,7 +793,8 @@ class TextureParams(BaseModel):
     generate_mipmaps: bool = Field(default=True, description="Generate mipmaps")
     srgb_texture: bool = Field(default=True, description="sRGB texture")
 
-class MeshParams(BaseModel):
+class MeshParams(UnityCommandParams):
+    action: ClassVar[str] = "mesh_configure"
     project_path: str = Field(description="Path to Unity project")
     mesh_path: str = Field(description="Mesh file path")
     scale_factor: float = Field(default=1.0, description="Scale factor")
@@ -614,14 +805,16 @@ class MeshParams(BaseModel):
     normals: str = Field(default="Import", description="Normals import mode")
     tangents: str = Field(default="CalculateMikk", description="Tangents calculation")
 
-class LODParams(BaseModel):
+class LODParams(UnityCommandParams):
+    action: ClassVar[str] = "lod_setup"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     lod_levels: List[Dict[str, Any]] = Field(description="LOD levels configuration")
     fade_mode: str = Field(default="CrossFade", description="LOD fade mode")
     animate_cross_fading: bool = Field(default=False, description="Animate cross fading")
 
-class CullingParams(BaseModel):
+class CullingParams(UnityCommandParams):
+    action: ClassVar[str] = "culling_configure"
     project_path: str = Field(description="Path to Unity project")
     culling_type: str = Field(description="Culling type (Frustum, Occlusion, Distance)")
     gameobject_path: Optional[str] = Field(default=None, description="GameObject path")
@@ -631,7 +824,8 @@ class CullingParams(BaseModel):
 
 
 # Audio System Parameter Models (8 tools)
-class AudioSourceParams(BaseModel):
+class AudioSourceParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_source_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     audio_clip: Optional[str] = Field(default=None, description="Audio clip path")
@@ -644,7 +838,8 @@ class AudioSourceParams(BaseModel):
     max_distance: Optional[float] = Field(default=None, description="Maximum distance")
     rolloff_mode: Optional[str] = Field(default=None, description="Rolloff mode")
 
-class AudioClipParams(BaseModel):
+class AudioClipParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_clip_configure"
     project_path: str = Field(description="Path to Unity project")
     clip_path: str = Field(description="Audio clip file path")
     load_type: Optional[str] = Field(default=None, description="Load type")
@@ -655,7 +850,8 @@ class AudioClipParams(BaseModel):
     load_in_background: Optional[bool] = Field(default=None, description="Load in background")
     ambisonic: Optional[bool] = Field(default=None, description="Ambisonic audio")
 
-class AudioMixerParams(BaseModel):
+class AudioMixerParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_mixer_create"
     project_path: str = Field(description="Path to Unity project")
     mixer_name: str = Field(description="Audio mixer name")
     output_path: str = Field(description="Output path for mixer")
@@ -664,7 +860,8 @@ class AudioMixerParams(BaseModel):
     exposed_parameters: Optional[List[str]] = Field(default=None, description="Exposed parameters")
     effects: Optional[List[Dict[str, Any]]] = Field(default=None, description="Audio effects")
 
-class Audio3DParams(BaseModel):
+class Audio3DParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_3d_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     doppler_level: Optional[float] = Field(default=None, description="Doppler level")
@@ -674,7 +871,8 @@ class Audio3DParams(BaseModel):
     max_distance: Optional[float] = Field(default=None, description="Maximum distance")
     reverb_zone_mix: Optional[float] = Field(default=None, description="Reverb zone mix")
 
-class ReverbZoneParams(BaseModel):
+class ReverbZoneParams(UnityCommandParams):
+    action: ClassVar[str] = "reverb_zone_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     min_distance: Optional[float] = Field(default=None, description="Minimum distance")
@@ -694,13 +892,15 @@ class ReverbZoneParams(BaseModel):
     diffusion: Optional[float] = Field(default=None, description="Diffusion")
     density: Optional[float] = Field(default=None, description="Density")
 
-class AudioListenerParams(BaseModel):
+class AudioListenerParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_listener_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     volume_scale: Optional[float] = Field(default=None, description="Volume scale")
     pause_on_audio_focus_loss: Optional[bool] = Field(default=None, description="Pause on audio focus loss")
 
-class AudioStreamingParams(BaseModel):
+class AudioStreamingParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_streaming_configure"
     project_path: str = Field(description="Path to Unity project")
     clip_path: str = Field(description="Audio clip path")
     streaming_enabled: bool = Field(description="Enable streaming")
@@ -708,7 +908,8 @@ class AudioStreamingParams(BaseModel):
     preload_audio_data: Optional[bool] = Field(default=None, description="Preload audio data")
     load_in_background: Optional[bool] = Field(default=None, description="Load in background")
 
-class AudioCompressionParams(BaseModel):
+class AudioCompressionParams(UnityCommandParams):
+    action: ClassVar[str] = "audio_compression_configure"
     project_path: str = Field(description="Path to Unity project")
     clip_path: str = Field(description="Audio clip path")
     compression_format: str = Field(description="Compression format")
@@ -719,7 +920,8 @@ class AudioCompressionParams(BaseModel):
 
 
 # UI System Parameter Models (5 tools)
-class CanvasParams(BaseModel):
+class CanvasParams(UnityCommandParams):
+    action: ClassVar[str] = "canvas_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     render_mode: Optional[str] = Field(default=None, description="Canvas render mode")
@@ -731,7 +933,8 @@ class CanvasParams(BaseModel):
     override_sorting: Optional[bool] = Field(default=None, description="Override sorting")
     additional_shader_channels: Optional[List[str]] = Field(default=None, description="Additional shader channels")
 
-class UIElementParams(BaseModel):
+class UIElementParams(UnityCommandParams):
+    action: ClassVar[str] = "ui_element_create"
     project_path: str = Field(description="Path to Unity project")
     parent_path: str = Field(description="Parent GameObject path")
     element_type: str = Field(description="UI element type (Button, Text, Image, etc.)")
@@ -747,7 +950,8 @@ class UIElementParams(BaseModel):
     font_size: Optional[int] = Field(default=None, description="Font size")
     interactable: Optional[bool] = Field(default=None, description="Interactable state")
 
-class EventSystemParams(BaseModel):
+class EventSystemParams(UnityCommandParams):
+    action: ClassVar[str] = "event_system_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: Optional[str] = Field(default=None, description="GameObject path")
     first_selected: Optional[str] = Field(default=None, description="First selected GameObject")
@@ -755,7 +959,8 @@ class EventSystemParams(BaseModel):
     drag_threshold: Optional[int] = Field(default=None, description="Drag threshold")
     input_module_type: Optional[str] = Field(default=None, description="Input module type")
 
-class LayoutGroupParams(BaseModel):
+class LayoutGroupParams(UnityCommandParams):
+    action: ClassVar[str] = "layout_group_configure"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     layout_type: str = Field(description="Layout group type (Horizontal, Vertical, Grid)")
@@ -768,7 +973,8 @@ class LayoutGroupParams(BaseModel):
     constraint: Optional[str] = Field(default=None, description="Grid constraint")
     constraint_count: Optional[int] = Field(default=None, description="Constraint count")
 
-class UIAnimationParams(BaseModel):
+class UIAnimationParams(UnityCommandParams):
+    action: ClassVar[str] = "ui_animation_create"
     project_path: str = Field(description="Path to Unity project")
     gameobject_path: str = Field(description="GameObject path")
     animation_type: str = Field(description="Animation type (Fade, Scale, Move, Rotate)")
@@ -782,17 +988,44 @@ class UIAnimationParams(BaseModel):
 
 
 # Build System Parameter Models (3 tools)
-class BuildPlayerParams(BaseModel):
+# Lower-cased platform names accepted by build_player and platform_switch:
+# the documented short names plus Unity BuildTarget names
+BUILD_TARGET_PLATFORMS = frozenset({
+    "windows", "mac", "linux", "ios", "android", "webgl",
+    "standalonewindows", "standalonewindows64", "standaloneosx",
+    "standalonelinux64", "tvos", "ps4", "ps5", "xboxone", "switch",
+})
+
+
+def _check_target_platform(value: str) -> str:
+    if value.lower() not in BUILD_TARGET_PLATFORMS:
+        raise ValueError(f"Unsupported target platform: {value}")
+    return value
+
+
+class BuildPlayerParams(UnityCommandParams):
+    action: ClassVar[str] = "build_player"
     project_path: str = Field(description="Path to Unity project")
     target_platform: str = Field(description="Target platform (Windows, Mac, Linux, iOS, Android, WebGL)")
     build_path: str = Field(description="Build output path")
     development_build: Optional[bool] = Field(default=False, description="Development build")
     script_debugging: Optional[bool] = Field(default=False, description="Script debugging")
-    compression: Optional[str] = Field(default="LZ4", description="Compression type")
+    compression: Optional[Literal["None", "LZ4", "LZ4HC"]] = Field(default="LZ4", description="Compression type")
     scenes: Optional[List[str]] = Field(default=None, description="Scenes to include")
     player_settings: Optional[Dict[str, Any]] = Field(default=None, description="Player settings")
 
-class BuildSettingsParams(BaseModel):
+    check_target_platform = field_validator("target_platform")(_check_target_platform)
+
+    @field_validator("scenes")
+    @classmethod
+    def check_scenes(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        for scene in value or ():
+            if not scene.endswith(".unity"):
+                raise ValueError(f"Scene path must end in .unity: {scene}")
+        return value
+
+class BuildSettingsParams(UnityCommandParams):
+    action: ClassVar[str] = "build_settings_configure"
     project_path: str = Field(description="Path to Unity project")
     company_name: Optional[str] = Field(default=None, description="Company name")
     product_name: Optional[str] = Field(default=None, description="Product name")
@@ -803,7 +1036,8 @@ class BuildSettingsParams(BaseModel):
     resolution_settings: Optional[Dict[str, Any]] = Field(default=None, description="Resolution settings")
     quality_settings: Optional[Dict[str, Any]] = Field(default=None, description="Quality settings")
 
-class PlatformSwitchParams(BaseModel):
+class PlatformSwitchParams(UnityCommandParams):
+    action: ClassVar[str] = "platform_switch"
     project_path: str = Field(description="Path to Unity project")
     target_platform: str = Field(description="Target platform")
     texture_compression: Optional[str] = Field(default=None, description="Texture compression")
@@ -812,9 +1046,12 @@ class PlatformSwitchParams(BaseModel):
     target_device: Optional[str] = Field(default=None, description="Target device")
     architecture: Optional[str] = Field(default=None, description="Architecture")
 
+    check_target_platform = field_validator("target_platform")(_check_target_platform)
+
 
 # Scripting & Code Generation Parameter Models (4 tools)
-class ScriptTemplateParams(BaseModel):
+class ScriptTemplateParams(UnityCommandParams):
+    action: ClassVar[str] = "script_template_create"
     project_path: str = Field(description="Path to Unity project")
     template_type: str = Field(description="Script template type (MonoBehaviour, ScriptableObject, Editor, etc.)")
     script_name: str = Field(description="Script name")
@@ -824,7 +1061,8 @@ class ScriptTemplateParams(BaseModel):
     interfaces: Optional[List[str]] = Field(default=None, description="Interfaces to implement")
     custom_template: Optional[str] = Field(default=None, description="Custom template content")
 
-class CodeAnalysisParams(BaseModel):
+class CodeAnalysisParams(UnityCommandParams):
+    action: ClassVar[str] = "code_analysis_run"
     project_path: str = Field(description="Path to Unity project")
     analysis_type: str = Field(description="Analysis type (syntax, performance, dependencies, etc.)")
     target_files: Optional[List[str]] = Field(default=None, description="Target files to analyze")
@@ -833,7 +1071,8 @@ class CodeAnalysisParams(BaseModel):
     exclude_patterns: Optional[List[str]] = Field(default=None, description="Exclude patterns")
     output_format: Optional[str] = Field(default="json", description="Output format")
 
-class CodeRefactorParams(BaseModel):
+class CodeRefactorParams(UnityCommandParams):
+    action: ClassVar[str] = "code_refactor"
     project_path: str = Field(description="Path to Unity project")
     refactor_type: str = Field(description="Refactor type (rename, extract_method, move_class, etc.)")
     target_file: str = Field(description="Target file path")
@@ -843,7 +1082,8 @@ class CodeRefactorParams(BaseModel):
     end_line: Optional[int] = Field(default=None, description="End line for extraction")
     target_namespace: Optional[str] = Field(default=None, description="Target namespace for move operations")
 
-class DocumentationParams(BaseModel):
+class DocumentationParams(UnityCommandParams):
+    action: ClassVar[str] = "documentation_generate"
     project_path: str = Field(description="Path to Unity project")
     doc_type: str = Field(description="Documentation type (xml, markdown, html)")
     target_files: Optional[List[str]] = Field(default=None, description="Target files")
@@ -855,7 +1095,8 @@ class DocumentationParams(BaseModel):
 
 
 # Performance & Profiling Parameter Models (2 tools)
-class ProfilerDataParams(BaseModel):
+class ProfilerDataParams(UnityCommandParams):
+    action: ClassVar[str] = "profiler_data_collect"
     project_path: str = Field(description="Path to Unity project")
     profiler_type: str = Field(description="Profiler type (cpu, memory, rendering, audio, physics)")
     duration: Optional[float] = Field(default=10.0, description="Profiling duration in seconds")
@@ -865,7 +1106,8 @@ class ProfilerDataParams(BaseModel):
     output_format: Optional[str] = Field(default="json", description="Output format (json, csv, binary)")
     output_path: Optional[str] = Field(default=None, description="Output file path")
 
-class PerformanceAnalysisParams(BaseModel):
+class PerformanceAnalysisParams(UnityCommandParams):
+    action: ClassVar[str] = "performance_analysis_run"
     project_path: str = Field(description="Path to Unity project")
     analysis_type: str = Field(description="Analysis type (frame_time, memory_usage, draw_calls, batches)")
     target_platform: Optional[str] = Field(default="standalone", description="Target platform")
@@ -876,2910 +1118,1978 @@ class PerformanceAnalysisParams(BaseModel):
     benchmark_duration: Optional[float] = Field(default=30.0, description="Benchmark duration in seconds")
 
 
+# Batch Execution Parameter Models
+class BatchCommandParams(BaseModel):
+    action: str = Field(description="Unity command action name")
+    parameters: Dict[str, Any] = Field(default_factory=dict, description="Command parameters")
+
+    @field_validator("action")
+    @classmethod
+    def intern_action(cls, value: str) -> str:
+        return sys.intern(value)
+
+class BatchExecuteParams(BaseModel):
+    project_path: str = Field(description="Path to Unity project")
+    commands: List[BatchCommandParams] = Field(description="Commands to execute in order")
+    timeout_minutes: int = Field(default=5, description="Timeout for the whole batch in minutes")
+
+class BulkToolCallParams(BaseModel):
+    tool: str = Field(description="Name of the tool to call")
+    params: Dict[str, Any] = Field(description="Parameters for the tool")
+
+class BulkApplyParams(BaseModel):
+    items: List[BulkToolCallParams] = Field(description="Independent tool calls to run concurrently")
+
+
+# Tool Result Types
+class ToolResult(TypedDict, total=False):
+    """Fields shared by every tool response"""
+    success: bool
+    data: Any
+    error: str
+
+class ComponentCopyResult(ToolResult, total=False):
+    source_object_path: str
+    target_object_path: str
+    component_type: str
+
+class ComponentSerializeResult(ToolResult, total=False):
+    object_path: str
+    component_type: str
+    output_path: str
+
+class ComponentDeserializeResult(ToolResult, total=False):
+    object_path: str
+    input_path: str
+
+class ComponentValidateResult(ToolResult, total=False):
+    object_path: Optional[str]
+    component_type: Optional[str]
+
+class ComponentResetResult(ToolResult, total=False):
+    object_path: str
+    component_type: str
+
+class ComponentEnableResult(ToolResult, total=False):
+    object_path: str
+    component_type: str
+    enabled: bool
+
+class AssetImportResult(ToolResult, total=False):
+    asset_path: str
+
+class AssetExportResult(ToolResult, total=False):
+    asset_path: str
+    export_path: str
+
+class AssetDatabaseRefreshResult(ToolResult, total=False):
+    force_refresh: bool
+
+class AssetSearchResult(ToolResult, total=False):
+    search_filter: str
+
+class AssetMoveResult(ToolResult, total=False):
+    source_path: str
+    destination_path: str
+
+class AssetDeleteResult(ToolResult, total=False):
+    asset_path: str
+
+class TextureImportResult(ToolResult, total=False):
+    texture_path: str
+    texture_type: str
+
+class MeshImportResult(ToolResult, total=False):
+    mesh_path: str
+    scale_factor: float
+
+class AudioImportResult(ToolResult, total=False):
+    audio_path: str
+    audio_format: str
+
+class AssetBundleCreateResult(ToolResult, total=False):
+    bundle_name: str
+    output_path: str
+
+class AssetBundleBuildResult(ToolResult, total=False):
+    output_path: str
+    build_target: str
+
+class AssetBundleBuildPipelineResult(ToolResult, total=False):
+    bundle_name: str
+    output_path: str
+    build_target: str
+    stages: List[str]
+
+class AssetDependencyResult(ToolResult, total=False):
+    asset_path: str
+    include_indirect: bool
+
+class AssetMetadataResult(ToolResult, total=False):
+    asset_path: str
+    metadata_key: Optional[str]
+
+class AssetValidateResult(ToolResult, total=False):
+    asset_path: Optional[str]
+    validation_type: str
+
+class AssetOptimizeResult(ToolResult, total=False):
+    asset_path: Optional[str]
+    optimization_type: str
+
+class AnimationClipCreateResult(ToolResult, total=False):
+    clip_name: str
+    duration: float
+
+class AnimationClipEditResult(ToolResult, total=False):
+    clip_path: str
+    property_path: str
+
+class AnimatorControllerCreateResult(ToolResult, total=False):
+    controller_name: str
+    output_path: str
+
+class AnimatorStateResult(ToolResult, total=False):
+    state_name: str
+    layer_name: str
+
+class AnimatorTransitionResult(ToolResult, total=False):
+    from_state: str
+    to_state: str
+
+class TimelineCreateResult(ToolResult, total=False):
+    timeline_name: str
+    output_path: str
+
+class TimelineTrackResult(ToolResult, total=False):
+    track_name: str
+    track_type: str
+
+
+# Asset Bundle Pipeline Stages
+def _asset_bundle_create_stage(params) -> Dict[str, Any]:
+    return {
+        "action": "assetbundle.create",
+        "parameters": {
+            "bundleName": params.bundle_name,
+            "assetPaths": PackedStringArray.from_strings(params.asset_paths).to_wire(),
+            "buildTarget": params.build_target,
+            "outputPath": params.output_path
+        }
+    }
+
+
+def _asset_bundle_build_stage(params) -> Dict[str, Any]:
+    return {
+        "action": "assetbundle.build",
+        "parameters": {
+            "outputPath": params.output_path,
+            "buildTarget": params.build_target,
+            "buildOptions": params.build_options or []
+        }
+    }
+
+
+def _asset_database_refresh_stage(params) -> Dict[str, Any]:
+    return {
+        "action": "asset.database.refresh",
+        "parameters": {
+            "forceRefresh": params.force_refresh,
+            "importMode": params.import_mode
+        }
+    }
+
+
+# Command Tool Table
+# (tool name, params model, description, failure log message) for tools that
+# forward their parameters to Unity unchanged; see _make_command_tool.
+COMMAND_TOOLS: Tuple[Tuple[str, Type[UnityCommandParams], str, str], ...] = (
+    # Physics & Collision
+    ("rigidbody_configure", RigidbodyParams, "Configure Rigidbody component properties", "Error configuring rigidbody"),
+    ("collider_manage", ColliderParams, "Add, modify, or configure collider components", "Error managing collider"),
+    ("physics_material_create", PhysicsMaterialParams, "Create and configure physics materials", "Error creating physics material"),
+    ("joint_configure", JointParams, "Configure joint components and connections", "Error configuring joint"),
+    ("physics_simulation_settings", PhysicsSimulationParams, "Configure global physics simulation settings", "Error configuring physics simulation"),
+    ("physics_raycast", RaycastParams, "Perform physics raycasting operations", "Error performing raycast"),
+    ("physics_raycast_many", RaycastBatchParams, "Perform many physics raycasts in a single Unity command", "Error performing raycast batch"),
+    ("physics_debug", PhysicsDebugParams, "Configure physics debugging and visualization", "Error configuring physics debug"),
+
+    # Rendering & Graphics
+    ("material_create", MaterialParams, "Create and configure materials", "Error creating material"),
+    ("shader_create", ShaderParams, "Create and manage shaders", "Error creating shader"),
+    ("camera_configure", CameraParams, "Configure camera settings and properties", "Error configuring camera"),
+    ("lighting_setup", LightingParams, "Setup and configure lighting", "Error setting up lighting"),
+    ("postprocessing_configure", PostProcessingParams, "Configure post-processing effects", "Error configuring post-processing"),
+    ("render_pipeline_setup", RenderPipelineParams, "Setup and configure render pipeline", "Error setting up render pipeline"),
+    ("texture_configure", TextureParams, "Configure texture import settings", "Error configuring texture"),
+    ("mesh_configure", MeshParams, "Configure mesh import settings", "Error configuring mesh"),
+    ("lod_setup", LODParams, "Setup Level of Detail (LOD) groups", "Error setting up LOD"),
+    ("culling_configure", CullingParams, "Configure rendering culling settings", "Error configuring culling"),
+
+    # Audio System
+    ("audio_source_configure", AudioSourceParams, "Configure AudioSource component properties", "Error configuring audio source"),
+    ("audio_clip_configure", AudioClipParams, "Configure audio clip import settings", "Error configuring audio clip"),
+    ("audio_mixer_create", AudioMixerParams, "Create and configure audio mixer", "Error creating audio mixer"),
+    ("audio_3d_configure", Audio3DParams, "Configure 3D audio settings", "Error configuring 3D audio"),
+    ("reverb_zone_configure", ReverbZoneParams, "Configure AudioReverbZone component", "Error configuring reverb zone"),
+    ("audio_listener_configure", AudioListenerParams, "Configure AudioListener component", "Error configuring audio listener"),
+    ("audio_streaming_configure", AudioStreamingParams, "Configure audio streaming settings", "Error configuring audio streaming"),
+    ("audio_compression_configure", AudioCompressionParams, "Configure audio compression settings", "Error configuring audio compression"),
+
+    # UI System
+    ("canvas_configure", CanvasParams, "Configure Canvas component and settings", "Error configuring canvas"),
+    ("ui_element_create", UIElementParams, "Create and configure UI elements", "Error creating UI element"),
+    ("event_system_configure", EventSystemParams, "Configure EventSystem for UI input handling", "Error configuring event system"),
+    ("layout_group_configure", LayoutGroupParams, "Configure layout groups for UI organization", "Error configuring layout group"),
+    ("ui_animation_create", UIAnimationParams, "Create UI animations and transitions", "Error creating UI animation"),
+
+    # Build System
+    ("build_player", BuildPlayerParams, "Build Unity player for target platform", "Error building player"),
+    ("build_settings_configure", BuildSettingsParams, "Configure build settings and player settings", "Error configuring build settings"),
+    ("platform_switch", PlatformSwitchParams, "Switch Unity project to target platform", "Error switching platform"),
+
+    # Scripting & Code Generation
+    ("script_template_create", ScriptTemplateParams, "Create script from template", "Error creating script from template"),
+    ("code_analysis_run", CodeAnalysisParams, "Run code analysis on Unity project", "Error running code analysis"),
+    ("code_refactor", CodeRefactorParams, "Perform code refactoring operations", "Error performing code refactoring"),
+    ("documentation_generate", DocumentationParams, "Generate code documentation", "Error generating documentation"),
+
+    # Performance & Profiling
+    ("profiler_data_collect", ProfilerDataParams, "Collect Unity profiler data", "Error collecting profiler data"),
+    ("performance_analysis_run", PerformanceAnalysisParams, "Run performance analysis on Unity project", "Error running performance analysis"),
+)
+
+
+def _forget_patched_project(params: CodegenApplyParams):
+    # An applied patch may change the project layout
+    if not params.preview_only:
+        config.forget_unity_project_path(params.project_path)
+
+
+# Oversized workflow results are written here, relative to the project
+RESULT_SPILL_DIR = Path("Temp") / "mcp_results"
+
+
+def _spill_large_data(project_path: str, action: str, data: Any) -> Optional[Dict[str, Any]]:
+    """Write data to a file under RESULT_SPILL_DIR if its JSON form is larger
+    than config.max_inline_result_bytes
+
+    Returns the response fields that replace "data", or None to return data
+    inline.
+    """
+    encoded = orjson.dumps(data)
+    if len(encoded) <= config.max_inline_result_bytes:
+        return None
+    
+    spill_path = Path(project_path) / RESULT_SPILL_DIR / f"{action}_{uuid.uuid4().hex}.json"
+    spill_path.parent.mkdir(parents=True, exist_ok=True)
+    spill_path.write_bytes(encoded)
+    
+    summary: Dict[str, Any] = {"bytes": len(encoded)}
+    if isinstance(data, dict):
+        summary["counts"] = {
+            key: len(value) for key, value in data.items() if isinstance(value, (list, dict))
+        }
+    elif isinstance(data, list):
+        summary["count"] = len(data)
+    return {"data_ref": str(spill_path), "summary": summary}
+
+
+# Text parameters at least this long are handed to Unity as a temp file path
+HANDOFF_TEXT_MIN_CHARS = 65536
+
+
+def _write_handoff_file(text: str) -> str:
+    """Write text to a new temp file for Unity to read; the caller removes it"""
+    fd, path = tempfile.mkstemp(prefix="unity_mcp_", suffix=".patch")
+    with os.fdopen(fd, "w", encoding="utf-8") as handoff:
+        handoff.write(text)
+    return path
+
+
+def _remove_handoff_file(path: str):
+    try:
+        os.unlink(path)
+    except OSError as e:
+        logger.warning("Could not remove %s: %s", path, e)
+
+
+class WorkflowTool(NamedTuple):
+    """A project workflow tool; see _make_workflow_tool"""
+    name: str
+    action: str
+    params_model: Type[WorkflowParams]
+    description: str
+    log_message: str
+    log_fields: Tuple[str, ...]
+    failure_message: str
+    # (field, Unity parameter name) pairs sent to Unity
+    parameter_keys: Tuple[Tuple[str, str], ...]
+    # Fields echoed back in the response next to "data"
+    result_fields: Tuple[str, ...] = ()
+    validate_project: bool = False
+    # Called with the params once Unity reports Success
+    on_success: Optional[Callable[[Any], None]] = None
+    # Write results over config.max_inline_result_bytes to a file; see _spill_large_data
+    spill_large_data: bool = False
+    # (field, inline parameter name, file path parameter name) for text fields
+    # sent as a temp file once at least HANDOFF_TEXT_MIN_CHARS long
+    handoff_fields: Tuple[Tuple[str, str, str], ...] = ()
+
+
+# Workflow Tool Table
+WORKFLOW_TOOLS: Tuple[WorkflowTool, ...] = (
+    WorkflowTool(
+        "project_scan", "project.scan", ProjectScanParams,
+        "Scan Unity project structure and return file metadata",
+        "Scanning Unity project: %s", ("project_path",), "Project scan failed",
+        (("patterns", "patterns"), ("include_assets", "includeAssets"), ("max_depth", "maxDepth")),
+        result_fields=("project_path", "patterns"),
+        validate_project=True,
+        spill_large_data=True
+    ),
+    WorkflowTool(
+        "build_run", "build.run", BuildRunParams,
+        "Execute Unity build for specified platform and configuration",
+        "Starting Unity build: %s for %s", ("target", "project_path"), "Unity build failed",
+        (
+            ("target", "target"),
+            ("scripting_backend", "scriptingBackend"),
+            ("development_build", "developmentBuild"),
+            ("output_path", "outputPath")
+        ),
+        result_fields=("target", "output_path"),
+        validate_project=True
+    ),
+    WorkflowTool(
+        "test_run", "test.run", TestRunParams,
+        "Run Unity PlayMode or EditMode tests and return results",
+        "Running %s tests for %s", ("test_mode", "project_path"), "Test run failed",
+        (
+            ("test_mode", "test_mode"),
+            ("filters", "filters"),
+            ("output_path", "output_path"),
+            ("collect_coverage", "collect_coverage")
+        ),
+        result_fields=("test_mode", "output_path")
+    ),
+    WorkflowTool(
+        "scene_validate", "scene.validate", SceneValidateParams,
+        "Validate Unity scenes for common issues and missing references",
+        "Validating scenes for %s", ("project_path",), "Scene validation failed",
+        (
+            ("scene_paths", "scenePaths"),
+            ("check_missing_scripts", "checkMissingScripts"),
+            ("check_lightmaps", "checkLightmaps")
+        ),
+        result_fields=("scene_paths",)
+    ),
+    WorkflowTool(
+        "asset_audit", "asset.audit", AssetAuditParams,
+        "Audit Unity assets for optimization opportunities",
+        "Auditing assets for %s", ("project_path",), "Asset audit failed",
+        (
+            ("asset_types", "assetTypes"),
+            ("check_import_settings", "checkImportSettings"),
+            ("check_optimization", "checkOptimization")
+        ),
+        result_fields=("asset_types",),
+        spill_large_data=True
+    ),
+    WorkflowTool(
+        "codegen_apply", "codegen.apply", CodegenApplyParams,
+        "Apply code generation patches to Unity C# scripts",
+        "Applying code patch to %s", ("file_path",), "Code generation failed",
+        (("file_path", "filePath"), ("patch_content", "patchContent"), ("preview_only", "previewOnly")),
+        result_fields=("file_path", "preview_only"),
+        on_success=_forget_patched_project,
+        handoff_fields=(("patch_content", "patchContent", "patchContentPath"),)
+    ),
+    WorkflowTool(
+        "editor_exec", "editor.exec", EditorExecParams,
+        "Execute Unity Editor methods and custom tools safely",
+        "Executing Unity Editor method: %s", ("method_name",), "Editor execution failed",
+        (("method_name", "methodName"), ("parameters", "parameters")),
+        result_fields=("method_name",)
+    ),
+    WorkflowTool(
+        "perf_profile", "perf.profile", PerfProfileParams,
+        "Capture Unity profiler data and performance snapshots",
+        "Starting performance profiling for %s", ("project_path",), "Performance profiling failed",
+        (("scene_path", "scenePath"), ("duration_seconds", "durationSeconds"), ("output_path", "outputPath")),
+        result_fields=("scene_path", "output_path"),
+        spill_large_data=True
+    ),
+)
+
+
+def _ok(data: Any, **fields: Any) -> Dict[str, Any]:
+    """Successful tool response: data plus any tool-specific fields"""
+    return {"success": True, "data": data, **fields}
+
+
+def _err(error: Any) -> Dict[str, Any]:
+    """Failed tool response for an exception or message"""
+    return {"success": False, "error": str(error)}
+
+
+def _unity_failure(result: Dict[str, Any], failure_message: str) -> Dict[str, Any]:
+    """Failed tool response for a Unity result without Success, logged like
+    an exception caught by safe_tool"""
+    error = result.get("Error") or failure_message
+    logger.error("%s: %s", failure_message, error)
+    return _err(error)
+
+
+def safe_tool(failure_message: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Decorate a tool so an exception is logged as "<failure_message>: <error>"
+    and returned as a failed tool response"""
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @wraps(func)
+        async def wrapper(params: BaseModel) -> Any:
+            try:
+                return await func(params)
+            except Exception as e:
+                logger.error("%s: %s", failure_message, e)
+                return _err(e)
+        return wrapper
+    return decorator
+
+
 def register_tools(mcp: FastMCP, unity_manager: UnityManager):
     """Register all Unity MCP tools"""
     
-    @mcp.tool()
-    async def project_scan(params: ProjectScanParams) -> Dict[str, Any]:
-        """Scan Unity project structure and return file metadata"""
-        try:
-            logger.info(f"Scanning Unity project: {params.project_path}")
-            
-            # Validate project path
-            if not config.validate_unity_project_path(params.project_path):
-                return {
-                    "success": False,
-                    "error": f"Invalid Unity project path: {params.project_path}"
-                }
-            
-            # Execute Unity command
-            result = await unity_manager.execute_unity_command(
-                action="project.scan",
-                project_path=params.project_path,
-                parameters={
-                    "patterns": params.patterns,
-                    "includeAssets": params.include_assets,
-                    "maxDepth": params.max_depth
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "project_path": params.project_path,
-                "patterns": params.patterns
-            }
-            
-        except Exception as e:
-            logger.error(f"Project scan failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def build_run(params: BuildRunParams) -> Dict[str, Any]:
-        """Execute Unity build for specified platform and configuration"""
-        try:
-            logger.info(f"Starting Unity build: {params.target} for {params.project_path}")
-            
-            # Validate project path
-            if not config.validate_unity_project_path(params.project_path):
-                return {
-                    "success": False,
-                    "error": f"Invalid Unity project path: {params.project_path}"
-                }
-            
-            # Execute Unity build command
-            result = await unity_manager.execute_unity_command(
-                action="build.run",
-                project_path=params.project_path,
-                parameters={
-                    "target": params.target,
-                    "scriptingBackend": params.scripting_backend,
-                    "developmentBuild": params.development_build,
-                    "outputPath": params.output_path
-                },
-                timeout=params.timeout_minutes * 60
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "target": params.target,
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Unity build failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def test_playmode(params: TestRunParams) -> Dict[str, Any]:
-        """Run Unity PlayMode tests and return results"""
-        try:
-            logger.info(f"Running PlayMode tests for {params.project_path}")
-            
-            test_params = params.dict()
-            test_params["test_mode"] = "playmode"
-            
-            result = await unity_manager.execute_unity_command(
-                action="test.run",
-                project_path=params.project_path,
-                parameters=test_params,
-                timeout=params.timeout_minutes * 60
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "test_mode": "playmode",
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"PlayMode tests failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def test_editmode(params: TestRunParams) -> Dict[str, Any]:
-        """Run Unity EditMode tests and return results"""
-        try:
-            logger.info(f"Running EditMode tests for {params.project_path}")
-            
-            test_params = params.dict()
-            test_params["test_mode"] = "editmode"
-            
-            result = await unity_manager.execute_unity_command(
-                action="test.run",
-                project_path=params.project_path,
-                parameters=test_params,
-                timeout=params.timeout_minutes * 60
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "test_mode": "editmode",
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"EditMode tests failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def scene_validate(params: SceneValidateParams) -> Dict[str, Any]:
-        """Validate Unity scenes for common issues and missing references"""
-        try:
-            logger.info(f"Validating scenes for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.validate",
-                project_path=params.project_path,
-                parameters={
-                    "scenePaths": params.scene_paths,
-                    "checkMissingScripts": params.check_missing_scripts,
-                    "checkLightmaps": params.check_lightmaps
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_paths": params.scene_paths
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene validation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_audit(params: AssetAuditParams) -> Dict[str, Any]:
-        """Audit Unity assets for optimization opportunities"""
-        try:
-            logger.info(f"Auditing assets for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.audit",
-                project_path=params.project_path,
-                parameters={
-                    "assetTypes": params.asset_types,
-                    "checkImportSettings": params.check_import_settings,
-                    "checkOptimization": params.check_optimization
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_types": params.asset_types
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset audit failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def codegen_apply(params: CodegenApplyParams) -> Dict[str, Any]:
-        """Apply code generation patches to Unity C# scripts"""
-        try:
-            logger.info(f"Applying code patch to {params.file_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="codegen.apply",
-                project_path=params.project_path,
-                parameters={
-                    "filePath": params.file_path,
-                    "patchContent": params.patch_content,
-                    "previewOnly": params.preview_only
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "file_path": params.file_path,
-                "preview_only": params.preview_only
-            }
-            
-        except Exception as e:
-            logger.error(f"Code generation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def editor_exec(params: EditorExecParams) -> Dict[str, Any]:
-        """Execute Unity Editor methods and custom tools safely"""
-        try:
-            logger.info(f"Executing Unity Editor method: {params.method_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="editor.exec",
-                project_path=params.project_path,
-                parameters={
-                    "methodName": params.method_name,
-                    "parameters": params.parameters or {}
-                },
-                timeout=params.timeout_minutes * 60
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "method_name": params.method_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Editor execution failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def perf_profile(params: PerfProfileParams) -> Dict[str, Any]:
-        """Capture Unity profiler data and performance snapshots"""
-        try:
-            logger.info(f"Starting performance profiling for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="perf.profile",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "durationSeconds": params.duration_seconds,
-                    "outputPath": params.output_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path,
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Performance profiling failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+    # Registered tool coroutines by name, used by bulk_apply
+    tools: Dict[str, Callable[[BaseModel], Awaitable[Any]]] = {}
+    
+    def _tool(func):
+        """Register func as an MCP tool and record it for bulk_apply"""
+        tools[func.__name__] = func
+        return mcp.tool()(func)
+    
+    # Project workflow tools generated from WORKFLOW_TOOLS
+    def _make_workflow_tool(spec: WorkflowTool) -> Callable[[WorkflowParams], Awaitable[ToolResult]]:
+        """Build a tool that sends spec.parameter_keys of params to Unity"""
+        async def workflow_tool(params: WorkflowParams) -> ToolResult:
+            logger.info(spec.log_message, *[getattr(params, name) for name in spec.log_fields])
+            
+            if spec.validate_project and not config.validate_unity_project_path(params.project_path):
+                return _err(f"Invalid Unity project path: {params.project_path}")
+            
+            parameters = {unity_key: getattr(params, name) for name, unity_key in spec.parameter_keys}
+            handoff_paths = []
+            for name, inline_key, path_key in spec.handoff_fields:
+                text = getattr(params, name)
+                if len(text) >= HANDOFF_TEXT_MIN_CHARS:
+                    del parameters[inline_key]
+                    parameters[path_key] = await asyncio.to_thread(_write_handoff_file, text)
+                    handoff_paths.append(parameters[path_key])
+            
+            options = {"timeout": params.timeout_seconds} if isinstance(params, TimedWorkflowParams) else {}
+            try:
+                result = await unity_manager.execute_unity_command(
+                    action=spec.action,
+                    project_path=params.project_path,
+                    parameters=parameters,
+                    **options
+                )
+            finally:
+                for path in handoff_paths:
+                    _remove_handoff_file(path)
+            if not result.get("Success"):
+                return _unity_failure(result, spec.failure_message)
+            if spec.on_success is not None:
+                spec.on_success(params)
+            
+            data = result.get("Data", _NO_DATA)
+            spilled = None
+            if spec.spill_large_data:
+                spilled = await asyncio.to_thread(_spill_large_data, params.project_path, spec.action, data)
+            
+            fields = {name: getattr(params, name) for name in spec.result_fields}
+            if spilled is None:
+                return _ok(data, **fields)
+            logger.info("%s result written to %s", spec.action, spilled["data_ref"])
+            # data_ref and summary stand in for the data
+            return _ok(None, **spilled, **fields)
+        
+        workflow_tool.__name__ = workflow_tool.__qualname__ = spec.name
+        workflow_tool.__doc__ = spec.description
+        workflow_tool.__annotations__ = {"params": spec.params_model, "return": Dict[str, Any]}
+        return safe_tool(spec.failure_message)(workflow_tool)
+    
+    for spec in WORKFLOW_TOOLS:
+        _tool(_make_workflow_tool(spec))
     
     # Scene Management Tools (10 tools)
-    @mcp.tool()
+    @_tool
+    @safe_tool("Scene load failed")
     async def scene_load(params: SceneLoadParams) -> Dict[str, Any]:
         """Load a Unity scene in the editor"""
-        try:
-            logger.info(f"Loading scene {params.scene_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.load",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "additive": params.additive
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path,
+        logger.info("Loading scene %s", params.scene_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.load",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
                 "additive": params.additive
             }
-            
-        except Exception as e:
-            logger.error(f"Scene load failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path,
+            additive=params.additive
+        )
     
-    @mcp.tool()
+    @_tool
+    @safe_tool("Scene save failed")
     async def scene_save(params: SceneSaveParams) -> Dict[str, Any]:
         """Save the current Unity scene"""
-        try:
-            logger.info(f"Saving scene for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.save",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "saveAs": params.save_as
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path or "current"
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene save failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Saving scene for %s", params.project_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.save",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
+                "saveAs": params.save_as
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path or "current"
+        )
+    
+    @_tool
+    @safe_tool("Scene creation failed")
     async def scene_create(params: SceneCreateParams) -> Dict[str, Any]:
         """Create a new Unity scene"""
-        try:
-            logger.info(f"Creating new scene {params.scene_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.create",
-                project_path=params.project_path,
-                parameters={
-                    "sceneName": params.scene_name,
-                    "template": params.template
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_name": params.scene_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Creating new scene %s", params.scene_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.create",
+            project_path=params.project_path,
+            parameters={
+                "sceneName": params.scene_name,
+                "template": params.template
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_name=params.scene_name
+        )
+    
+    @_tool
+    @safe_tool("Scene hierarchy failed")
     async def scene_hierarchy(params: SceneHierarchyParams) -> Dict[str, Any]:
         """Get Unity scene hierarchy information"""
-        try:
-            logger.info(f"Getting scene hierarchy for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.hierarchy",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "filterType": params.filter_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path or "current"
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene hierarchy failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Getting scene hierarchy for %s", params.project_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.hierarchy",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
+                "filterType": params.filter_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path or "current"
+        )
+    
+    @_tool
+    @safe_tool("Lighting settings failed")
     async def lighting_settings(params: LightingSettingsParams) -> Dict[str, Any]:
         """Configure Unity lighting settings for a scene"""
-        try:
-            logger.info(f"Configuring lighting settings for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="lighting.settings",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "settings": params.settings
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path or "current"
-            }
-            
-        except Exception as e:
-            logger.error(f"Lighting settings failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Configuring lighting settings for %s", params.project_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="lighting.settings",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
+                "settings": params.settings
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path or "current"
+        )
+    
+    @_tool
+    @safe_tool("Scene merge failed")
     async def scene_merge(params: SceneMergeParams) -> Dict[str, Any]:
         """Merge two Unity scenes together"""
-        try:
-            logger.info(f"Merging scenes {params.source_scene} into {params.target_scene}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.merge",
-                project_path=params.project_path,
-                parameters={
-                    "sourceScene": params.source_scene,
-                    "targetScene": params.target_scene,
-                    "mergeMode": params.merge_mode
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "source_scene": params.source_scene,
-                "target_scene": params.target_scene
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene merge failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Merging scenes %s into %s", params.source_scene, params.target_scene)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.merge",
+            project_path=params.project_path,
+            parameters={
+                "sourceScene": params.source_scene,
+                "targetScene": params.target_scene,
+                "mergeMode": params.merge_mode
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            source_scene=params.source_scene,
+            target_scene=params.target_scene
+        )
+    
+    @_tool
+    @safe_tool("Scene comparison failed")
     async def scene_compare(params: SceneCompareParams) -> Dict[str, Any]:
         """Compare two Unity scenes and find differences"""
-        try:
-            logger.info(f"Comparing scenes {params.scene_a} and {params.scene_b}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.compare",
-                project_path=params.project_path,
-                parameters={
-                    "sceneA": params.scene_a,
-                    "sceneB": params.scene_b,
-                    "compareType": params.compare_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_a": params.scene_a,
-                "scene_b": params.scene_b
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene comparison failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Comparing scenes %s and %s", params.scene_a, params.scene_b)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.compare",
+            project_path=params.project_path,
+            parameters={
+                "sceneA": params.scene_a,
+                "sceneB": params.scene_b,
+                "compareType": params.compare_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_a=params.scene_a,
+            scene_b=params.scene_b
+        )
+    
+    @_tool
+    @safe_tool("Scene optimization failed")
     async def scene_optimize(params: SceneOptimizeParams) -> Dict[str, Any]:
         """Optimize Unity scene for better performance"""
-        try:
-            logger.info(f"Optimizing scene {params.scene_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.optimize",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "optimizationLevel": params.optimization_level
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path,
-                "optimization_level": params.optimization_level
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene optimization failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Optimizing scene %s", params.scene_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.optimize",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
+                "optimizationLevel": params.optimization_level
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path,
+            optimization_level=params.optimization_level
+        )
+    
+    @_tool
+    @safe_tool("Scene backup failed")
     async def scene_backup(params: SceneBackupParams) -> Dict[str, Any]:
         """Create a backup of Unity scene"""
-        try:
-            logger.info(f"Creating backup of scene {params.scene_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.backup",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "backupPath": params.backup_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path,
-                "backup_path": params.backup_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene backup failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Creating backup of scene %s", params.scene_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.backup",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
+                "backupPath": params.backup_path
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path,
+            backup_path=params.backup_path
+        )
+    
+    @_tool
+    @safe_tool("Scene statistics failed")
     async def scene_statistics(params: SceneStatisticsParams) -> Dict[str, Any]:
         """Get detailed statistics about Unity scene"""
-        try:
-            logger.info(f"Getting scene statistics for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="scene.statistics",
-                project_path=params.project_path,
-                parameters={
-                    "scenePath": params.scene_path,
-                    "includeAssets": params.include_assets
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "scene_path": params.scene_path or "current"
-            }
-            
-        except Exception as e:
-            logger.error(f"Scene statistics failed: {e}")
-            return {
-                 "success": False,
-                 "error": str(e)
-             }
+        logger.info("Getting scene statistics for %s", params.project_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="scene.statistics",
+            project_path=params.project_path,
+            parameters={
+                "scenePath": params.scene_path,
+                "includeAssets": params.include_assets
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            scene_path=params.scene_path or "current"
+        )
     
     # GameObject Operations Tools (15 tools)
-    @mcp.tool()
+    @_tool
+    @safe_tool("GameObject creation failed")
     async def gameobject_create(params: GameObjectCreateParams) -> Dict[str, Any]:
         """Create a new GameObject in Unity scene"""
-        try:
-            logger.info(f"Creating GameObject {params.name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.create",
-                project_path=params.project_path,
-                parameters={
-                    "name": params.name,
-                    "parentPath": params.parent_path,
-                    "primitiveType": params.primitive_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
+        logger.info("Creating GameObject %s", params.name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.create",
+            project_path=params.project_path,
+            parameters={
                 "name": params.name,
-                "parent_path": params.parent_path
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+                "parentPath": params.parent_path,
+                "primitiveType": params.primitive_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            name=params.name,
+            parent_path=params.parent_path
+        )
+    
+    @_tool
+    @safe_tool("GameObject deletion failed")
     async def gameobject_delete(params: GameObjectDeleteParams) -> Dict[str, Any]:
         """Delete a GameObject from Unity scene"""
-        try:
-            logger.info(f"Deleting GameObject {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.delete",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "confirm": params.confirm
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject deletion failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Deleting GameObject %s", params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.delete",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "confirm": params.confirm
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path
+        )
+    
+    @_tool
+    @safe_tool("GameObject search failed")
     async def gameobject_find(params: GameObjectFindParams) -> Dict[str, Any]:
         """Find GameObjects in Unity scene by various criteria"""
-        try:
-            logger.info(f"Finding GameObjects with query: {params.search_query}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.find",
-                project_path=params.project_path,
-                parameters={
-                    "searchQuery": params.search_query,
-                    "searchType": params.search_type,
-                    "scenePath": params.scene_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "search_query": params.search_query,
-                "search_type": params.search_type
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject search failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Finding GameObjects with query: %s", params.search_query)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.find",
+            project_path=params.project_path,
+            parameters={
+                "searchQuery": params.search_query,
+                "searchType": params.search_type,
+                "scenePath": params.scene_path
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            search_query=params.search_query,
+            search_type=params.search_type
+        )
+    
+    @_tool
+    @safe_tool("GameObject transform failed")
     async def gameobject_transform(params: GameObjectTransformParams) -> Dict[str, Any]:
         """Modify GameObject transform (position, rotation, scale)"""
-        try:
-            logger.info(f"Transforming GameObject {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.transform",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "position": params.position,
-                    "rotation": params.rotation,
-                    "scale": params.scale
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject transform failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Transforming GameObject %s", params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.transform",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "position": params.position,
+                "rotation": params.rotation,
+                "scale": params.scale
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path
+        )
+    
+    @_tool
+    @safe_tool("GameObject parenting failed")
     async def gameobject_parent(params: GameObjectParentParams) -> Dict[str, Any]:
         """Set parent-child relationship between GameObjects"""
-        try:
-            logger.info(f"Setting parent for {params.child_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.parent",
-                project_path=params.project_path,
-                parameters={
-                    "childPath": params.child_path,
-                    "parentPath": params.parent_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "child_path": params.child_path,
-                "parent_path": params.parent_path
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject parenting failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Setting parent for %s", params.child_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.parent",
+            project_path=params.project_path,
+            parameters={
+                "childPath": params.child_path,
+                "parentPath": params.parent_path
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            child_path=params.child_path,
+            parent_path=params.parent_path
+        )
+    
+    @_tool
+    @safe_tool("GameObject duplication failed")
     async def gameobject_duplicate(params: GameObjectDuplicateParams) -> Dict[str, Any]:
         """Duplicate a GameObject in Unity scene"""
-        try:
-            logger.info(f"Duplicating GameObject {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.duplicate",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "count": params.count,
-                    "offset": params.offset
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "count": params.count
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject duplication failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Duplicating GameObject %s", params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.duplicate",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "count": params.count,
+                "offset": params.offset
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            count=params.count
+        )
+    
+    @_tool
+    @safe_tool("GameObject rename failed")
     async def gameobject_rename(params: GameObjectRenameParams) -> Dict[str, Any]:
         """Rename a GameObject in Unity scene"""
-        try:
-            logger.info(f"Renaming GameObject {params.object_path} to {params.new_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.rename",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "newName": params.new_name
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "new_name": params.new_name
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject rename failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Renaming GameObject %s to %s", params.object_path, params.new_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.rename",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "newName": params.new_name
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            new_name=params.new_name
+        )
+    
+    @_tool
+    @safe_tool("GameObject tag setting failed")
     async def gameobject_tag(params: GameObjectTagParams) -> Dict[str, Any]:
         """Set tag for a GameObject"""
-        try:
-            logger.info(f"Setting tag {params.tag} for {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.tag",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "tag": params.tag
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
+        logger.info("Setting tag %s for %s", params.tag, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.tag",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
                 "tag": params.tag
             }
-            
-        except Exception as e:
-            logger.error(f"GameObject tag setting failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            tag=params.tag
+        )
     
-    @mcp.tool()
+    @_tool
+    @safe_tool("GameObject layer setting failed")
     async def gameobject_layer(params: GameObjectLayerParams) -> Dict[str, Any]:
         """Set layer for a GameObject"""
-        try:
-            logger.info(f"Setting layer {params.layer} for {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.layer",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "layer": params.layer
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
+        logger.info("Setting layer %s for %s", params.layer, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.layer",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
                 "layer": params.layer
             }
-            
-        except Exception as e:
-            logger.error(f"GameObject layer setting failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            layer=params.layer
+        )
     
-    @mcp.tool()
+    @_tool
+    @safe_tool("GameObject active setting failed")
     async def gameobject_active(params: GameObjectActiveParams) -> Dict[str, Any]:
         """Set active state for a GameObject"""
-        try:
-            logger.info(f"Setting active {params.active} for {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.active",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "active": params.active
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
+        logger.info("Setting active %s for %s", params.active, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.active",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
                 "active": params.active
             }
-            
-        except Exception as e:
-            logger.error(f"GameObject active setting failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            active=params.active
+        )
     
-    @mcp.tool()
+    @_tool
+    @safe_tool("Prefab creation failed")
     async def prefab_create(params: PrefabCreateParams) -> Dict[str, Any]:
         """Create a prefab from a GameObject"""
-        try:
-            logger.info(f"Creating prefab from {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="prefab.create",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "prefabPath": params.prefab_path,
-                    "replaceOriginal": params.replace_original
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "prefab_path": params.prefab_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Prefab creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Creating prefab from %s", params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="prefab.create",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "prefabPath": params.prefab_path,
+                "replaceOriginal": params.replace_original
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            prefab_path=params.prefab_path
+        )
+    
+    @_tool
+    @safe_tool("Prefab instantiation failed")
     async def prefab_instantiate(params: PrefabInstantiateParams) -> Dict[str, Any]:
         """Instantiate a prefab in Unity scene"""
-        try:
-            logger.info(f"Instantiating prefab {params.prefab_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="prefab.instantiate",
-                project_path=params.project_path,
-                parameters={
-                    "prefabPath": params.prefab_path,
-                    "parentPath": params.parent_path,
-                    "position": params.position,
-                    "rotation": params.rotation
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "prefab_path": params.prefab_path,
-                "parent_path": params.parent_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Prefab instantiation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Instantiating prefab %s", params.prefab_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="prefab.instantiate",
+            project_path=params.project_path,
+            parameters={
+                "prefabPath": params.prefab_path,
+                "parentPath": params.parent_path,
+                "position": params.position,
+                "rotation": params.rotation
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            prefab_path=params.prefab_path,
+            parent_path=params.parent_path
+        )
+    
+    @_tool
+    @safe_tool("Prefab unpacking failed")
     async def prefab_unpack(params: PrefabUnpackParams) -> Dict[str, Any]:
         """Unpack a prefab instance in Unity scene"""
-        try:
-            logger.info(f"Unpacking prefab instance {params.prefab_instance_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="prefab.unpack",
-                project_path=params.project_path,
-                parameters={
-                    "prefabInstancePath": params.prefab_instance_path,
-                    "unpackMode": params.unpack_mode
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "prefab_instance_path": params.prefab_instance_path,
-                "unpack_mode": params.unpack_mode
-            }
-            
-        except Exception as e:
-            logger.error(f"Prefab unpacking failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Unpacking prefab instance %s", params.prefab_instance_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="prefab.unpack",
+            project_path=params.project_path,
+            parameters={
+                "prefabInstancePath": params.prefab_instance_path,
+                "unpackMode": params.unpack_mode
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            prefab_instance_path=params.prefab_instance_path,
+            unpack_mode=params.unpack_mode
+        )
+    
+    @_tool
+    @safe_tool("GameObject grouping failed")
     async def gameobject_group(params: GameObjectGroupParams) -> Dict[str, Any]:
         """Group multiple GameObjects under a parent"""
-        try:
-            logger.info(f"Grouping {len(params.object_paths)} GameObjects")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.group",
-                project_path=params.project_path,
-                parameters={
-                    "objectPaths": params.object_paths,
-                    "groupName": params.group_name
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_paths": params.object_paths,
-                "group_name": params.group_name
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject grouping failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Grouping %s GameObjects", len(params.object_paths))
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.group",
+            project_path=params.project_path,
+            parameters={
+                "objectPaths": params.object_paths,
+                "groupName": params.group_name
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_paths=params.object_paths,
+            group_name=params.group_name
+        )
+    
+    @_tool
+    @safe_tool("GameObject alignment failed")
     async def gameobject_align(params: GameObjectAlignParams) -> Dict[str, Any]:
         """Align multiple GameObjects"""
-        try:
-            logger.info(f"Aligning {len(params.object_paths)} GameObjects")
-            
-            result = await unity_manager.execute_unity_command(
-                action="gameobject.align",
-                project_path=params.project_path,
-                parameters={
-                    "objectPaths": params.object_paths,
-                    "alignType": params.align_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_paths": params.object_paths,
-                "align_type": params.align_type
-            }
-            
-        except Exception as e:
-            logger.error(f"GameObject alignment failed: {e}")
-            return {
-                 "success": False,
-                 "error": str(e)
-             }
+        logger.info("Aligning %s GameObjects", len(params.object_paths))
+        
+        result = await unity_manager.execute_unity_command(
+            action="gameobject.align",
+            project_path=params.project_path,
+            parameters={
+                "objectPaths": params.object_paths,
+                "alignType": params.align_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_paths=params.object_paths,
+            align_type=params.align_type
+        )
     
     # Component Management Tools (10 tools)
-    @mcp.tool()
+    @_tool
+    @safe_tool("Component addition failed")
     async def component_add(params: ComponentAddParams) -> Dict[str, Any]:
         """Add a component to a GameObject"""
-        try:
-            logger.info(f"Adding component {params.component_type} to {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.add",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type,
-                    "parameters": params.parameters or {}
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Component addition failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Adding component %s to %s", params.component_type, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.add",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type,
+                "parameters": params.parameters or {}
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type
+        )
+    
+    @_tool
+    @safe_tool("Component removal failed")
     async def component_remove(params: ComponentRemoveParams) -> Dict[str, Any]:
         """Remove a component from a GameObject"""
-        try:
-            logger.info(f"Removing component {params.component_type} from {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.remove",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type,
-                    "confirm": params.confirm
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Component removal failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Removing component %s from %s", params.component_type, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.remove",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type,
+                "confirm": params.confirm
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type
+        )
+    
+    @_tool
+    @safe_tool("Component retrieval failed")
     async def component_get(params: ComponentGetParams) -> Dict[str, Any]:
         """Get component information from a GameObject"""
-        try:
-            logger.info(f"Getting components from {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.get",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Component retrieval failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Getting components from %s", params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.get",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type
+        )
+    
+    @_tool
+    @safe_tool("Component property setting failed")
     async def component_set_property(params: ComponentSetPropertyParams) -> Dict[str, Any]:
         """Set a property value on a component"""
-        try:
-            logger.info(f"Setting property {params.property_name} on {params.component_type}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.setProperty",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type,
-                    "propertyName": params.property_name,
-                    "propertyValue": params.property_value
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type,
-                "property_name": params.property_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Component property setting failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def component_copy(params: ComponentCopyParams) -> Dict[str, Any]:
+        logger.info("Setting property %s on %s", params.property_name, params.component_type)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.setProperty",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type,
+                "propertyName": params.property_name,
+                "propertyValue": params.property_value
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type,
+            property_name=params.property_name
+        )
+    
+    @_tool
+    @safe_tool("Component copying failed")
+    async def component_copy(params: ComponentCopyParams) -> ComponentCopyResult:
         """Copy a component from one GameObject to another"""
-        try:
-            logger.info(f"Copying component {params.component_type} from {params.source_object_path} to {params.target_object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.copy",
-                project_path=params.project_path,
-                parameters={
-                    "sourceObjectPath": params.source_object_path,
-                    "targetObjectPath": params.target_object_path,
-                    "componentType": params.component_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "source_object_path": params.source_object_path,
-                "target_object_path": params.target_object_path,
-                "component_type": params.component_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Component copying failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def component_serialize(params: ComponentSerializeParams) -> Dict[str, Any]:
+        logger.info("Copying component %s from %s to %s", params.component_type, params.source_object_path, params.target_object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.copy",
+            project_path=params.project_path,
+            parameters={
+                "sourceObjectPath": params.source_object_path,
+                "targetObjectPath": params.target_object_path,
+                "componentType": params.component_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            source_object_path=params.source_object_path,
+            target_object_path=params.target_object_path,
+            component_type=params.component_type
+        )
+    
+    @_tool
+    @safe_tool("Component serialization failed")
+    async def component_serialize(params: ComponentSerializeParams) -> ComponentSerializeResult:
         """Serialize a component to file"""
-        try:
-            logger.info(f"Serializing component {params.component_type} from {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.serialize",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type,
-                    "outputPath": params.output_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type,
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Component serialization failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def component_deserialize(params: ComponentDeserializeParams) -> Dict[str, Any]:
+        logger.info("Serializing component %s from %s", params.component_type, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.serialize",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type,
+                "outputPath": params.output_path
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type,
+            output_path=params.output_path
+        )
+    
+    @_tool
+    @safe_tool("Component deserialization failed")
+    async def component_deserialize(params: ComponentDeserializeParams) -> ComponentDeserializeResult:
         """Deserialize a component from file"""
-        try:
-            logger.info(f"Deserializing component to {params.object_path} from {params.input_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.deserialize",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "inputPath": params.input_path,
-                    "overwrite": params.overwrite
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "input_path": params.input_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Component deserialization failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def component_validate(params: ComponentValidateParams) -> Dict[str, Any]:
+        logger.info("Deserializing component to %s from %s", params.object_path, params.input_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.deserialize",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "inputPath": params.input_path,
+                "overwrite": params.overwrite
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            input_path=params.input_path
+        )
+    
+    @_tool
+    @safe_tool("Component validation failed")
+    async def component_validate(params: ComponentValidateParams) -> ComponentValidateResult:
         """Validate components in scene or specific GameObject"""
-        try:
-            logger.info(f"Validating components in project {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.validate",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Component validation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def component_reset(params: ComponentResetParams) -> Dict[str, Any]:
+        logger.info("Validating components in project %s", params.project_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.validate",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type
+        )
+    
+    @_tool
+    @safe_tool("Component reset failed")
+    async def component_reset(params: ComponentResetParams) -> ComponentResetResult:
         """Reset a component to default values"""
-        try:
-            logger.info(f"Resetting component {params.component_type} on {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.reset",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type,
-                    "confirm": params.confirm
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Component reset failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def component_enable(params: ComponentEnableParams) -> Dict[str, Any]:
+        logger.info("Resetting component %s on %s", params.component_type, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.reset",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type,
+                "confirm": params.confirm
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type
+        )
+    
+    @_tool
+    @safe_tool("Component enable/disable failed")
+    async def component_enable(params: ComponentEnableParams) -> ComponentEnableResult:
         """Enable or disable a component"""
-        try:
-            logger.info(f"Setting component {params.component_type} enabled={params.enabled} on {params.object_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="component.enable",
-                project_path=params.project_path,
-                parameters={
-                    "objectPath": params.object_path,
-                    "componentType": params.component_type,
-                    "enabled": params.enabled
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "object_path": params.object_path,
-                "component_type": params.component_type,
+        logger.info("Setting component %s enabled=%s on %s", params.component_type, params.enabled, params.object_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="component.enable",
+            project_path=params.project_path,
+            parameters={
+                "objectPath": params.object_path,
+                "componentType": params.component_type,
                 "enabled": params.enabled
             }
-            
-        except Exception as e:
-            logger.error(f"Component enable/disable failed: {e}")
-            return {
-                 "success": False,
-                 "error": str(e)
-             }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            object_path=params.object_path,
+            component_type=params.component_type,
+            enabled=params.enabled
+        )
     
     # Asset Management Tools (15 tools)
-    @mcp.tool()
-    async def asset_import(params: AssetImportParams) -> Dict[str, Any]:
+    async def _run_asset_bundle_pipeline(project_path: str, stages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run asset bundle stages in order as one Unity command"""
+        return await unity_manager.execute_unity_command(
+            action="assetbundle.pipeline",
+            project_path=project_path,
+            parameters={"stages": stages}
+        )
+    
+    @_tool
+    @safe_tool("Asset import failed")
+    async def asset_import(params: AssetImportParams) -> AssetImportResult:
         """Import an asset into Unity project"""
-        try:
-            logger.info(f"Importing asset {params.asset_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.import",
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "importSettings": params.import_settings or {},
-                    "forceReimport": params.force_reimport
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset import failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_export(params: AssetExportParams) -> Dict[str, Any]:
+        logger.info("Importing asset %s", params.asset_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.import",
+            project_path=params.project_path,
+            parameters={
+                "assetPath": params.asset_path,
+                "importSettings": params.import_settings or {},
+                "forceReimport": params.force_reimport
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path
+        )
+    
+    @_tool
+    @safe_tool("Asset export failed")
+    async def asset_export(params: AssetExportParams) -> AssetExportResult:
         """Export an asset from Unity project"""
-        try:
-            logger.info(f"Exporting asset {params.asset_path} to {params.export_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.export",
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "exportPath": params.export_path,
-                    "exportFormat": params.export_format,
-                    "exportSettings": params.export_settings or {}
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path,
-                "export_path": params.export_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset export failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_database_refresh(params: AssetDatabaseRefreshParams) -> Dict[str, Any]:
+        logger.info("Exporting asset %s to %s", params.asset_path, params.export_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.export",
+            project_path=params.project_path,
+            parameters={
+                "assetPath": params.asset_path,
+                "exportPath": params.export_path,
+                "exportFormat": params.export_format,
+                "exportSettings": params.export_settings or {}
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path,
+            export_path=params.export_path
+        )
+    
+    @_tool
+    @safe_tool("Asset database refresh failed")
+    async def asset_database_refresh(params: AssetDatabaseRefreshParams) -> AssetDatabaseRefreshResult:
         """Refresh Unity Asset Database"""
-        try:
-            logger.info(f"Refreshing Asset Database for {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.database.refresh",
-                project_path=params.project_path,
-                parameters={
-                    "forceRefresh": params.force_refresh,
-                    "importMode": params.import_mode
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "force_refresh": params.force_refresh
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset database refresh failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_search(params: AssetSearchParams) -> Dict[str, Any]:
+        logger.info("Refreshing Asset Database for %s", params.project_path)
+        
+        result = await _run_asset_bundle_pipeline(
+            params.project_path,
+            [_asset_database_refresh_stage(params)]
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            force_refresh=params.force_refresh
+        )
+    
+    @_tool
+    @safe_tool("Asset search failed")
+    async def asset_search(params: AssetSearchParams) -> AssetSearchResult:
         """Search for assets in Unity project"""
-        try:
-            logger.info(f"Searching assets with filter: {params.search_filter}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.search",
-                project_path=params.project_path,
-                parameters={
-                    "searchFilter": params.search_filter,
-                    "assetType": params.asset_type,
-                    "folderPath": params.folder_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "search_filter": params.search_filter
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset search failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_move(params: AssetMoveParams) -> Dict[str, Any]:
+        logger.info("Searching assets with filter: %s", params.search_filter)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.search",
+            project_path=params.project_path,
+            parameters={
+                "searchFilter": params.search_filter,
+                "assetType": params.asset_type,
+                "folderPath": params.folder_path
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            search_filter=params.search_filter
+        )
+    
+    @_tool
+    @safe_tool("Asset move failed")
+    async def asset_move(params: AssetMoveParams) -> AssetMoveResult:
         """Move an asset to a new location"""
-        try:
-            logger.info(f"Moving asset from {params.source_path} to {params.destination_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.move",
-                project_path=params.project_path,
-                parameters={
-                    "sourcePath": params.source_path,
-                    "destinationPath": params.destination_path,
-                    "overwrite": params.overwrite
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "source_path": params.source_path,
-                "destination_path": params.destination_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset move failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_delete(params: AssetDeleteParams) -> Dict[str, Any]:
+        logger.info("Moving asset from %s to %s", params.source_path, params.destination_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.move",
+            project_path=params.project_path,
+            parameters={
+                "sourcePath": params.source_path,
+                "destinationPath": params.destination_path,
+                "overwrite": params.overwrite
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            source_path=params.source_path,
+            destination_path=params.destination_path
+        )
+    
+    @_tool
+    @safe_tool("Asset deletion failed")
+    async def asset_delete(params: AssetDeleteParams) -> AssetDeleteResult:
         """Delete an asset from Unity project"""
-        try:
-            logger.info(f"Deleting asset {params.asset_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.delete",
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "confirm": params.confirm
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset deletion failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def texture_import(params: TextureImportParams) -> Dict[str, Any]:
+        logger.info("Deleting asset %s", params.asset_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.delete",
+            project_path=params.project_path,
+            parameters={
+                "assetPath": params.asset_path,
+                "confirm": params.confirm
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path
+        )
+    
+    @_tool
+    @safe_tool("Texture import failed")
+    async def texture_import(params: TextureImportParams) -> TextureImportResult:
         """Import texture with specific settings"""
-        try:
-            logger.info(f"Importing texture {params.texture_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="texture.import",
-                project_path=params.project_path,
-                parameters={
-                    "texturePath": params.texture_path,
-                    "textureType": params.texture_type,
-                    "maxSize": params.max_size,
-                    "compression": params.compression,
-                    "generateMipmaps": params.generate_mipmaps
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "texture_path": params.texture_path,
-                "texture_type": params.texture_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Texture import failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def mesh_import(params: MeshImportParams) -> Dict[str, Any]:
+        logger.info("Importing texture %s", params.texture_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="texture.import",
+            project_path=params.project_path,
+            parameters={
+                "texturePath": params.texture_path,
+                "textureType": params.texture_type,
+                "maxSize": params.max_size,
+                "compression": params.compression,
+                "generateMipmaps": params.generate_mipmaps
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            texture_path=params.texture_path,
+            texture_type=params.texture_type
+        )
+    
+    @_tool
+    @safe_tool("Mesh import failed")
+    async def mesh_import(params: MeshImportParams) -> MeshImportResult:
         """Import mesh with specific settings"""
-        try:
-            logger.info(f"Importing mesh {params.mesh_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="mesh.import",
-                project_path=params.project_path,
-                parameters={
-                    "meshPath": params.mesh_path,
-                    "scaleFactor": params.scale_factor,
-                    "generateColliders": params.generate_colliders,
-                    "optimizeMesh": params.optimize_mesh,
-                    "importMaterials": params.import_materials
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "mesh_path": params.mesh_path,
-                "scale_factor": params.scale_factor
-            }
-            
-        except Exception as e:
-            logger.error(f"Mesh import failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def audio_import(params: AudioImportParams) -> Dict[str, Any]:
+        logger.info("Importing mesh %s", params.mesh_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="mesh.import",
+            project_path=params.project_path,
+            parameters={
+                "meshPath": params.mesh_path,
+                "scaleFactor": params.scale_factor,
+                "generateColliders": params.generate_colliders,
+                "optimizeMesh": params.optimize_mesh,
+                "importMaterials": params.import_materials
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            mesh_path=params.mesh_path,
+            scale_factor=params.scale_factor
+        )
+    
+    @_tool
+    @safe_tool("Audio import failed")
+    async def audio_import(params: AudioImportParams) -> AudioImportResult:
         """Import audio with specific settings"""
-        try:
-            logger.info(f"Importing audio {params.audio_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="audio.import",
-                project_path=params.project_path,
-                parameters={
-                    "audioPath": params.audio_path,
-                    "audioFormat": params.audio_format,
-                    "quality": params.quality,
-                    "loadType": params.load_type,
-                    "forceMono": params.force_mono
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "audio_path": params.audio_path,
-                "audio_format": params.audio_format
-            }
-            
-        except Exception as e:
-            logger.error(f"Audio import failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_bundle_create(params: AssetBundleCreateParams) -> Dict[str, Any]:
+        logger.info("Importing audio %s", params.audio_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="audio.import",
+            project_path=params.project_path,
+            parameters={
+                "audioPath": params.audio_path,
+                "audioFormat": params.audio_format,
+                "quality": params.quality,
+                "loadType": params.load_type,
+                "forceMono": params.force_mono
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            audio_path=params.audio_path,
+            audio_format=params.audio_format
+        )
+    
+    @_tool
+    @safe_tool("Asset bundle creation failed")
+    async def asset_bundle_create(params: AssetBundleCreateParams) -> AssetBundleCreateResult:
         """Create an asset bundle"""
-        try:
-            logger.info(f"Creating asset bundle {params.bundle_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="assetbundle.create",
-                project_path=params.project_path,
-                parameters={
-                    "bundleName": params.bundle_name,
-                    "assetPaths": params.asset_paths,
-                    "buildTarget": params.build_target,
-                    "outputPath": params.output_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "bundle_name": params.bundle_name,
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset bundle creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_bundle_build(params: AssetBundleBuildParams) -> Dict[str, Any]:
+        logger.info("Creating asset bundle %s", params.bundle_name)
+        
+        result = await _run_asset_bundle_pipeline(
+            params.project_path,
+            [_asset_bundle_create_stage(params)]
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            bundle_name=params.bundle_name,
+            output_path=params.output_path
+        )
+    
+    @_tool
+    @safe_tool("Asset bundle build failed")
+    async def asset_bundle_build(params: AssetBundleBuildParams) -> AssetBundleBuildResult:
         """Build all asset bundles"""
-        try:
-            logger.info(f"Building asset bundles for {params.build_target}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="assetbundle.build",
-                project_path=params.project_path,
-                parameters={
-                    "outputPath": params.output_path,
-                    "buildTarget": params.build_target,
-                    "buildOptions": params.build_options or []
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "output_path": params.output_path,
-                "build_target": params.build_target
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset bundle build failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_dependency(params: AssetDependencyParams) -> Dict[str, Any]:
+        logger.info("Building asset bundles for %s", params.build_target)
+        
+        result = await _run_asset_bundle_pipeline(
+            params.project_path,
+            [_asset_bundle_build_stage(params)]
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            output_path=params.output_path,
+            build_target=params.build_target
+        )
+    
+    @_tool
+    @safe_tool("Asset bundle pipeline failed")
+    async def asset_bundle_build_pipeline(params: AssetBundleBuildPipelineParams) -> AssetBundleBuildPipelineResult:
+        """Create, build and refresh asset bundles in a single Unity command"""
+        logger.info("Running asset bundle pipeline for %s", params.bundle_name)
+        
+        stages = [
+            _asset_bundle_create_stage(params),
+            _asset_bundle_build_stage(params)
+        ]
+        if params.refresh:
+            stages.append(_asset_database_refresh_stage(params))
+        
+        result = await _run_asset_bundle_pipeline(params.project_path, stages)
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            bundle_name=params.bundle_name,
+            output_path=params.output_path,
+            build_target=params.build_target,
+            stages=[stage["action"] for stage in stages]
+        )
+    
+    @_tool
+    @safe_tool("Asset dependency analysis failed")
+    async def asset_dependency(params: AssetDependencyParams) -> AssetDependencyResult:
         """Get asset dependencies"""
-        try:
-            logger.info(f"Getting dependencies for {params.asset_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.dependency",
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "includeIndirect": params.include_indirect
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path,
-                "include_indirect": params.include_indirect
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset dependency analysis failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_metadata(params: AssetMetadataParams) -> Dict[str, Any]:
+        logger.info("Getting dependencies for %s", params.asset_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.dependency",
+            project_path=params.project_path,
+            parameters={
+                "assetPath": params.asset_path,
+                "includeIndirect": params.include_indirect
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path,
+            include_indirect=params.include_indirect
+        )
+    
+    @_tool
+    @safe_tool("Asset metadata operation failed")
+    async def asset_metadata(params: AssetMetadataParams) -> AssetMetadataResult:
         """Get or set asset metadata"""
-        try:
-            if params.metadata_value is not None:
-                logger.info(f"Setting metadata {params.metadata_key} for {params.asset_path}")
-                action = "asset.metadata.set"
-            else:
-                logger.info(f"Getting metadata for {params.asset_path}")
-                action = "asset.metadata.get"
-            
-            result = await unity_manager.execute_unity_command(
-                action=action,
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "metadataKey": params.metadata_key,
-                    "metadataValue": params.metadata_value
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path,
-                "metadata_key": params.metadata_key
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset metadata operation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_validate(params: AssetValidateParams) -> Dict[str, Any]:
+        if params.metadata_value is not None:
+            logger.info("Setting metadata %s for %s", params.metadata_key, params.asset_path)
+            action = "asset.metadata.set"
+        else:
+            logger.info("Getting metadata for %s", params.asset_path)
+            action = "asset.metadata.get"
+        
+        result = await unity_manager.execute_unity_command(
+            action=action,
+            project_path=params.project_path,
+            parameters={
+                "assetPath": params.asset_path,
+                "metadataKey": params.metadata_key,
+                "metadataValue": params.metadata_value
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path,
+            metadata_key=params.metadata_key
+        )
+    
+    @_tool
+    @safe_tool("Asset validation failed")
+    async def asset_validate(params: AssetValidateParams) -> AssetValidateResult:
         """Validate assets for issues"""
-        try:
-            logger.info(f"Validating assets in {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.validate",
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "validationType": params.validation_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path,
-                "validation_type": params.validation_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset validation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def asset_optimize(params: AssetOptimizeParams) -> Dict[str, Any]:
+        logger.info("Validating assets in %s", params.project_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.validate",
+            project_path=params.project_path,
+            parameters={
+                "assetPath": params.asset_path,
+                "validationType": params.validation_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path,
+            validation_type=params.validation_type
+        )
+    
+    @_tool
+    @safe_tool("Asset optimization failed")
+    async def asset_optimize(params: AssetOptimizeParams) -> AssetOptimizeResult:
         """Optimize assets for better performance"""
-        try:
-            logger.info(f"Optimizing assets in {params.project_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="asset.optimize",
-                project_path=params.project_path,
-                parameters={
-                    "assetPath": params.asset_path,
-                    "optimizationType": params.optimization_type,
-                    "backup": params.backup
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "asset_path": params.asset_path,
-                "optimization_type": params.optimization_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Asset optimization failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        logger.info("Optimizing assets in %s", params.project_path)
+        
+        parameters = {
+            "assetPath": params.asset_path,
+            "optimizationType": params.optimization_type,
+            "backup": params.backup
+        }
+        
+        # Pre-scan textures in a worker process so the event loop keeps serving other tools
+        if params.optimization_type in ("all", "texture"):
+            scan_root = Path(params.project_path) / (params.asset_path or "Assets")
+            parameters["textureCandidates"] = await unity_manager.run_cpu_bound(
+                scan_texture_candidates, str(scan_root)
+            )
+        
+        result = await unity_manager.execute_unity_command(
+            action="asset.optimize",
+            project_path=params.project_path,
+            parameters=parameters
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            asset_path=params.asset_path,
+            optimization_type=params.optimization_type
+        )
 
     # Animation & Timeline Tools (10 tools)
-    @mcp.tool()
-    async def animation_clip_create(params: AnimationClipCreateParams) -> Dict[str, Any]:
+    @_tool
+    @safe_tool("Animation clip creation failed")
+    async def animation_clip_create(params: AnimationClipCreateParams) -> AnimationClipCreateResult:
         """Create a new animation clip"""
-        try:
-            logger.info(f"Creating animation clip {params.clip_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animation.clip.create",
-                project_path=params.project_path,
-                parameters={
-                    "clipName": params.clip_name,
-                    "duration": params.duration,
-                    "frameRate": params.frame_rate,
-                    "loop": params.loop
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "clip_name": params.clip_name,
-                "duration": params.duration
-            }
-            
-        except Exception as e:
-            logger.error(f"Animation clip creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def animation_clip_edit(params: AnimationClipEditParams) -> Dict[str, Any]:
+        logger.info("Creating animation clip %s", params.clip_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animation.clip.create",
+            project_path=params.project_path,
+            parameters={
+                "clipName": params.clip_name,
+                "duration": params.duration,
+                "frameRate": params.frame_rate,
+                "loop": params.loop
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            clip_name=params.clip_name,
+            duration=params.duration
+        )
+    
+    @_tool
+    @safe_tool("Animation clip edit failed")
+    async def animation_clip_edit(params: AnimationClipEditParams) -> AnimationClipEditResult:
         """Edit animation clip keyframes and curves"""
-        try:
-            logger.info(f"Editing animation clip {params.clip_path}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animation.clip.edit",
-                project_path=params.project_path,
-                parameters={
-                    "clipPath": params.clip_path,
-                    "propertyPath": params.property_path,
-                    "keyframes": params.keyframes,
-                    "curveType": params.curve_type
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "clip_path": params.clip_path,
-                "property_path": params.property_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Animation clip edit failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def animator_controller_create(params: AnimatorControllerCreateParams) -> Dict[str, Any]:
+        logger.info("Editing animation clip %s", params.clip_path)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animation.clip.edit",
+            project_path=params.project_path,
+            parameters={
+                "clipPath": params.clip_path,
+                "propertyPath": params.property_path,
+                "keyframes": params.keyframes,
+                "curveType": params.curve_type
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            clip_path=params.clip_path,
+            property_path=params.property_path
+        )
+    
+    @_tool
+    @safe_tool("Animator controller creation failed")
+    async def animator_controller_create(params: AnimatorControllerCreateParams) -> AnimatorControllerCreateResult:
         """Create a new Animator Controller"""
-        try:
-            logger.info(f"Creating animator controller {params.controller_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animator.controller.create",
-                project_path=params.project_path,
-                parameters={
-                    "controllerName": params.controller_name,
-                    "outputPath": params.output_path,
-                    "layers": params.layers or [],
-                    "parameters": params.parameters or []
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "controller_name": params.controller_name,
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Animator controller creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def animator_state(params: AnimatorStateParams) -> Dict[str, Any]:
+        logger.info("Creating animator controller %s", params.controller_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animator.controller.create",
+            project_path=params.project_path,
+            parameters={
+                "controllerName": params.controller_name,
+                "outputPath": params.output_path,
+                "layers": params.layers or [],
+                "parameters": params.parameters or []
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            controller_name=params.controller_name,
+            output_path=params.output_path
+        )
+    
+    @_tool
+    @safe_tool("Animator state operation failed")
+    async def animator_state(params: AnimatorStateParams) -> AnimatorStateResult:
         """Add or modify animator state"""
-        try:
-            logger.info(f"Managing animator state {params.state_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animator.state",
-                project_path=params.project_path,
-                parameters={
-                    "controllerPath": params.controller_path,
-                    "layerName": params.layer_name,
-                    "stateName": params.state_name,
-                    "animationClip": params.animation_clip,
-                    "position": params.position
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "state_name": params.state_name,
-                "layer_name": params.layer_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Animator state operation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def animator_transition(params: AnimatorTransitionParams) -> Dict[str, Any]:
+        logger.info("Managing animator state %s", params.state_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animator.state",
+            project_path=params.project_path,
+            parameters={
+                "controllerPath": params.controller_path,
+                "layerName": params.layer_name,
+                "stateName": params.state_name,
+                "animationClip": params.animation_clip,
+                "position": params.position
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            state_name=params.state_name,
+            layer_name=params.layer_name
+        )
+    
+    @_tool
+    @safe_tool("Animator transition creation failed")
+    async def animator_transition(params: AnimatorTransitionParams) -> AnimatorTransitionResult:
         """Create animator state transition"""
-        try:
-            logger.info(f"Creating transition from {params.from_state} to {params.to_state}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animator.transition",
-                project_path=params.project_path,
-                parameters={
-                    "controllerPath": params.controller_path,
-                    "layerName": params.layer_name,
-                    "fromState": params.from_state,
-                    "toState": params.to_state,
-                    "conditions": params.conditions or [],
-                    "duration": params.duration
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "from_state": params.from_state,
-                "to_state": params.to_state
-            }
-            
-        except Exception as e:
-            logger.error(f"Animator transition creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
+        logger.info("Creating transition from %s to %s", params.from_state, params.to_state)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animator.transition",
+            project_path=params.project_path,
+            parameters={
+                "controllerPath": params.controller_path,
+                "layerName": params.layer_name,
+                "fromState": params.from_state,
+                "toState": params.to_state,
+                "conditions": params.conditions or [],
+                "duration": params.duration
             }
-    
-    @mcp.tool()
-    async def timeline_create(params: TimelineCreateParams) -> Dict[str, Any]:
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            from_state=params.from_state,
+            to_state=params.to_state
+        )
+    
+    @_tool
+    @safe_tool("Timeline creation failed")
+    async def timeline_create(params: TimelineCreateParams) -> TimelineCreateResult:
         """Create a new Timeline asset"""
-        try:
-            logger.info(f"Creating timeline {params.timeline_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="timeline.create",
-                project_path=params.project_path,
-                parameters={
-                    "timelineName": params.timeline_name,
-                    "outputPath": params.output_path,
-                    "duration": params.duration,
-                    "frameRate": params.frame_rate
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "timeline_name": params.timeline_name,
-                "output_path": params.output_path
-            }
-            
-        except Exception as e:
-            logger.error(f"Timeline creation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
-    async def timeline_track(params: TimelineTrackParams) -> Dict[str, Any]:
+        logger.info("Creating timeline %s", params.timeline_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="timeline.create",
+            project_path=params.project_path,
+            parameters={
+                "timelineName": params.timeline_name,
+                "outputPath": params.output_path,
+                "duration": params.duration,
+                "frameRate": params.frame_rate
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            timeline_name=params.timeline_name,
+            output_path=params.output_path
+        )
+    
+    @_tool
+    @safe_tool("Timeline track operation failed")
+    async def timeline_track(params: TimelineTrackParams) -> TimelineTrackResult:
         """Add or modify timeline track"""
-        try:
-            logger.info(f"Managing timeline track {params.track_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="timeline.track",
-                project_path=params.project_path,
-                parameters={
-                    "timelinePath": params.timeline_path,
-                    "trackName": params.track_name,
-                    "trackType": params.track_type,
-                    "bindingObject": params.binding_object
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "track_name": params.track_name,
-                "track_type": params.track_type
-            }
-            
-        except Exception as e:
-            logger.error(f"Timeline track operation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Managing timeline track %s", params.track_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="timeline.track",
+            project_path=params.project_path,
+            parameters={
+                "timelinePath": params.timeline_path,
+                "trackName": params.track_name,
+                "trackType": params.track_type,
+                "bindingObject": params.binding_object
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            track_name=params.track_name,
+            track_type=params.track_type
+        )
+    
+    @_tool
+    @safe_tool("Timeline clip operation failed")
     async def timeline_clip(params: TimelineClipParams) -> Dict[str, Any]:
         """Add or modify timeline clip"""
-        try:
-            logger.info(f"Managing timeline clip {params.clip_name}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="timeline.clip",
-                project_path=params.project_path,
-                parameters={
-                    "timelinePath": params.timeline_path,
-                    "trackName": params.track_name,
-                    "clipName": params.clip_name,
-                    "startTime": params.start_time,
-                    "duration": params.duration,
-                    "assetPath": params.asset_path
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "clip_name": params.clip_name,
-                "track_name": params.track_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Timeline clip operation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Managing timeline clip %s", params.clip_name)
+        
+        result = await unity_manager.execute_unity_command(
+            action="timeline.clip",
+            project_path=params.project_path,
+            parameters={
+                "timelinePath": params.timeline_path,
+                "trackName": params.track_name,
+                "clipName": params.clip_name,
+                "startTime": params.start_time,
+                "duration": params.duration,
+                "assetPath": params.asset_path
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            clip_name=params.clip_name,
+            track_name=params.track_name
+        )
+    
+    @_tool
+    @safe_tool("Animation recording failed")
     async def animation_record(params: AnimationRecordParams) -> Dict[str, Any]:
         """Record animation from GameObject"""
-        try:
-            logger.info(f"Recording animation for {params.target_object}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animation.record",
-                project_path=params.project_path,
-                parameters={
-                    "targetObject": params.target_object,
-                    "clipName": params.clip_name,
-                    "properties": params.properties,
-                    "duration": params.duration,
-                    "autoKey": params.auto_key
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "target_object": params.target_object,
-                "clip_name": params.clip_name
-            }
-            
-        except Exception as e:
-            logger.error(f"Animation recording failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    @mcp.tool()
+        logger.info("Recording animation for %s", params.target_object)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animation.record",
+            project_path=params.project_path,
+            parameters={
+                "targetObject": params.target_object,
+                "clipName": params.clip_name,
+                "properties": params.properties,
+                "duration": params.duration,
+                "autoKey": params.auto_key
+            }
+        )
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            target_object=params.target_object,
+            clip_name=params.clip_name
+        )
+    
+    @_tool
+    @safe_tool("Animation baking failed")
     async def animation_bake(params: AnimationBakeParams) -> Dict[str, Any]:
         """Bake animation from GameObject to clip"""
-        try:
-            logger.info(f"Baking animation from {params.source_object}")
-            
-            result = await unity_manager.execute_unity_command(
-                action="animation.bake",
-                project_path=params.project_path,
-                parameters={
-                    "sourceObject": params.source_object,
-                    "targetClip": params.target_clip,
-                    "frameRange": params.frame_range,
-                    "sampleRate": params.sample_rate,
-                    "bakePose": params.bake_pose
-                }
-            )
-            
-            return {
-                "success": True,
-                "data": result.get("Data", {}),
-                "source_object": params.source_object,
-                "target_clip": params.target_clip
-            }
-            
-        except Exception as e:
-            logger.error(f"Animation baking failed: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
-
-    # Physics & Collision Tools (8 tools)
-    @mcp.tool()
-    async def rigidbody_configure(params: RigidbodyParams) -> str:
-        """Configure Rigidbody component properties"""
-        try:
-            command = {
-                "action": "rigidbody_configure",
-                "gameobject_path": params.gameobject_path,
-                "mass": params.mass,
-                "drag": params.drag,
-                "angular_drag": params.angular_drag,
-                "use_gravity": params.use_gravity,
-                "is_kinematic": params.is_kinematic,
-                "freeze_rotation": params.freeze_rotation
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Rigidbody configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring rigidbody: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def collider_manage(params: ColliderParams) -> str:
-        """Add, modify, or configure collider components"""
-        try:
-            command = {
-                "action": "collider_manage",
-                "gameobject_path": params.gameobject_path,
-                "collider_type": params.collider_type,
-                "is_trigger": params.is_trigger,
-                "material": params.material,
-                "size": params.size,
-                "center": params.center
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Collider managed: {result}"
-        except Exception as e:
-            logger.error(f"Error managing collider: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def physics_material_create(params: PhysicsMaterialParams) -> str:
-        """Create and configure physics materials"""
-        try:
-            command = {
-                "action": "physics_material_create",
-                "material_name": params.material_name,
-                "output_path": params.output_path,
-                "dynamic_friction": params.dynamic_friction,
-                "static_friction": params.static_friction,
-                "bounciness": params.bounciness,
-                "friction_combine": params.friction_combine,
-                "bounce_combine": params.bounce_combine
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Physics material created: {result}"
-        except Exception as e:
-            logger.error(f"Error creating physics material: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def joint_configure(params: JointParams) -> str:
-        """Configure joint components and connections"""
-        try:
-            command = {
-                "action": "joint_configure",
-                "gameobject_path": params.gameobject_path,
-                "joint_type": params.joint_type,
-                "connected_body": params.connected_body,
-                "anchor": params.anchor,
-                "axis": params.axis,
-                "limits": params.limits,
-                "spring": params.spring
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Joint configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring joint: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def physics_simulation_settings(params: PhysicsSimulationParams) -> str:
-        """Configure global physics simulation settings"""
-        try:
-            command = {
-                "action": "physics_simulation_settings",
-                "gravity": params.gravity,
-                "default_material": params.default_material,
-                "bounce_threshold": params.bounce_threshold,
-                "sleep_threshold": params.sleep_threshold,
-                "default_contact_offset": params.default_contact_offset,
-                "solver_iterations": params.solver_iterations,
-                "solver_velocity_iterations": params.solver_velocity_iterations
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Physics simulation settings configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring physics simulation: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def physics_raycast(params: RaycastParams) -> str:
-        """Perform physics raycasting operations"""
-        try:
-            command = {
-                "action": "physics_raycast",
-                "origin": params.origin,
-                "direction": params.direction,
-                "max_distance": params.max_distance,
-                "layer_mask": params.layer_mask,
-                "query_trigger_interaction": params.query_trigger_interaction
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Raycast performed: {result}"
-        except Exception as e:
-            logger.error(f"Error performing raycast: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def physics_overlap(params: OverlapParams) -> str:
+        bake_parameters = {
+            "sourceObject": params.source_object,
+            "targetClip": params.target_clip,
+            "frameRange": params.frame_range,
+            "sampleRate": params.sample_rate,
+            "bakePose": params.bake_pose
+        }
+        cache_key = bake_key(bake_parameters)
+        
+        if params.use_cache:
+            cached_clip = await asyncio.to_thread(lookup_baked_clip, params.project_path, cache_key)
+            if cached_clip is not None:
+                logger.info("Reusing baked animation clip %s", cached_clip)
+                return _ok(
+                    {"cached": True, "target_clip": cached_clip},
+                    source_object=params.source_object,
+                    target_clip=params.target_clip
+                )
+        
+        logger.info("Baking animation from %s", params.source_object)
+        
+        result = await unity_manager.execute_unity_command(
+            action="animation.bake",
+            project_path=params.project_path,
+            parameters=bake_parameters
+        )
+        
+        if result.get("Success"):
+            await asyncio.to_thread(store_baked_clip, params.project_path, cache_key, params.target_clip)
+        
+        return _ok(
+            result.get("Data", _NO_DATA),
+            source_object=params.source_object,
+            target_clip=params.target_clip
+        )
+
+    async def _dispatch(project_path: str, command: Dict[str, Any]) -> Dict[str, Any]:
+        """Send an {"action": ..., **parameters} command to Unity"""
+        action = command.pop("action")
+        return await unity_manager.execute_unity_command(action, project_path, command)
+    
+    # Command tools generated from COMMAND_TOOLS
+    def _make_command_tool(
+        name: str,
+        params_model: Type[UnityCommandParams],
+        description: str,
+        failure_message: str
+    ) -> Callable[[UnityCommandParams], Awaitable[ToolResult]]:
+        """Build a tool that sends params.to_command() to Unity"""
+        async def command_tool(params: UnityCommandParams) -> ToolResult:
+            command = params.to_command()
+            logger.info("Running %s on %s", name, command.get("gameobject_path", params.project_path))
+            result = await _dispatch(params.project_path, command)
+            if not result.get("Success"):
+                return _unity_failure(result, failure_message)
+            return _ok(result.get("Data", _NO_DATA))
+        
+        command_tool.__name__ = command_tool.__qualname__ = name
+        command_tool.__doc__ = description
+        command_tool.__annotations__ = {"params": params_model, "return": ToolResult}
+        return safe_tool(failure_message)(command_tool)
+    
+    for name, params_model, description, failure_message in COMMAND_TOOLS:
+        _tool(_make_command_tool(name, params_model, description, failure_message))
+    
+    @_tool
+    @safe_tool("Error performing overlap detection")
+    async def physics_overlap(params: OverlapParams) -> ToolResult:
         """Perform physics overlap detection"""
-        try:
-            command = {
-                "action": "physics_overlap",
-                "shape_type": params.shape_type,
-                "position": params.position,
-                "size": params.size,
-                "layer_mask": params.layer_mask,
-                "query_trigger_interaction": params.query_trigger_interaction
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Overlap detection performed: {result}"
-        except Exception as e:
-            logger.error(f"Error performing overlap detection: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def physics_debug(params: PhysicsDebugParams) -> str:
-        """Configure physics debugging and visualization"""
-        try:
-            command = {
-                "action": "physics_debug",
-                "debug_type": params.debug_type,
-                "enable": params.enable,
-                "color": params.color,
-                "duration": params.duration
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Physics debug configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring physics debug: {e}")
-            return f"Error: {str(e)}"
-
-    # Rendering & Graphics Tools (10 tools)
-    @mcp.tool()
-    async def material_create(params: MaterialParams) -> str:
-        """Create and configure materials"""
-        try:
-            command = {
-                "action": "material_create",
-                "material_name": params.material_name,
-                "output_path": params.output_path,
-                "shader_name": params.shader_name,
-                "properties": params.properties,
-                "textures": params.textures,
-                "keywords": params.keywords
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Material created: {result}"
-        except Exception as e:
-            logger.error(f"Error creating material: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def shader_create(params: ShaderParams) -> str:
-        """Create and manage shaders"""
-        try:
-            command = {
-                "action": "shader_create",
-                "shader_name": params.shader_name,
-                "output_path": params.output_path,
-                "shader_type": params.shader_type,
-                "properties": params.properties,
-                "passes": params.passes,
-                "includes": params.includes
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Shader created: {result}"
-        except Exception as e:
-            logger.error(f"Error creating shader: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def camera_configure(params: CameraParams) -> str:
-        """Configure camera settings and properties"""
-        try:
-            command = {
-                "action": "camera_configure",
-                "gameobject_path": params.gameobject_path,
-                "clear_flags": params.clear_flags,
-                "background_color": params.background_color,
-                "culling_mask": params.culling_mask,
-                "projection": params.projection,
-                "field_of_view": params.field_of_view,
-                "near_clip": params.near_clip,
-                "far_clip": params.far_clip,
-                "render_texture": params.render_texture
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Camera configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring camera: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def lighting_setup(params: LightingParams) -> str:
-        """Setup and configure lighting"""
-        try:
-            command = {
-                "action": "lighting_setup",
-                "lighting_type": params.lighting_type,
-                "gameobject_path": params.gameobject_path,
-                "intensity": params.intensity,
-                "color": params.color,
-                "range": params.range,
-                "spot_angle": params.spot_angle,
-                "shadows": params.shadows,
-                "baking_settings": params.baking_settings
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Lighting setup: {result}"
-        except Exception as e:
-            logger.error(f"Error setting up lighting: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def postprocessing_configure(params: PostProcessingParams) -> str:
-        """Configure post-processing effects"""
-        try:
-            command = {
-                "action": "postprocessing_configure",
-                "profile_name": params.profile_name,
-                "output_path": params.output_path,
-                "effects": params.effects,
-                "volume_gameobject": params.volume_gameobject,
-                "is_global": params.is_global,
-                "priority": params.priority
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Post-processing configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring post-processing: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def render_pipeline_setup(params: RenderPipelineParams) -> str:
-        """Setup and configure render pipeline"""
-        try:
-            command = {
-                "action": "render_pipeline_setup",
-                "pipeline_type": params.pipeline_type,
-                "asset_name": params.asset_name,
-                "output_path": params.output_path,
-                "settings": params.settings,
-                "renderer_features": params.renderer_features
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Render pipeline setup: {result}"
-        except Exception as e:
-            logger.error(f"Error setting up render pipeline: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def texture_configure(params: TextureParams) -> str:
-        """Configure texture import settings"""
-        try:
-            command = {
-                "action": "texture_configure",
-                "texture_path": params.texture_path,
-                "texture_type": params.texture_type,
-                "max_size": params.max_size,
-                "compression": params.compression,
-                "filter_mode": params.filter_mode,
-                "wrap_mode": params.wrap_mode,
-                "generate_mipmaps": params.generate_mipmaps,
-                "srgb_texture": params.srgb_texture
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Texture configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring texture: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def mesh_configure(params: MeshParams) -> str:
-        """Configure mesh import settings"""
-        try:
-            command = {
-                "action": "mesh_configure",
-                "mesh_path": params.mesh_path,
-                "scale_factor": params.scale_factor,
-                "mesh_compression": params.mesh_compression,
-                "read_write_enabled": params.read_write_enabled,
-                "optimize_mesh": params.optimize_mesh,
-                "generate_colliders": params.generate_colliders,
-                "normals": params.normals,
-                "tangents": params.tangents
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Mesh configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring mesh: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def lod_setup(params: LODParams) -> str:
-        """Setup Level of Detail (LOD) groups"""
-        try:
-            command = {
-                "action": "lod_setup",
-                "gameobject_path": params.gameobject_path,
-                "lod_levels": params.lod_levels,
-                "fade_mode": params.fade_mode,
-                "animate_cross_fading": params.animate_cross_fading
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"LOD setup: {result}"
-        except Exception as e:
-            logger.error(f"Error setting up LOD: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def culling_configure(params: CullingParams) -> str:
-        """Configure rendering culling settings"""
-        try:
-            command = {
-                "action": "culling_configure",
-                "culling_type": params.culling_type,
-                "gameobject_path": params.gameobject_path,
-                "culling_distance": params.culling_distance,
-                "occlusion_culling": params.occlusion_culling,
-                "layer_distances": params.layer_distances
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Culling configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring culling: {e}")
-            return f"Error: {str(e)}"
-
-    # Audio System Tools (8 tools)
-    @mcp.tool()
-    async def audio_source_configure(params: AudioSourceParams) -> str:
-        """Configure AudioSource component properties"""
-        try:
-            command = {
-                "action": "audio_source_configure",
-                "gameobject_path": params.gameobject_path,
-                "audio_clip": params.audio_clip,
-                "volume": params.volume,
-                "pitch": params.pitch,
-                "loop": params.loop,
-                "play_on_awake": params.play_on_awake,
-                "spatial_blend": params.spatial_blend,
-                "min_distance": params.min_distance,
-                "max_distance": params.max_distance,
-                "rolloff_mode": params.rolloff_mode
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Audio source configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring audio source: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def audio_clip_configure(params: AudioClipParams) -> str:
-        """Configure audio clip import settings"""
-        try:
-            command = {
-                "action": "audio_clip_configure",
-                "clip_path": params.clip_path,
-                "load_type": params.load_type,
-                "compression_format": params.compression_format,
-                "quality": params.quality,
-                "force_to_mono": params.force_to_mono,
-                "normalize": params.normalize,
-                "load_in_background": params.load_in_background,
-                "ambisonic": params.ambisonic
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Audio clip configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring audio clip: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def audio_mixer_create(params: AudioMixerParams) -> str:
-        """Create and configure audio mixer"""
-        try:
-            command = {
-                "action": "audio_mixer_create",
-                "mixer_name": params.mixer_name,
-                "output_path": params.output_path,
-                "groups": params.groups,
-                "snapshots": params.snapshots,
-                "exposed_parameters": params.exposed_parameters,
-                "effects": params.effects
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Audio mixer created: {result}"
-        except Exception as e:
-            logger.error(f"Error creating audio mixer: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def audio_3d_configure(params: Audio3DParams) -> str:
-        """Configure 3D audio settings"""
-        try:
-            command = {
-                "action": "audio_3d_configure",
-                "gameobject_path": params.gameobject_path,
-                "doppler_level": params.doppler_level,
-                "spread": params.spread,
-                "volume_rolloff": params.volume_rolloff,
-                "min_distance": params.min_distance,
-                "max_distance": params.max_distance,
-                "reverb_zone_mix": params.reverb_zone_mix
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"3D audio configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring 3D audio: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def reverb_zone_configure(params: ReverbZoneParams) -> str:
-        """Configure AudioReverbZone component"""
-        try:
-            command = {
-                "action": "reverb_zone_configure",
-                "gameobject_path": params.gameobject_path,
-                "min_distance": params.min_distance,
-                "max_distance": params.max_distance,
-                "reverb_preset": params.reverb_preset,
-                "room": params.room,
-                "room_hf": params.room_hf,
-                "room_lf": params.room_lf,
-                "decay_time": params.decay_time,
-                "decay_hf_ratio": params.decay_hf_ratio,
-                "reflections": params.reflections,
-                "reflections_delay": params.reflections_delay,
-                "reverb": params.reverb,
-                "reverb_delay": params.reverb_delay,
-                "hf_reference": params.hf_reference,
-                "lf_reference": params.lf_reference,
-                "diffusion": params.diffusion,
-                "density": params.density
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Reverb zone configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring reverb zone: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def audio_listener_configure(params: AudioListenerParams) -> str:
-        """Configure AudioListener component"""
-        try:
-            command = {
-                "action": "audio_listener_configure",
-                "gameobject_path": params.gameobject_path,
-                "volume_scale": params.volume_scale,
-                "pause_on_audio_focus_loss": params.pause_on_audio_focus_loss
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Audio listener configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring audio listener: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def audio_streaming_configure(params: AudioStreamingParams) -> str:
-        """Configure audio streaming settings"""
-        try:
-            command = {
-                "action": "audio_streaming_configure",
-                "clip_path": params.clip_path,
-                "streaming_enabled": params.streaming_enabled,
-                "buffer_size": params.buffer_size,
-                "preload_audio_data": params.preload_audio_data,
-                "load_in_background": params.load_in_background
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Audio streaming configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring audio streaming: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def audio_compression_configure(params: AudioCompressionParams) -> str:
-        """Configure audio compression settings"""
-        try:
-            command = {
-                "action": "audio_compression_configure",
-                "clip_path": params.clip_path,
-                "compression_format": params.compression_format,
-                "quality": params.quality,
-                "sample_rate_setting": params.sample_rate_setting,
-                "sample_rate_override": params.sample_rate_override,
-                "force_to_mono": params.force_to_mono
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Audio compression configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring audio compression: {e}")
-            return f"Error: {str(e)}"
-
-    # UI System Tools (5 tools)
-    @mcp.tool()
-    async def canvas_configure(params: CanvasParams) -> str:
-        """Configure Canvas component and settings"""
-        try:
-            command = {
-                "action": "canvas_configure",
-                "gameobject_path": params.gameobject_path,
-                "render_mode": params.render_mode,
-                "camera": params.camera,
-                "plane_distance": params.plane_distance,
-                "sorting_layer": params.sorting_layer,
-                "order_in_layer": params.order_in_layer,
-                "pixel_perfect": params.pixel_perfect,
-                "override_sorting": params.override_sorting,
-                "additional_shader_channels": params.additional_shader_channels
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Canvas configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring canvas: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def ui_element_create(params: UIElementParams) -> str:
-        """Create and configure UI elements"""
-        try:
-            command = {
-                "action": "ui_element_create",
-                "parent_path": params.parent_path,
-                "element_type": params.element_type,
-                "element_name": params.element_name,
-                "position": params.position,
-                "size": params.size,
-                "anchor": params.anchor,
-                "pivot": params.pivot,
-                "text_content": params.text_content,
-                "sprite": params.sprite,
-                "color": params.color,
-                "font": params.font,
-                "font_size": params.font_size,
-                "interactable": params.interactable
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"UI element created: {result}"
-        except Exception as e:
-            logger.error(f"Error creating UI element: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def event_system_configure(params: EventSystemParams) -> str:
-        """Configure EventSystem for UI input handling"""
-        try:
-            command = {
-                "action": "event_system_configure",
-                "gameobject_path": params.gameobject_path,
-                "first_selected": params.first_selected,
-                "send_navigation_events": params.send_navigation_events,
-                "drag_threshold": params.drag_threshold,
-                "input_module_type": params.input_module_type
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Event system configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring event system: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def layout_group_configure(params: LayoutGroupParams) -> str:
-        """Configure layout groups for UI organization"""
-        try:
-            command = {
-                "action": "layout_group_configure",
-                "gameobject_path": params.gameobject_path,
-                "layout_type": params.layout_type,
-                "padding": params.padding,
-                "spacing": params.spacing,
-                "child_alignment": params.child_alignment,
-                "child_control_size": params.child_control_size,
-                "child_force_expand": params.child_force_expand,
-                "cell_size": params.cell_size,
-                "constraint": params.constraint,
-                "constraint_count": params.constraint_count
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Layout group configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring layout group: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def ui_animation_create(params: UIAnimationParams) -> str:
-        """Create UI animations and transitions"""
-        try:
-            command = {
-                "action": "ui_animation_create",
-                "gameobject_path": params.gameobject_path,
-                "animation_type": params.animation_type,
-                "duration": params.duration,
-                "ease_type": params.ease_type,
-                "start_value": params.start_value,
-                "end_value": params.end_value,
-                "loop_type": params.loop_type,
-                "auto_play": params.auto_play,
-                "trigger_event": params.trigger_event
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"UI animation created: {result}"
-        except Exception as e:
-            logger.error(f"Error creating UI animation: {e}")
-            return f"Error: {str(e)}"
-
-    # Build System Tools (3 tools)
-    @mcp.tool()
-    async def build_player(params: BuildPlayerParams) -> str:
-        """Build Unity player for target platform"""
-        try:
-            command = {
-                "action": "build_player",
-                "target_platform": params.target_platform,
-                "build_path": params.build_path,
-                "development_build": params.development_build,
-                "script_debugging": params.script_debugging,
-                "compression": params.compression,
-                "scenes": params.scenes,
-                "player_settings": params.player_settings
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Player build completed: {result}"
-        except Exception as e:
-            logger.error(f"Error building player: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def build_settings_configure(params: BuildSettingsParams) -> str:
-        """Configure build settings and player settings"""
-        try:
-            command = {
-                "action": "build_settings_configure",
-                "company_name": params.company_name,
-                "product_name": params.product_name,
-                "version": params.version,
-                "bundle_identifier": params.bundle_identifier,
-                "default_icon": params.default_icon,
-                "splash_screen": params.splash_screen,
-                "resolution_settings": params.resolution_settings,
-                "quality_settings": params.quality_settings
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Build settings configured: {result}"
-        except Exception as e:
-            logger.error(f"Error configuring build settings: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def platform_switch(params: PlatformSwitchParams) -> str:
-        """Switch Unity project to target platform"""
-        try:
-            command = {
-                "action": "platform_switch",
-                "target_platform": params.target_platform,
-                "texture_compression": params.texture_compression,
-                "scripting_backend": params.scripting_backend,
-                "api_compatibility_level": params.api_compatibility_level,
-                "target_device": params.target_device,
-                "architecture": params.architecture
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Platform switched: {result}"
-        except Exception as e:
-            logger.error(f"Error switching platform: {e}")
-            return f"Error: {str(e)}"
-
-    # Scripting & Code Generation Tools (4 tools)
-    @mcp.tool()
-    async def script_template_create(params: ScriptTemplateParams) -> str:
-        """Create script from template"""
-        try:
-            command = {
-                "action": "script_template_create",
-                "template_type": params.template_type,
-                "script_name": params.script_name,
-                "output_path": params.output_path,
-                "namespace": params.namespace,
-                "base_class": params.base_class,
-                "interfaces": params.interfaces,
-                "custom_template": params.custom_template
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Script created from template: {result}"
-        except Exception as e:
-            logger.error(f"Error creating script from template: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def code_analysis_run(params: CodeAnalysisParams) -> str:
-        """Run code analysis on Unity project"""
-        try:
-            command = {
-                "action": "code_analysis_run",
-                "analysis_type": params.analysis_type,
-                "target_files": params.target_files,
-                "target_directories": params.target_directories,
-                "include_patterns": params.include_patterns,
-                "exclude_patterns": params.exclude_patterns,
-                "output_format": params.output_format
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Code analysis completed: {result}"
-        except Exception as e:
-            logger.error(f"Error running code analysis: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def code_refactor(params: CodeRefactorParams) -> str:
-        """Perform code refactoring operations"""
-        try:
-            command = {
-                "action": "code_refactor",
-                "refactor_type": params.refactor_type,
-                "target_file": params.target_file,
-                "old_name": params.old_name,
-                "new_name": params.new_name,
-                "start_line": params.start_line,
-                "end_line": params.end_line,
-                "target_namespace": params.target_namespace
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Code refactoring completed: {result}"
-        except Exception as e:
-            logger.error(f"Error performing code refactoring: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def documentation_generate(params: DocumentationParams) -> str:
-        """Generate code documentation"""
-        try:
-            command = {
-                "action": "documentation_generate",
-                "doc_type": params.doc_type,
-                "target_files": params.target_files,
-                "output_path": params.output_path,
-                "include_private": params.include_private,
-                "include_internal": params.include_internal,
-                "template_path": params.template_path,
-                "generate_diagrams": params.generate_diagrams
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Documentation generated: {result}"
-        except Exception as e:
-            logger.error(f"Error generating documentation: {e}")
-            return f"Error: {str(e)}"
-
-    # Performance & Profiling Tools (2 tools)
-    @mcp.tool()
-    async def profiler_data_collect(params: ProfilerDataParams) -> str:
-        """Collect Unity profiler data"""
-        try:
-            command = {
-                "action": "profiler_data_collect",
-                "profiler_type": params.profiler_type,
-                "duration": params.duration,
-                "target_scene": params.target_scene,
-                "sample_rate": params.sample_rate,
-                "deep_profiling": params.deep_profiling,
-                "output_format": params.output_format,
-                "output_path": params.output_path
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Profiler data collected: {result}"
-        except Exception as e:
-            logger.error(f"Error collecting profiler data: {e}")
-            return f"Error: {str(e)}"
-
-    @mcp.tool()
-    async def performance_analysis_run(params: PerformanceAnalysisParams) -> str:
-        """Run performance analysis on Unity project"""
-        try:
-            command = {
-                "action": "performance_analysis_run",
-                "analysis_type": params.analysis_type,
-                "target_platform": params.target_platform,
-                "quality_settings": params.quality_settings,
-                "resolution": params.resolution,
-                "vsync": params.vsync,
-                "target_framerate": params.target_framerate,
-                "benchmark_duration": params.benchmark_duration
-            }
-            result = await unity_manager.execute_unity_command(params.project_path, command)
-            return f"Performance analysis completed: {result}"
-        except Exception as e:
-            logger.error(f"Error running performance analysis: {e}")
-            return f"Error: {str(e)}"
-
-    logger.info("Unity MCP tools registered successfully")
\ No newline at end of file
+        command = params.to_command()
+        logger.info("Running physics_overlap on %s", params.project_path)
+        
+        # Unity may stream hits in partial messages; each is decoded on
+        # arrival instead of as one large response
+        hits: List[Any] = []
+        async for message in unity_manager.stream_unity_command(
+            command.pop("action"), params.project_path, command
+        ):
+            if not message.get("Success"):
+                raise RuntimeError(message.get("Error") or "Overlap detection failed")
+            data = message.get("Data")
+            if isinstance(data, list):
+                hits.extend(data)
+        
+        return _ok(hits)
+
+    # Batch Execution Tools (2 tools)
+    @mcp.tool()
+    @safe_tool("Batch execution failed")
+    async def batch_execute(params: BatchExecuteParams) -> Dict[str, Any]:
+        """Execute several Unity commands in a single Unity invocation"""
+        logger.info("Executing batch of %d commands for %s", len(params.commands), params.project_path)
+        
+        results = await unity_manager.execute_unity_commands_batch(
+            project_path=params.project_path,
+            commands=[(command.action, command.parameters) for command in params.commands],
+            timeout=params.timeout_minutes * 60
+        )
+        
+        return _ok([
+            {
+                "action": command.action,
+                "success": bool(result.get("Success")),
+                "data": result.get("Data"),
+                "error": result.get("Error")
+            }
+            for command, result in zip(params.commands, results)
+        ])
+
+    @mcp.tool()
+    @safe_tool("Bulk apply failed")
+    async def bulk_apply(params: BulkApplyParams) -> Dict[str, Any]:
+        """Run several independent tool calls concurrently and collect their results"""
+        unknown = [item.tool for item in params.items if item.tool not in tools]
+        if unknown:
+            raise ValueError(f"Unknown tools: {', '.join(unknown)}")
+        
+        logger.info("Applying %d tool calls concurrently", len(params.items))
+        
+        async def _call(item: BulkToolCallParams) -> Any:
+            func = tools[item.tool]
+            model = func.__annotations__["params"]
+            return await func(model.model_validate(item.params))
+        
+        results = await asyncio.gather(
+            *(_call(item) for item in params.items),
+            return_exceptions=True
+        )
+        
+        # Tools report their own failures in the result (see safe_tool); an
+        # exception here means the item's params did not validate
+        return _ok([
+            {"tool": item.tool, "success": False, "error": str(result)}
+            if isinstance(result, Exception) else
+            {"tool": item.tool, "success": bool(result.get("success")), "result": result}
+            for item, result in zip(params.items, results)
+        ])
+
+    logger.info("Unity MCP tools registered successfully")
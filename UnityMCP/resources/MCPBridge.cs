@@ -0,0 +1,427 @@
+using System;
+using System.IO;
+using UnityEngine;
+using UnityEditor;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Sockets;
+using System.Text;
+using System.Threading;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMCP
+{
+    public static class MCPBridge
+    {
+        // Where SendPartial writes; the connection of the command being handled
+        internal static Action<string> PartialWriter;
+        
+        // Handlers for commands sent by name rather than opcode
+        private static readonly Dictionary<string, Func<MCPCommand, MCPResult>> ActionHandlers =
+            new Dictionary<string, Func<MCPCommand, MCPResult>>();
+        
+        /// <summary>
+        /// Register the handler for a named action (e.g. "rigidbody_configure").
+        /// Editor scripts call this from [InitializeOnLoad] to extend the bridge.
+        /// Handlers read parameters as typed values, e.g.
+        /// command.Parameters.Value&lt;string&gt;("gameobject_path").
+        /// </summary>
+        public static void RegisterHandler(string action, Func<MCPCommand, MCPResult> handler)
+        {
+            ActionHandlers[action] = handler;
+        }
+        
+        /// <summary>
+        /// Keep the editor running and answer JSON commands from stdin until it
+        /// closes or a shutdown command arrives. Messages are newline-delimited,
+        /// or length-prefixed when started with "-mcpWireFormat framed".
+        /// </summary>
+        public static void Serve()
+        {
+            var args = Environment.GetCommandLineArgs();
+            int formatIndex = Array.IndexOf(args, "-mcpWireFormat");
+            bool framed = formatIndex >= 0 && formatIndex + 1 < args.Length && args[formatIndex + 1] == "framed";
+            
+            Func<string> readMessage;
+            Action<string> writeMessage;
+            PartialWriter = body => writeMessage(body);
+            if (framed)
+            {
+                var input = Console.OpenStandardInput();
+                var output = Console.OpenStandardOutput();
+                readMessage = () => ReadFrame(input);
+                writeMessage = body => WriteFrame(output, body);
+            }
+            else
+            {
+                readMessage = Console.ReadLine;
+                writeMessage = body =>
+                {
+                    Console.WriteLine(body);
+                    Console.Out.Flush();
+                };
+            }
+            
+            // Tell the server the project is loaded and commands can flow
+            writeMessage(JsonConvert.SerializeObject(new { Ready = true }));
+            
+            string message;
+            while ((message = readMessage()) != null)
+            {
+                if (string.IsNullOrWhiteSpace(message))
+                    continue;
+                
+                var response = HandleMessage(message);
+                if (response == null)
+                    break;
+                writeMessage(response);
+            }
+            
+            EditorApplication.Exit(0);
+        }
+        
+        /// <summary>
+        /// Run one serialized command and return the serialized result,
+        /// or null if it was a shutdown request.
+        /// </summary>
+        internal static string HandleMessage(string message)
+        {
+            MCPResult result;
+            int id = 0;
+            try
+            {
+                var command = JsonConvert.DeserializeObject<MCPCommand>(message);
+                id = command.Id;
+                if (command.Action == "shutdown")
+                    return null;
+                result = ProcessCommand(command);
+            }
+            catch (Exception ex)
+            {
+                result = new MCPResult { Success = false, Error = ex.Message };
+            }
+            
+            result.Id = id;
+            return JsonConvert.SerializeObject(result);
+        }
+        
+        /// <summary>
+        /// Send part of a streamed command's result ahead of its final response.
+        /// Does nothing unless the command was issued with Stream set.
+        /// </summary>
+        public static void SendPartial(MCPCommand command, object data)
+        {
+            if (!command.Stream || PartialWriter == null)
+                return;
+            
+            var partial = new MCPResult { Id = command.Id, Success = true, Partial = true, Data = data };
+            PartialWriter(JsonConvert.SerializeObject(partial));
+        }
+        
+        /// <summary>
+        /// Read one message prefixed with its 4-byte big-endian length, or null at end of input.
+        /// </summary>
+        internal static string ReadFrame(Stream input)
+        {
+            var header = ReadExactly(input, 4);
+            if (header == null)
+                return null;
+            
+            int length = (header[0] << 24) | (header[1] << 16) | (header[2] << 8) | header[3];
+            var body = ReadExactly(input, length);
+            return body == null ? null : Encoding.UTF8.GetString(body);
+        }
+        
+        private static byte[] ReadExactly(Stream input, int count)
+        {
+            var buffer = new byte[count];
+            int offset = 0;
+            while (offset < count)
+            {
+                int read = input.Read(buffer, offset, count - offset);
+                if (read == 0)
+                    return null;
+                offset += read;
+            }
+            return buffer;
+        }
+        
+        internal static void WriteFrame(Stream output, string body)
+        {
+            var bytes = Encoding.UTF8.GetBytes(body);
+            int length = bytes.Length;
+            output.Write(new[] { (byte)(length >> 24), (byte)(length >> 16), (byte)(length >> 8), (byte)length }, 0, 4);
+            output.Write(bytes, 0, bytes.Length);
+            output.Flush();
+        }
+        
+        [MenuItem("MCP/Execute Command")]
+        public static void ExecuteCommand()
+        {
+            try
+            {
+                // Read command from stdin
+                string input = Console.ReadLine();
+                if (string.IsNullOrEmpty(input))
+                    return;
+                
+                var command = JsonConvert.DeserializeObject<MCPCommand>(input);
+                var result = ProcessCommand(command);
+                
+                // Write result to stdout
+                Console.WriteLine(JsonConvert.SerializeObject(result));
+            }
+            catch (Exception ex)
+            {
+                var error = new MCPResult
+                {
+                    Success = false,
+                    Error = ex.Message,
+                    Data = null
+                };
+                Console.WriteLine(JsonConvert.SerializeObject(error));
+            }
+        }
+        
+        private static MCPResult ProcessCommand(MCPCommand command)
+        {
+            // Opcodes mirror ACTION_OPCODES in unity_manager.py
+            switch (command.Op)
+            {
+                case 1:
+                    return ScanProject(command.Parameters);
+                case 2:
+                    return RunBuild(command.Parameters);
+                case 3:
+                    return RunTests(command.Parameters);
+                case 4:
+                    return ValidateScene(command.Parameters);
+                case 5:
+                    return AuditAssets(command.Parameters);
+                case 6:
+                    return RunBatch(command.Parameters);
+            }
+            
+            Func<MCPCommand, MCPResult> handler;
+            if (command.Action != null && ActionHandlers.TryGetValue(command.Action, out handler))
+                return handler(command);
+            
+            return new MCPResult
+            {
+                Success = false,
+                Error = $"Unknown action: {command.Action ?? command.Op.ToString()}"
+            };
+        }
+        
+        private static MCPResult RunBatch(JObject parameters)
+        {
+            var commands = parameters.Value<JArray>("commands").ToObject<List<MCPCommand>>();
+            var results = new List<MCPResult>(commands.Count);
+            
+            foreach (var command in commands)
+            {
+                MCPResult result;
+                try
+                {
+                    result = ProcessCommand(command);
+                }
+                catch (Exception ex)
+                {
+                    result = new MCPResult { Success = false, Error = ex.Message };
+                }
+                result.Id = command.Id;
+                results.Add(result);
+            }
+            
+            return new MCPResult { Success = true, Data = results };
+        }
+        
+        private static MCPResult ScanProject(JObject parameters)
+        {
+            var assets = AssetDatabase.FindAssets("");
+            var fileList = new List<object>();
+            
+            foreach (var guid in assets)
+            {
+                var path = AssetDatabase.GUIDToAssetPath(guid);
+                var asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(path);
+                
+                fileList.Add(new
+                {
+                    guid = guid,
+                    path = path,
+                    type = asset?.GetType().Name,
+                    size = new FileInfo(path).Length
+                });
+            }
+            
+            return new MCPResult
+            {
+                Success = true,
+                Data = new { files = fileList, count = fileList.Count }
+            };
+        }
+        
+        private static MCPResult RunBuild(JObject parameters)
+        {
+            // Implementation for build operations
+            return new MCPResult { Success = true, Data = "Build completed" };
+        }
+        
+        private static MCPResult RunTests(JObject parameters)
+        {
+            // Implementation for test operations
+            return new MCPResult { Success = true, Data = "Tests completed" };
+        }
+        
+        private static MCPResult ValidateScene(JObject parameters)
+        {
+            // Implementation for scene validation
+            return new MCPResult { Success = true, Data = "Scene validated" };
+        }
+        
+        private static MCPResult AuditAssets(JObject parameters)
+        {
+            // Implementation for asset auditing
+            return new MCPResult { Success = true, Data = "Assets audited" };
+        }
+    }
+    
+    /// <summary>
+    /// Serves MCP commands to a running (interactive) editor over a loopback
+    /// TCP socket. The port is published in Temp/mcp_port; messages use the
+    /// same length-prefixed framing as "-mcpWireFormat framed". Commands run
+    /// on the main thread from EditorApplication.update.
+    /// </summary>
+    [InitializeOnLoad]
+    public static class MCPSocketServer
+    {
+        private const string PortFile = "Temp/mcp_port";
+        private static TcpListener _listener;
+        private static readonly ConcurrentQueue<Action> MainThreadQueue = new ConcurrentQueue<Action>();
+        
+        static MCPSocketServer()
+        {
+            // Batch-mode sessions are served over stdio by MCPBridge.Serve
+            if (Application.isBatchMode)
+                return;
+            
+            _listener = new TcpListener(IPAddress.Loopback, 0);
+            _listener.Start();
+            int port = ((IPEndPoint)_listener.LocalEndpoint).Port;
+            File.WriteAllText(PortFile, port.ToString());
+            
+            EditorApplication.update += DrainMainThreadQueue;
+            AssemblyReloadEvents.beforeAssemblyReload += Stop;
+            EditorApplication.quitting += Stop;
+            
+            new Thread(AcceptLoop) { IsBackground = true }.Start();
+        }
+        
+        private static void Stop()
+        {
+            if (_listener != null)
+            {
+                _listener.Stop();
+                _listener = null;
+            }
+            if (File.Exists(PortFile))
+                File.Delete(PortFile);
+        }
+        
+        private static void DrainMainThreadQueue()
+        {
+            Action action;
+            while (MainThreadQueue.TryDequeue(out action))
+                action();
+        }
+        
+        private static void AcceptLoop()
+        {
+            try
+            {
+                while (true)
+                {
+                    var client = _listener.AcceptTcpClient();
+                    new Thread(() => ServeClient(client)) { IsBackground = true }.Start();
+                }
+            }
+            catch (SocketException)
+            {
+                // Listener stopped
+            }
+            catch (ObjectDisposedException)
+            {
+            }
+        }
+        
+        private static void ServeClient(TcpClient client)
+        {
+            using (client)
+            {
+                var stream = client.GetStream();
+                var writeLock = new object();
+                Action<string> writeMessage = body =>
+                {
+                    if (body == null)
+                        return;
+                    try
+                    {
+                        lock (writeLock)
+                            MCPBridge.WriteFrame(stream, body);
+                    }
+                    catch (IOException)
+                    {
+                        // Client went away
+                    }
+                    catch (ObjectDisposedException)
+                    {
+                    }
+                };
+                
+                writeMessage(JsonConvert.SerializeObject(new { Ready = true }));
+                
+                try
+                {
+                    string message;
+                    while ((message = MCPBridge.ReadFrame(stream)) != null)
+                    {
+                        var request = message;
+                        MainThreadQueue.Enqueue(() =>
+                        {
+                            MCPBridge.PartialWriter = writeMessage;
+                            writeMessage(MCPBridge.HandleMessage(request));
+                        });
+                    }
+                }
+                catch (IOException)
+                {
+                    // Client went away
+                }
+            }
+        }
+    }
+    
+    [Serializable]
+    public class MCPCommand
+    {
+        public int Id { get; set; }
+        public int Op { get; set; }
+        public string Action { get; set; }
+        public bool Stream { get; set; }
+        public JObject Parameters { get; set; }
+    }
+    
+    [Serializable]
+    public class MCPResult
+    {
+        public int Id { get; set; }
+        public bool Success { get; set; }
+        public bool Partial { get; set; }
+        public string Error { get; set; }
+        public object Data { get; set; }
+    }
+}
@@ -12,7 +12,7 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Coroutine, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 from config import config
@@ -41,7 +41,7 @@ class MCPServer:
     
     def _setup_server(self):
         """Setup MCP server with tools, resources, and prompts"""
-        logger.info(f"Initializing {config.server_name} v{config.server_version}")
+        logger.info("Initializing %s v%s", config.server_name, config.server_version)
         
         # Register MCP components
         register_tools(self.mcp, self.unity_manager)
@@ -60,7 +60,7 @@ class MCPServer:
         except KeyboardInterrupt:
             logger.info("Server interrupted by user")
         except Exception as e:
-            logger.error(f"Server error: {e}")
+            logger.error("Server error: %s", e)
             raise
         finally:
             await self.cleanup()
@@ -72,6 +72,34 @@ class MCPServer:
         logger.info("Server cleanup completed")
 
 
+def _event_loop_module():
+    """uvloop, or winloop on Windows, when installed; None keeps asyncio's
+    default loop"""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_module
+        else:
+            import uvloop as loop_module
+    except ImportError:
+        return None
+    
+    return loop_module
+
+
+def run(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run coroutine to completion on the libuv-based loop when available"""
+    loop_module = _event_loop_module()
+    if sys.version_info >= (3, 11):
+        loop_factory = loop_module.new_event_loop if loop_module is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coroutine)
+    
+    # asyncio.Runner and its loop_factory are 3.11+
+    if loop_module is not None:
+        asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+    return asyncio.run(coroutine)
+
+
 async def main():
     """Main entry point"""
     server = MCPServer()
@@ -79,4 +107,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Tests for the tools generated from COMMAND_TOOLS"""
+
+import asyncio
+
+from mcp_tools import COMMAND_TOOLS, RigidbodyParams, register_tools
+
+
+class RecordingMCP:
+    """FastMCP stand-in that keeps registered tools by name"""
+    
+    def __init__(self):
+        self.tools = {}
+    
+    def tool(self):
+        def register(func):
+            self.tools[func.__name__] = func
+            return func
+        return register
+
+
+class FailingUnityManager:
+    """UnityManager stand-in whose commands all fail in Unity"""
+    
+    async def execute_unity_command(self, action, project_path, parameters, timeout=300):
+        return {"Success": False, "Error": f"Unknown action: {action}"}
+
+
+def test_failed_unity_result_is_reported_as_failure():
+    mcp = RecordingMCP()
+    register_tools(mcp, FailingUnityManager())
+    assert "rigidbody_configure" in {name for name, *_ in COMMAND_TOOLS}
+    
+    params = RigidbodyParams(project_path="/project", gameobject_path="Player", mass=5.0)
+    result = asyncio.run(mcp.tools["rigidbody_configure"](params))
+    
+    assert result == {"success": False, "error": "Unknown action: rigidbody_configure"}
@@ -1,15 +1,19 @@
 """Unity Process Manager for MCP Server"""
 
 import asyncio
-import json
+import hashlib
+import itertools
 import logging
 import os
-import subprocess
 import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 
+import orjson
 import psutil
 from pydantic import BaseModel
 
@@ -19,6 +23,121 @@ from config import config
 logger = logging.getLogger(__name__)
 
 
+# Actions handled natively by the injected MCPBridge, in opcode order. Known
+# actions are sent as a small integer opcode so the bridge can dispatch with
+# an integer switch; anything else falls back to the action string.
+BRIDGE_ACTIONS = (
+    "project.scan",
+    "build.run",
+    "test.run",
+    "scene.validate",
+    "asset.audit",
+    "batch",
+)
+ACTION_OPCODES: Dict[str, int] = {
+    action: opcode for opcode, action in enumerate(BRIDGE_ACTIONS, start=1)
+}
+
+# Actions whose effect depends only on their parameters, so repeating an
+# identical call shortly after a successful one can reuse its result.
+IDEMPOTENT_ACTIONS = frozenset({
+    "rigidbody_configure",
+    "joint_configure",
+    "physics_simulation_settings",
+    "camera_configure",
+    "lighting_setup",
+    "postprocessing_configure",
+    "render_pipeline_setup",
+    "texture_configure",
+    "mesh_configure",
+    "culling_configure",
+    "audio_source_configure",
+    "audio_clip_configure",
+    "audio_3d_configure",
+    "reverb_zone_configure",
+    "audio_listener_configure",
+    "audio_streaming_configure",
+    "audio_compression_configure",
+    "canvas_configure",
+    "event_system_configure",
+})
+RESULT_CACHE_TTL_SECONDS = 0.5
+
+# Actions that only inspect the project. Their results are reused for longer,
+# until any other action for the same project completes. Profiling actions
+# are left out because they write reports to an output path.
+READ_ONLY_ACTIONS = frozenset({
+    "project.scan",
+    "scene.validate",
+    "asset.audit",
+    "code_analysis_run",
+})
+READ_RESULT_CACHE_TTL_SECONDS = 30.0
+RESULT_CACHE_MAX_ENTRIES = 256
+
+# Number of operations kept in UnityManager.active_operations
+OPERATION_HISTORY_SIZE = 256
+
+# Operation ids: unique per process without a clock read per command
+_OPERATION_EPOCH = time.monotonic_ns()
+_operation_counter = itertools.count()
+
+# C# side of the bridge, run inside Unity (see MCPBridge.Serve)
+BRIDGE_SOURCE_PATH = Path(__file__).parent / "resources" / "MCPBridge.cs"
+
+# Unity writes whole results as single lines; allow large project scans.
+STREAM_LIMIT = 64 * 1024 * 1024
+
+# Seconds to wait for Unity to exit after a shutdown request.
+SESSION_SHUTDOWN_TIMEOUT = 10
+
+# A running editor's MCPSocketServer writes its port here, relative to the
+# project, and greets each connection within EDITOR_HANDSHAKE_TIMEOUT seconds.
+EDITOR_PORT_FILE = Path("Temp") / "mcp_port"
+EDITOR_HANDSHAKE_TIMEOUT = 10
+
+# Each batch-mode session logs to its own file under the project, and each
+# operation records at most LOG_TAIL_BYTES of what was logged while it ran.
+SESSION_LOG_DIR = Path("Temp") / "mcp_logs"
+LOG_TAIL_BYTES = 64 * 1024
+
+# After a session fails to start or connect, the next attempt for that
+# project waits SESSION_RETRY_BASE_DELAY seconds, doubling with each further
+# failure up to SESSION_RETRY_MAX_DELAY.
+SESSION_RETRY_BASE_DELAY = 1.0
+SESSION_RETRY_MAX_DELAY = 30.0
+
+
+def _encode_command(action: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the bridge command payload, preferring the action opcode"""
+    opcode = ACTION_OPCODES.get(action)
+    if opcode is not None:
+        return {"Op": opcode, "Parameters": parameters}
+    return {"Action": action, "Parameters": parameters}
+
+
+def _fail_batch(pending: List[Tuple[str, Dict[str, Any], int, asyncio.Future]], error: Exception):
+    """Fail every unresolved future of a batch"""
+    for *_, future in pending:
+        if not future.done():
+            future.set_exception(error)
+
+
+def _log_size(log_path: Optional[Path]) -> int:
+    try:
+        return log_path.stat().st_size if log_path is not None else 0
+    except OSError:
+        return 0
+
+
+def _read_log_tail(log_path: Path, offset: int) -> str:
+    """Text appended to log_path since offset, keeping only the last LOG_TAIL_BYTES"""
+    with open(log_path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        f.seek(max(offset, end - LOG_TAIL_BYTES))
+        return f.read().decode("utf-8", errors="replace")
+
+
 class UnityOperation(BaseModel):
     """Unity operation tracking"""
     id: str
@@ -29,165 +148,498 @@ class UnityOperation(BaseModel):
     end_time: Optional[datetime] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    log_tail: Optional[str] = None
 
 
-class UnityManager:
-    """Manages Unity Editor processes and operations"""
+class _UnitySession:
+    """Connection to a Unity Editor answering JSON commands
     
-    def __init__(self):
-        self.active_operations: Dict[str, UnityOperation] = {}
-        self.unity_processes: Dict[str, subprocess.Popen] = {}
-        self.bridge_script_path = self._create_bridge_script()
+    Requests are pipelined: each is written as soon as it is issued and a
+    reader task resolves the waiting future whose id the response carries.
+    Subclasses open the connection in start() and hand its streams to
+    _attach().
+    """
     
-    def _create_bridge_script(self) -> str:
-        """Create Unity Bridge C# script"""
-        bridge_content = '''
-using System;
-using System.IO;
-using UnityEngine;
-using UnityEditor;
-using System.Collections.Generic;
-using System.Linq;
-using Newtonsoft.Json;
-
-namespace UnityMCP
-{
-    public static class MCPBridge
-    {
-        [MenuItem("MCP/Execute Command")]
-        public static void ExecuteCommand()
-        {
-            try
-            {
-                // Read command from stdin
-                string input = Console.ReadLine();
-                if (string.IsNullOrEmpty(input))
-                    return;
-                
-                var command = JsonConvert.DeserializeObject<MCPCommand>(input);
-                var result = ProcessCommand(command);
-                
-                // Write result to stdout
-                Console.WriteLine(JsonConvert.SerializeObject(result));
-            }
-            catch (Exception ex)
-            {
-                var error = new MCPResult
-                {
-                    Success = false,
-                    Error = ex.Message,
-                    Data = null
-                };
-                Console.WriteLine(JsonConvert.SerializeObject(error));
-            }
-        }
+    framed = True
+    # Log file written by the Unity side, when the session owns one
+    log_path: Optional[Path] = None
+    
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._write_lock = asyncio.Lock()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._streams: Dict[int, asyncio.Queue] = {}
+        # Set once Unity reaches each outstanding request; see _mark_started
+        self._started: Dict[int, asyncio.Event] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Future] = None
+        self._next_id = 0
+    
+    @property
+    def alive(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+    
+    @property
+    def busy(self) -> bool:
+        """Whether any request is waiting on a response"""
+        return bool(self._pending or self._streams)
+    
+    def _mark_started(self):
+        """Flag the oldest outstanding request as started
         
-        private static MCPResult ProcessCommand(MCPCommand command)
-        {
-            switch (command.Action)
-            {
-                case "project.scan":
-                    return ScanProject(command.Parameters);
-                case "build.run":
-                    return RunBuild(command.Parameters);
-                case "test.run":
-                    return RunTests(command.Parameters);
-                case "scene.validate":
-                    return ValidateScene(command.Parameters);
-                case "asset.audit":
-                    return AuditAssets(command.Parameters);
-                default:
-                    return new MCPResult
-                    {
-                        Success = false,
-                        Error = $"Unknown action: {command.Action}"
-                    };
-            }
-        }
+        Unity handles requests one at a time in the order they were sent, so
+        a request starts once every earlier one has been answered or given up.
+        """
+        oldest = min(itertools.chain(self._pending, self._streams), default=None)
+        if oldest is not None:
+            self._started[oldest].set()
+    
+    def _open_request(self) -> Tuple[int, asyncio.Event]:
+        self._next_id += 1
+        started = self._started[self._next_id] = asyncio.Event()
+        return self._next_id, started
+    
+    def _finish_request(self, request_id: int):
+        """Forget a request and let the next one start"""
+        self._pending.pop(request_id, None)
+        self._streams.pop(request_id, None)
+        started = self._started.pop(request_id, None)
+        if started is not None:
+            # Also releases a wait for a request answered out of order
+            started.set()
+        self._mark_started()
+    
+    async def start(self):
+        raise NotImplementedError
+    
+    async def close(self):
+        raise NotImplementedError
+    
+    async def _attach(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, ready_timeout: float):
+        """Start reading responses and wait for the bridge's ready message"""
+        self._reader = reader
+        self._writer = writer
+        self._ready = asyncio.get_running_loop().create_future()
+        self._reader_task = asyncio.create_task(self._read_responses())
         
-        private static MCPResult ScanProject(Dictionary<string, object> parameters)
-        {
-            var assets = AssetDatabase.FindAssets("");
-            var fileList = new List<object>();
-            
-            foreach (var guid in assets)
-            {
-                var path = AssetDatabase.GUIDToAssetPath(guid);
-                var asset = AssetDatabase.LoadAssetAtPath<UnityEngine.Object>(path);
-                
-                fileList.Add(new
-                {
-                    guid = guid,
-                    path = path,
-                    type = asset?.GetType().Name,
-                    size = new FileInfo(path).Length
-                });
-            }
+        try:
+            await asyncio.wait_for(self._ready, timeout=ready_timeout)
+        except asyncio.TimeoutError:
+            self._reader_task.cancel()
+            raise TimeoutError(f"Unity did not become ready within {ready_timeout} seconds")
+        logger.info("Unity session ready for %s", self.project_path)
+    
+    def _encode_message(self, message: Dict[str, Any]) -> bytes:
+        body = orjson.dumps(message)
+        if self.framed:
+            return len(body).to_bytes(4, "big") + body
+        return body + b"\n"
+    
+    async def _read_message(self) -> Optional[bytes]:
+        """Read one raw message, or None once Unity closes the connection"""
+        if not self.framed:
+            return await self._reader.readline() or None
+        try:
+            header = await self._reader.readexactly(4)
+            return await self._reader.readexactly(int.from_bytes(header, "big"))
+        except asyncio.IncompleteReadError:
+            return None
+    
+    async def _read_responses(self):
+        """Route each response to the request waiting for its id"""
+        try:
+            while True:
+                payload = await self._read_message()
+                if payload is None:
+                    break
+                try:
+                    response = orjson.loads(payload)
+                except orjson.JSONDecodeError:
+                    # Not a bridge message (e.g. editor output)
+                    continue
+                if not isinstance(response, dict):
+                    continue
+                if response.get("Ready"):
+                    if not self._ready.done():
+                        self._ready.set_result(None)
+                    continue
+                request_id = response.get("Id")
+                stream = self._streams.get(request_id)
+                if stream is not None:
+                    stream.put_nowait(response)
+                    if not response.get("Partial"):
+                        # Unity has moved on even if the consumer has not
+                        self._finish_request(request_id)
+                    continue
+                # Responses to requests that already timed out are dropped
+                future = self._pending.get(request_id)
+                if future is not None:
+                    self._finish_request(request_id)
+                    if not future.done():
+                        future.set_result(response)
+        finally:
+            error = RuntimeError(f"Unity session for {self.project_path} exited unexpectedly")
+            if not self._ready.done():
+                self._ready.set_exception(error)
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+            for stream in self._streams.values():
+                stream.put_nowait(error)
+            # Nothing is queued behind a dead session any more
+            for started in self._started.values():
+                started.set()
+    
+    async def _send(self, message: Dict[str, Any]):
+        async with self._write_lock:
+            self._writer.write(self._encode_message(message))
+            await self._writer.drain()
+    
+    async def request(self, command_data: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one command and wait for the response carrying its id
+        
+        timeout runs from when Unity reaches the command, not from when it
+        was queued behind earlier requests. On timeout only this request is
+        given up; the session keeps serving the others.
+        """
+        if not self.alive:
+            raise RuntimeError(f"Unity session for {self.project_path} is not running")
+        
+        request_id, started = self._open_request()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._mark_started()
+        
+        try:
+            await self._send(dict(command_data, Id=request_id))
+            await started.wait()
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._finish_request(request_id)
+    
+    async def stream(self, command_data: Dict[str, Any], timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """Send one command and yield its partial responses, then the final one
+        
+        timeout bounds the wait for each message rather than the whole stream.
+        """
+        if not self.alive:
+            raise RuntimeError(f"Unity session for {self.project_path} is not running")
+        
+        request_id, started = self._open_request()
+        queue: asyncio.Queue = asyncio.Queue()
+        self._streams[request_id] = queue
+        self._mark_started()
+        
+        try:
+            await self._send(dict(command_data, Id=request_id, Stream=True))
+            await started.wait()
             
-            return new MCPResult
-            {
-                Success = true,
-                Data = new { files = fileList, count = fileList.Count }
-            };
-        }
+            while True:
+                response = await asyncio.wait_for(queue.get(), timeout=timeout)
+                if isinstance(response, Exception):
+                    raise response
+                yield response
+                if not response.get("Partial"):
+                    return
+        finally:
+            self._finish_request(request_id)
+
+
+class _ProcessSession(_UnitySession):
+    """Batch-mode Unity Editor process owned by the server, spoken to over stdio
+    
+    The editor is started once per project and kept running, so the cost of
+    launching Unity and loading the project is paid on the first command only.
+    Messages are newline-delimited JSON, or JSON prefixed with a 4-byte
+    big-endian length when config.unity_wire_format is "framed".
+    """
+    
+    def __init__(self, project_path: str, argv_prefix: Tuple[str, ...]):
+        super().__init__(project_path)
+        self.argv_prefix = argv_prefix
+        self.framed = config.unity_wire_format == "framed"
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+    
+    async def start(self):
+        """Launch Unity in batch mode running the MCPBridge command loop and
+        wait until the bridge reports it is ready for commands"""
+        self.log_path = Path(self.project_path) / SESSION_LOG_DIR / f"session_{os.getpid()}.log"
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        private static MCPResult RunBuild(Dictionary<string, object> parameters)
-        {
-            // Implementation for build operations
-            return new MCPResult { Success = true, Data = "Build completed" };
-        }
+        self.process = await asyncio.create_subprocess_exec(
+            *self.argv_prefix,
+            "-projectPath", self.project_path,
+            "-logFile", str(self.log_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.project_path,
+            limit=STREAM_LIMIT
+        )
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+        logger.info("Starting Unity session for %s (pid %s)", self.project_path, self.process.pid)
         
-        private static MCPResult RunTests(Dictionary<string, object> parameters)
-        {
-            // Implementation for test operations
-            return new MCPResult { Success = true, Data = "Tests completed" };
-        }
+        try:
+            await self._attach(self.process.stdout, self.process.stdin, config.unity_startup_timeout)
+        except Exception:
+            self.process.kill()
+            raise
+    
+    async def _drain_stderr(self):
+        """Forward Unity's stderr to the debug log as it arrives, so the pipe
+        never fills up and stalls the editor"""
+        async for line in self.process.stderr:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unity[%s]: %s", self.process.pid, line.decode(errors="replace").rstrip())
+    
+    async def close(self):
+        """Ask Unity to exit, terminating it if it does not"""
+        if not self.alive:
+            return
         
-        private static MCPResult ValidateScene(Dictionary<string, object> parameters)
-        {
-            // Implementation for scene validation
-            return new MCPResult { Success = true, Data = "Scene validated" };
-        }
+        try:
+            self.process.stdin.write(self._encode_message({"Action": "shutdown"}))
+            await self.process.stdin.drain()
+            self.process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
         
-        private static MCPResult AuditAssets(Dictionary<string, object> parameters)
-        {
-            // Implementation for asset auditing
-            return new MCPResult { Success = true, Data = "Assets audited" };
-        }
-    }
-    
-    [Serializable]
-    public class MCPCommand
-    {
-        public string Action { get; set; }
-        public Dictionary<string, object> Parameters { get; set; }
-    }
-    
-    [Serializable]
-    public class MCPResult
-    {
-        public bool Success { get; set; }
-        public string Error { get; set; }
-        public object Data { get; set; }
-    }
-}
-'''
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=SESSION_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                self.process.kill()
+        
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+
+
+class _EditorSocketSession(_UnitySession):
+    """Loopback TCP connection to an interactive Unity Editor
+    
+    The editor's MCPSocketServer publishes its port in Temp/mcp_port and runs
+    commands on its main thread. Closing the session only drops the
+    connection; the editor keeps running.
+    """
+    
+    def __init__(self, project_path: str, port: int):
+        super().__init__(project_path)
+        self.port = port
+    
+    async def start(self):
+        """Connect to the editor; raises OSError if nothing is listening"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port, limit=STREAM_LIMIT)
+        logger.info("Connecting to Unity Editor for %s on port %s", self.project_path, self.port)
+        
+        try:
+            await self._attach(reader, writer, EDITOR_HANDSHAKE_TIMEOUT)
+        except Exception:
+            writer.close()
+            raise
+    
+    async def close(self):
+        """Disconnect from the editor"""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+
+
+def _read_editor_port(project_path: str) -> Optional[int]:
+    """Port published by a running editor's MCPSocketServer, if any"""
+    try:
+        return int((Path(project_path) / EDITOR_PORT_FILE).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _unity_argv_prefix() -> Tuple[str, ...]:
+    """Batch-mode Unity arguments shared by every session"""
+    return (
+        config.get_unity_editor_path(),
+        "-batchmode",
+        "-executeMethod", "UnityMCP.MCPBridge.Serve",
+        "-mcpWireFormat", config.unity_wire_format,
+    )
+
+
+async def _open_session(project_path: str, argv_prefix: Tuple[str, ...]) -> _UnitySession:
+    """Connect to the project's open editor if there is one, otherwise start a
+    batch-mode editor"""
+    port = _read_editor_port(project_path)
+    if port is not None:
+        session = _EditorSocketSession(project_path, port)
+        try:
+            await session.start()
+            return session
+        except OSError as e:
+            logger.info("No Unity Editor reachable on port %s (%s), starting batch mode", port, e)
+    
+    session = _ProcessSession(project_path, argv_prefix)
+    await session.start()
+    return session
+
+
+class UnityConnectionPool:
+    """Unity sessions keyed by project path, capped at max_size
+    
+    Sessions stay open between tool calls. When a new project would exceed the
+    cap, the least recently used idle session is shut down.
+    """
+    
+    def __init__(self, max_size: int, argv_prefix: Tuple[str, ...]):
+        self.max_size = max_size
+        self.argv_prefix = argv_prefix
+        self._sessions: "OrderedDict[str, _UnitySession]" = OrderedDict()
+        self._startups: Dict[str, asyncio.Task] = {}
+        # Consecutive startup failures and when the last one happened, by project
+        self._failures: Dict[str, Tuple[int, float]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    async def acquire(self, project_path: str) -> _UnitySession:
+        """Return the ready session for a project, connecting if needed
+        
+        Concurrent callers share a single connection attempt.
+        """
+        session = self._sessions.get(project_path)
+        if session is not None and session.alive:
+            self._sessions.move_to_end(project_path)
+            return session
+        
+        startup = self._startups.get(project_path)
+        if startup is None:
+            startup = asyncio.create_task(self._start_session(project_path))
+            self._startups[project_path] = startup
+            startup.add_done_callback(lambda _: self._startups.pop(project_path, None))
+        
+        session = await asyncio.shield(startup)
+        if self._sessions.get(project_path) is not session:
+            self._sessions[project_path] = session
+            self._sessions.move_to_end(project_path)
+            await self._evict(keep=project_path)
+        return session
+    
+    async def _start_session(self, project_path: str) -> _UnitySession:
+        """Open a session, first backing off if recent attempts failed"""
+        failures, failed_at = self._failures.get(project_path, (0, 0.0))
+        if failures:
+            delay = min(SESSION_RETRY_MAX_DELAY, SESSION_RETRY_BASE_DELAY * 2 ** (failures - 1))
+            remaining = failed_at + delay - time.monotonic()
+            if remaining > 0:
+                logger.info("Retrying Unity session for %s in %.1fs", project_path, remaining)
+                await asyncio.sleep(remaining)
+        
+        try:
+            session = await _open_session(project_path, self.argv_prefix)
+        except Exception:
+            self._failures[project_path] = (failures + 1, time.monotonic())
+            raise
+        self._failures.pop(project_path, None)
+        return session
+    
+    async def _evict(self, keep: str):
+        """Close least recently used idle sessions, other than keep's, until
+        within max_size"""
+        while len(self._sessions) > self.max_size:
+            idle = next(
+                (path for path, session in self._sessions.items() if path != keep and not session.busy),
+                None
+            )
+            if idle is None:
+                # Everything is mid-request; shrink on a later acquire
+                return
+            logger.info("Closing least recently used Unity session: %s", idle)
+            await self.discard(idle)
+    
+    async def discard(self, project_path: str):
+        """Shut down and forget a project's session"""
+        session = self._sessions.pop(project_path, None)
+        if session is not None:
+            await session.close()
+    
+    async def close_all(self):
+        """Shut down every session at once, so shutdown takes as long as the
+        slowest session rather than the sum of them"""
+        sessions = list(self._sessions.items())
+        self._sessions.clear()
+        await asyncio.gather(*(
+            self._close_one(project_path, session) for project_path, session in sessions
+        ))
+    
+    @staticmethod
+    async def _close_one(project_path: str, session: _UnitySession):
+        try:
+            await session.close()
+            logger.info("Closed Unity session: %s", project_path)
+        except Exception as e:
+            logger.error("Error closing Unity session %s: %s", project_path, e)
+
+
+class UnityManager:
+    """Manages Unity Editor processes and operations"""
+    
+    def __init__(self):
+        # Recent operations, oldest first, capped at OPERATION_HISTORY_SIZE
+        self.active_operations: "OrderedDict[str, UnityOperation]" = OrderedDict()
+        self._in_flight: Set[str] = set()
+        self.sessions = UnityConnectionPool(config.max_unity_sessions, _unity_argv_prefix())
+        self.bridge_script_path = self._create_bridge_script()
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._pending_batches: Dict[str, List[Tuple[str, Dict[str, Any], int, asyncio.Future]]] = {}
+        # Futures of READ_ONLY_ACTIONS commands from queueing until they complete, by cache key
+        self._in_flight_reads: Dict[Tuple[str, str, bytes], asyncio.Future] = {}
+        self._batch_tasks: set = set()
+        # Each project sends at most config.unity_workers flushed batches at once
+        self._dispatch_slots: Dict[str, asyncio.Semaphore] = {}
+        self._result_cache: Dict[Tuple[str, str, bytes], Tuple[float, Dict[str, Any]]] = {}
+    
+    def _create_bridge_script(self) -> str:
+        """Materialize the Unity Bridge C# script in the temp directory
+        
+        The file name carries a hash of the source, so an existing copy from
+        an earlier run is reused as long as the bridge has not changed.
+        """
+        bridge_content = BRIDGE_SOURCE_PATH.read_bytes()
+        digest = hashlib.blake2b(bridge_content).hexdigest()[:16]
+        bridge_path = Path(tempfile.gettempdir()) / f"unity_mcp_bridge_{digest}.cs"
         
-        # Create temporary bridge script
-        bridge_path = Path(tempfile.gettempdir()) / "unity_mcp_bridge.cs"
-        bridge_path.write_text(bridge_content)
+        try:
+            up_to_date = bridge_path.stat().st_size == len(bridge_content)
+        except FileNotFoundError:
+            up_to_date = False
+        if not up_to_date:
+            bridge_path.write_bytes(bridge_content)
         return str(bridge_path)
     
-    async def execute_unity_command(
+    async def _send_command(
         self,
         action: str,
         project_path: str,
         parameters: Dict[str, Any],
         timeout: int = 300
     ) -> Dict[str, Any]:
-        """Execute Unity command via batch mode"""
+        """Send one command straight to the project's persistent Unity session"""
         
-        operation_id = f"{action}_{datetime.now().timestamp()}"
+        operation_id = f"{action}_{_OPERATION_EPOCH}_{next(_operation_counter)}"
         operation = UnityOperation(
             id=operation_id,
             command=action,
@@ -196,72 +648,46 @@ namespace UnityMCP
         )
         
         self.active_operations[operation_id] = operation
+        self._in_flight.add(operation_id)
+        session = None
         
         try:
             # Validate project path
             if not config.validate_unity_project_path(project_path):
                 raise ValueError(f"Invalid Unity project path: {project_path}")
             
-            # Prepare Unity command
-            unity_cmd = [
-                config.get_unity_editor_path(),
-                "-batchmode",
-                "-quit",
-                "-projectPath", project_path,
-                "-logFile", config.unity_log_file,
-                "-executeMethod", "UnityMCP.MCPBridge.ExecuteCommand"
-            ]
-            
             # Prepare command data
-            command_data = {
-                "Action": action,
-                "Parameters": parameters
-            }
+            command_data = _encode_command(action, parameters)
             
             logger.info(f"Executing Unity command: {action} for project: {project_path}")
             
-            # Execute Unity process
-            process = await asyncio.create_subprocess_exec(
-                *unity_cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=project_path
-            )
-            
-            # Send command data to Unity
-            input_data = json.dumps(command_data).encode()
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(input_data),
-                timeout=timeout
-            )
+            # Send the command to the project's Unity session
+            session = await self.sessions.acquire(project_path)
+            log_offset = _log_size(session.log_path)
+            result = await session.request(command_data, timeout)
             
-            # Parse result
-            if process.returncode == 0:
+            operation.status = "completed"
+            operation.result = result
+            # Pipelined commands share the session log, so the tail may also
+            # hold lines from operations that overlapped this one
+            if _log_size(session.log_path) > log_offset:
                 try:
-                    result = json.loads(stdout.decode())
-                    operation.status = "completed"
-                    operation.result = result
-                    operation.end_time = datetime.now()
-                    
-                    logger.info(f"Unity command completed: {action}")
-                    return result
-                    
-                except json.JSONDecodeError as e:
-                    error_msg = f"Failed to parse Unity output: {e}"
-                    operation.status = "failed"
-                    operation.error = error_msg
-                    raise ValueError(error_msg)
-            else:
-                error_msg = f"Unity process failed with code {process.returncode}: {stderr.decode()}"
-                operation.status = "failed"
-                operation.error = error_msg
-                raise RuntimeError(error_msg)
+                    operation.log_tail = await asyncio.to_thread(_read_log_tail, session.log_path, log_offset)
+                except OSError as e:
+                    logger.debug("Could not read Unity log %s: %s", session.log_path, e)
+            operation.end_time = datetime.now()
+            
+            logger.info(f"Unity command completed: {action}")
+            return result
                 
         except asyncio.TimeoutError:
             error_msg = f"Unity command timed out after {timeout} seconds"
             operation.status = "failed"
             operation.error = error_msg
+            # Only this command is given up. An editor stuck with nothing
+            # else outstanding would block every later command, so restart it.
+            if session is not None and not session.busy:
+                await self.sessions.discard(project_path)
             raise TimeoutError(error_msg)
             
         except Exception as e:
@@ -272,6 +698,235 @@ namespace UnityMCP
         
         finally:
             operation.end_time = datetime.now()
+            self._in_flight.discard(operation_id)
+            self._trim_history()
+    
+    def _trim_history(self):
+        """Forget the oldest finished operations beyond OPERATION_HISTORY_SIZE"""
+        excess = len(self.active_operations) - OPERATION_HISTORY_SIZE
+        for operation_id in list(itertools.islice(self.active_operations, excess if excess > 0 else 0)):
+            if operation_id not in self._in_flight:
+                del self.active_operations[operation_id]
+    
+    async def stream_unity_command(
+        self,
+        action: str,
+        project_path: str,
+        parameters: Dict[str, Any],
+        timeout: int = 300
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Execute Unity command, yielding partial results as Unity sends them
+        
+        Each partial message has "Partial": true; the last message yielded is
+        the final result. Streamed commands are never batched.
+        """
+        if not config.validate_unity_project_path(project_path):
+            raise ValueError(f"Invalid Unity project path: {project_path}")
+        
+        logger.info("Streaming Unity command: %s for project: %s", action, project_path)
+        session = await self.sessions.acquire(project_path)
+        try:
+            async for message in session.stream(_encode_command(action, parameters), timeout):
+                yield message
+        except asyncio.TimeoutError:
+            if not session.busy:
+                await self.sessions.discard(project_path)
+            raise TimeoutError(f"Unity command timed out after {timeout} seconds")
+    
+    async def execute_unity_commands_batch(
+        self,
+        project_path: str,
+        commands: List[Tuple[str, Dict[str, Any]]],
+        timeout: int = 300
+    ) -> List[Dict[str, Any]]:
+        """Execute several (action, parameters) commands in one Unity invocation
+        
+        Results are matched back to commands by id and returned in order.
+        Explicit batches bypass the coalescing queue.
+        """
+        batch = []
+        for command_id, (action, parameters) in enumerate(commands):
+            command = _encode_command(action, parameters)
+            command["Id"] = command_id
+            batch.append(command)
+        
+        result = await self._send_command(
+            action="batch",
+            project_path=project_path,
+            parameters={"commands": batch},
+            timeout=timeout
+        )
+        if any(action not in READ_ONLY_ACTIONS for action, _ in commands):
+            self._invalidate_results(project_path)
+        
+        responses = {item.get("Id"): item for item in result.get("Data") or []}
+        return [
+            responses.get(command_id, {"Success": False, "Error": "No result returned for batched command"})
+            for command_id in range(len(commands))
+        ]
+    
+    async def execute_unity_command(
+        self,
+        action: str,
+        project_path: str,
+        parameters: Dict[str, Any],
+        timeout: int = 300
+    ) -> Dict[str, Any]:
+        """Execute Unity command, coalescing it with other commands issued for
+        the same project within config.batch_window_ms (up to
+        config.max_batch_size at a time) into one batch invocation
+        
+        Successful results of IDEMPOTENT_ACTIONS are reused for identical
+        calls made within RESULT_CACHE_TTL_SECONDS, and those of
+        READ_ONLY_ACTIONS within READ_RESULT_CACHE_TTL_SECONDS, unless another
+        non-read action has since completed for the project. An identical
+        READ_ONLY_ACTIONS call that is queued or running is not sent twice;
+        both callers share its result, unless another action was queued for
+        the project in between. Writes are never merged this way, since an
+        A, B, A sequence must reach Unity in full.
+        """
+        cache_key = None
+        read_only = action in READ_ONLY_ACTIONS
+        if read_only or action in IDEMPOTENT_ACTIONS:
+            cache_key = (project_path, action, orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS))
+            cached = self._result_cache.get(cache_key)
+            if cached is not None and time.monotonic() < cached[0]:
+                logger.debug("Reusing cached result for %s", action)
+                return cached[1]
+        
+        if read_only:
+            running = self._in_flight_reads.get(cache_key)
+            if running is not None:
+                logger.debug("Sharing in-flight %s with an identical call", action)
+                return await asyncio.shield(running)
+        else:
+            # Reads queued from here on must not join ones queued before this
+            self._stop_sharing_reads(project_path)
+        
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending_batches.get(project_path)
+        if pending is None:
+            pending = self._pending_batches[project_path] = []
+            self._spawn_batch_task(self._flush_batch_after_window(project_path, pending))
+        pending.append((action, parameters, timeout, future))
+        if read_only:
+            self._in_flight_reads[cache_key] = future
+            future.add_done_callback(lambda _: self._forget_in_flight_read(cache_key, future))
+        
+        # A full batch goes out without waiting for the window to close
+        if len(pending) >= config.max_batch_size:
+            self._take_pending_batch(project_path)
+            self._submit_batch(project_path, pending)
+        
+        result = await asyncio.shield(future)
+        
+        if not read_only:
+            self._invalidate_results(project_path)
+        if cache_key is not None and result.get("Success"):
+            ttl = READ_RESULT_CACHE_TTL_SECONDS if read_only else RESULT_CACHE_TTL_SECONDS
+            self._cache_result(cache_key, result, ttl)
+        return result
+    
+    def _cache_result(self, key: Tuple[str, str, bytes], result: Dict[str, Any], ttl: float):
+        """Store a result, dropping expired entries once the cache fills up"""
+        now = time.monotonic()
+        if len(self._result_cache) >= RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache = {
+                cached_key: entry for cached_key, entry in self._result_cache.items()
+                if now < entry[0]
+            }
+            # Still full of live entries: drop the oldest
+            if len(self._result_cache) >= RESULT_CACHE_MAX_ENTRIES:
+                del self._result_cache[next(iter(self._result_cache))]
+        self._result_cache[key] = (now + ttl, result)
+    
+    def _forget_in_flight_read(self, key: Tuple[str, str, bytes], future: asyncio.Future):
+        # Invalidation may already have let a newer call take the key
+        if self._in_flight_reads.get(key) is future:
+            del self._in_flight_reads[key]
+    
+    def _invalidate_results(self, project_path: str):
+        """Forget cached results for a project that may have changed
+        
+        This includes cached idempotent writes: after A, B, A the second A
+        must reach Unity again. Reads still running are no longer shared with
+        later callers either, since they may have started before the change.
+        """
+        stale = [key for key in self._result_cache if key[0] == project_path]
+        for key in stale:
+            del self._result_cache[key]
+        self._stop_sharing_reads(project_path)
+    
+    def _stop_sharing_reads(self, project_path: str):
+        """Let later identical reads for a project start fresh instead of
+        joining those already queued or running"""
+        running = [key for key in self._in_flight_reads if key[0] == project_path]
+        for key in running:
+            del self._in_flight_reads[key]
+    
+    def _spawn_batch_task(self, coroutine):
+        task = asyncio.create_task(coroutine)
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _flush_batch_after_window(self, project_path: str, pending: List[Tuple[str, Dict[str, Any], int, asyncio.Future]]):
+        """Send a project's queued commands once the batch window closes,
+        unless the batch already filled up and was sent"""
+        await asyncio.sleep(config.batch_window_ms / 1000)
+        if self._pending_batches.get(project_path) is pending:
+            self._take_pending_batch(project_path)
+            self._submit_batch(project_path, pending)
+    
+    def _take_pending_batch(self, project_path: str):
+        """Close a project's pending batch to new commands"""
+        del self._pending_batches[project_path]
+    
+    def _submit_batch(self, project_path: str, pending: List[Tuple[str, Dict[str, Any], int, asyncio.Future]]):
+        """Dispatch a flushed batch in its own task"""
+        self._spawn_batch_task(self._dispatch_batch(project_path, pending))
+    
+    async def _dispatch_batch(self, project_path: str, pending: List[Tuple[str, Dict[str, Any], int, asyncio.Future]]):
+        """Send a batch once one of its project's dispatch slots is free
+        
+        Slots are per project, so long builds or test runs in one project
+        never hold up commands for another.
+        """
+        slots = self._dispatch_slots.get(project_path)
+        if slots is None:
+            slots = self._dispatch_slots[project_path] = asyncio.Semaphore(max(1, config.unity_workers))
+        try:
+            async with slots:
+                await self._send_batch(project_path, pending)
+        except asyncio.CancelledError:
+            _fail_batch(pending, RuntimeError("Unity manager is shutting down"))
+            raise
+    
+    async def _send_batch(self, project_path: str, pending: List[Tuple[str, Dict[str, Any], int, asyncio.Future]]):
+        """Send queued commands to Unity and resolve their futures"""
+        try:
+            if len(pending) == 1:
+                action, parameters, timeout, _ = pending[0]
+                results = [await self._send_command(action, project_path, parameters, timeout)]
+            else:
+                results = await self.execute_unity_commands_batch(
+                    project_path,
+                    [(action, parameters) for action, parameters, _, _ in pending],
+                    timeout=max(timeout for _, _, timeout, _ in pending)
+                )
+        except Exception as e:
+            _fail_batch(pending, e)
+            return
+        
+        for (*_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def run_cpu_bound(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run CPU-heavy pre-processing in a worker process off the event loop"""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, func, *args)
     
     async def get_unity_project_info(self, project_path: str) -> Dict[str, Any]:
         """Get Unity project information"""
@@ -298,24 +953,25 @@ namespace UnityMCP
         """Cleanup Unity processes and resources"""
         logger.info("Cleaning up Unity processes...")
         
-        # Terminate active Unity processes
-        for process_id, process in self.unity_processes.items():
-            try:
-                if process.poll() is None:  # Process is still running
-                    process.terminate()
-                    await asyncio.sleep(1)
-                    if process.poll() is None:
-                        process.kill()
-                    logger.info(f"Terminated Unity process: {process_id}")
-            except Exception as e:
-                logger.error(f"Error terminating Unity process {process_id}: {e}")
-        
-        self.unity_processes.clear()
+        # Stop dispatching and fail batches that have not been answered
+        for pending in self._pending_batches.values():
+            _fail_batch(pending, RuntimeError("Unity manager is shutting down"))
+        self._pending_batches.clear()
+        batch_tasks = list(self._batch_tasks)
+        for task in batch_tasks:
+            task.cancel()
+        await asyncio.gather(*batch_tasks, return_exceptions=True)
+        self._dispatch_slots.clear()
+        
+        # Shut down persistent Unity sessions
+        await self.sessions.close_all()
         self.active_operations.clear()
+        self._in_flight.clear()
+        self._in_flight_reads.clear()
         
-        # Clean up bridge script
-        try:
-            if os.path.exists(self.bridge_script_path):
-                os.remove(self.bridge_script_path)
-        except Exception as e:
-            logger.error(f"Error removing bridge script: {e}")
\ No newline at end of file
+        # Shut down the pre-processing worker pool
+        if self._cpu_pool is not None:
+            try:
+                self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            finally:
+                self._cpu_pool = None